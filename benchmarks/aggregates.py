@@ -0,0 +1,97 @@
+# -*- coding:utf-8 -*-
+"""주기별 조회 지연 비교 (원본 1분봉 time_bucket 집계 vs 연속 집계 뷰)
+
+.env 의 DB_* 접속 정보로 TimescaleDB 에 합성 1분봉 하이퍼테이블을 만들고, migration 으로
+연속 집계를 만들기 전/후 `search_db_data`와 같은 조회 경로(`_fetch`)의 시간을 잽니다.
+
+Example:
+    $ docker compose up -d db
+    $ python -m benchmarks.aggregates --rows=3000000
+"""
+import time
+
+import fire
+
+from benchmarks.loader import connect
+from trading.utils.loader import AGGREGATE_INTERVALS, _fetch, aggregate_name
+from trading.utils.migration import (
+    create_continuous_aggregates,
+    create_table_if_not_exists,
+    refresh_continuous_aggregates,
+)
+
+TABLE_NAME = "BENCH-CAGG"
+
+
+def drop(conn):
+    with conn.cursor() as cur:
+        for interval in AGGREGATE_INTERVALS:
+            view_name = aggregate_name(TABLE_NAME, interval)
+            cur.execute(f'DROP MATERIALIZED VIEW IF EXISTS "{view_name}"')
+        cur.execute(f'DROP TABLE IF EXISTS "{TABLE_NAME}"')
+    conn.commit()
+
+
+def prepare(conn, rows: int):
+    drop(conn)
+    create_table_if_not_exists(conn, TABLE_NAME)
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
+            INSERT INTO "{TABLE_NAME}"
+            SELECT
+                TIMESTAMP '2020-01-01' + i * INTERVAL '1 minute',
+                round((50000000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((50010000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((49990000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((50000000 + 1000 * cos(i / 100.0))::numeric, 1),
+                (i %% 1000) / 10.0
+            FROM generate_series(0, %s - 1) AS i
+            """,
+            (rows,),
+        )
+        cur.execute(f'ANALYZE "{TABLE_NAME}"')
+    conn.commit()
+
+
+def measure(conn, interval: str, start_date: str, end_date: str, repeat: int):
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        df = _fetch(conn, start_date, end_date, interval, TABLE_NAME)
+        elapsed.append(time.perf_counter() - t0)
+    return min(elapsed), df
+
+
+def run(
+    rows: int = 3_000_000,
+    start_date: str = "2021-01-01",
+    end_date: str = "2021-12-31",
+    repeat: int = 3,
+    keep: bool = False,
+):
+    conn = connect()
+    try:
+        prepare(conn, rows)
+        raw = {
+            interval: measure(conn, interval, start_date, end_date, repeat)
+            for interval in AGGREGATE_INTERVALS
+        }
+        create_continuous_aggregates(conn, TABLE_NAME)
+        refresh_continuous_aggregates(conn, TABLE_NAME)
+        print(f"{'interval':>8} | {'rows':>7} | {'raw (s)':>8} | {'cagg (s)':>8} | {'speedup':>7}")
+        for interval in AGGREGATE_INTERVALS:
+            raw_time, expected = raw[interval]
+            cagg_time, result = measure(conn, interval, start_date, end_date, repeat)
+            assert result.equals(expected), interval
+            print(
+                f"{interval:>8} | {len(result):>7} | {raw_time:>8.3f} | {cagg_time:>8.3f} | {raw_time / cagg_time:>6.1f}x"
+            )
+        if not keep:
+            drop(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,59 @@
+# -*- coding:utf-8 -*-
+"""Engine.run 한 bar 당 주문/계좌 관리 비용 벤치마크
+
+차트 순회와 전략 계산은 빼고, bar 마다 반복되는 Broker/Account/Position/Order 호출만
+Engine.run 과 같은 순서로 실행합니다. `trade_every` bar 마다 매수/매도 주문을 번갈아 냅니다.
+
+Example:
+    $ python -m benchmarks.bookkeeping
+    $ python -m benchmarks.bookkeeping --bars=1000000 --tickers=10
+"""
+import time
+
+import fire
+import numpy as np
+
+from trading.account import Account
+from trading.broker import Broker
+from trading.module import Order
+
+
+def run(bars: int = 200_000, tickers: int = 1, trade_every: int = 50, repeat: int = 3):
+    rng = np.random.default_rng(0)
+    closes = (50_000 * np.exp(np.cumsum(rng.normal(0, 0.001, bars)))).tolist()
+    names = [f"KRW-BENCH{i}" for i in range(tickers)]
+
+    elapsed = []
+    for _ in range(repeat):
+        account = Account(balance=1_000_000_000.0)
+        broker = Broker(account, {"slippage": 0.01, "fee": 0.0005})
+        for ticker_name in names:
+            account.track(ticker_name)
+        t0 = time.perf_counter()
+        for i, close in enumerate(closes):
+            ticker_name = names[i % tickers]
+            data = {"close": close}
+            broker.execute_orders(data, ticker_name)
+            account.update_price(close, ticker_name)
+            state = (
+                account.has_position(ticker_name),
+                account.balance,
+                account.get_count(ticker_name),
+                broker.fee,
+                broker.slippage,
+            )
+            if i % trade_every == 0:
+                if state[0]:
+                    order = Order("sell", state[2], close, ticker_name)
+                else:
+                    order = Order("buy", 1, close, ticker_name)
+                broker.place_order([order])
+            account.info()
+        elapsed.append(time.perf_counter() - t0)
+
+    print(f"{'bars':>10} | {'tickers':>7} | {'us/bar':>8}")
+    print(f"{bars:>10} | {tickers:>7} | {min(elapsed) / bars * 1e6:>8.3f}")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
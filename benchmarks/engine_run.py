@@ -0,0 +1,62 @@
+# -*- coding:utf-8 -*-
+"""Engine.run bar 당 실행 시간과 GC 발생 횟수 측정
+
+Example:
+    $ python -m benchmarks.engine_run
+    $ python -m benchmarks.engine_run --bars=1000000 --tickers=10
+"""
+import gc
+import time
+
+import fire
+
+from benchmarks.vectorized import make_chart
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+
+
+def run(
+    bars: int = 200_000,
+    tickers: int = 1,
+    short_ma: int = 60,
+    long_ma: int = 240,
+    repeat: int = 5,
+):
+    if tickers > 1:
+        chart_data = {
+            f"KRW-BENCH{i}": make_chart(bars // tickers, seed=i) for i in range(tickers)
+        }
+    else:
+        chart_data = make_chart(bars)
+
+    # 세대별 GC 실행 횟수(전체 반복 합계)
+    collections = [0, 0, 0]
+
+    def count(phase, info):
+        if phase == "start":
+            collections[info["generation"]] += 1
+
+    elapsed = []
+    for _ in range(repeat):
+        engine = Engine(
+            TestStrategy,
+            chart_data,
+            {"short_ma": short_ma, "long_ma": long_ma},
+            {"slippage": 0.01, "fee": 0.0005},
+            1000000.0 * tickers,
+        )
+        gc.callbacks.append(count)
+        t0 = time.perf_counter()
+        engine.run(ticker_name="KRW-BTC")
+        elapsed.append(time.perf_counter() - t0)
+        gc.callbacks.remove(count)
+    elapsed = min(elapsed)
+
+    print(f"{'bars':>10} | {'tickers':>7} | {'us/bar':>8} | {'gc (gen0/1/2)':>15}")
+    print(
+        f"{bars:>10} | {tickers:>7} | {elapsed / bars * 1e6:>8.3f} | {'/'.join(map(str, collections)):>15}"
+    )
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,195 @@
+# -*- coding:utf-8 -*-
+"""search_db_data 조회 쿼리 실행 계획 점검 (DATE(date) BETWEEN vs 반열린 구간)
+
+.env 의 DB_* 접속 정보로 합성 1분봉 테이블을 만든 뒤 EXPLAIN 결과를 비교합니다.
+TimescaleDB 이면 조회 기간과 겹치는 chunk 만 읽는지(chunk exclusion), 일반 Postgres 이면
+date 인덱스를 쓰는지 확인하고 아니면 AssertionError 를 냅니다.
+
+Example:
+    $ docker compose up -d db
+    $ python -m benchmarks.explain
+    $ python -m benchmarks.explain --start_date=2021-03-01 --end_date=2021-03-31
+"""
+import time
+
+import fire
+from psycopg2 import sql
+
+from benchmarks.loader import connect
+from trading.utils.loader import (
+    _fetch,
+    build_query,
+    explain,
+    query_params,
+    scanned_relations,
+)
+
+TABLE_NAME = "BENCH-EXPLAIN"
+INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Heap Scan")
+
+# 기존 조회 쿼리(컬럼을 DATE()로 감싸서 인덱스와 chunk 제외를 쓰지 못함)
+LEGACY_QUERY = sql.SQL(
+    """
+    SELECT date as Date, open, high, low, close, volume
+    FROM {table}
+    WHERE DATE(date) BETWEEN %(start_date)s AND %(end_date)s
+    ORDER BY date
+    """
+)
+
+
+def is_timescale(conn) -> bool:
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+        return cur.fetchone() is not None
+
+
+def prepare(conn, rows: int, timescale: bool):
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(TABLE_NAME))
+        )
+        cur.execute(
+            sql.SQL(
+                """
+                CREATE TABLE {} (
+                    date TIMESTAMP NOT NULL,
+                    open NUMERIC,
+                    high NUMERIC,
+                    low NUMERIC,
+                    close NUMERIC,
+                    volume REAL,
+                    PRIMARY KEY (date)
+                )
+                """
+            ).format(sql.Identifier(TABLE_NAME))
+        )
+        if timescale:
+            # migration 과 같은 설정(기본 chunk 간격 7일)
+            cur.execute(
+                "SELECT create_hypertable(%s, 'date', create_default_indexes => FALSE)",
+                (sql.Identifier(TABLE_NAME).as_string(conn),),
+            )
+        cur.execute(
+            sql.SQL(
+                """
+                INSERT INTO {}
+                SELECT
+                    TIMESTAMP '2020-01-01' + i * INTERVAL '1 minute',
+                    50000000 + 1000 * sin(i / 100.0),
+                    50010000 + 1000 * sin(i / 100.0),
+                    49990000 + 1000 * sin(i / 100.0),
+                    50000000 + 1000 * cos(i / 100.0),
+                    (i %% 1000) / 10.0
+                FROM generate_series(0, %s - 1) AS i
+                """
+            ).format(sql.Identifier(TABLE_NAME)),
+            (rows,),
+        )
+        cur.execute(sql.SQL("ANALYZE {}").format(sql.Identifier(TABLE_NAME)))
+    conn.commit()
+
+
+def legacy_plan(conn, start_date: str, end_date: str):
+    query = LEGACY_QUERY.format(table=sql.Identifier(TABLE_NAME))
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("EXPLAIN (FORMAT JSON) {}").format(query),
+            {"start_date": start_date, "end_date": end_date},
+        )
+        return cur.fetchone()[0][0]["Plan"]
+
+
+def overlapping_chunks(conn, start_date: str, end_date: str) -> int:
+    params = query_params(start_date, end_date, "1min")
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT count(*) FROM timescaledb_information.chunks
+            WHERE hypertable_name = %s AND range_end > %s AND range_start < %s
+            """,
+            (TABLE_NAME, params["start"], params["end"]),
+        )
+        return cur.fetchone()[0]
+
+
+def scan_types(plan) -> list:
+    types = [plan["Node Type"]] if "Relation Name" in plan else []
+    for child in plan.get("Plans", []):
+        types.extend(scan_types(child))
+    return types
+
+
+def timed(func, repeat: int = 3) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - t0)
+    return min(elapsed)
+
+
+def run(
+    rows: int = 3_000_000,
+    start_date: str = "2021-03-01",
+    end_date: str = "2021-03-31",
+    keep: bool = False,
+):
+    conn = connect()
+    try:
+        timescale = is_timescale(conn)
+        prepare(conn, rows, timescale)
+
+        legacy = legacy_plan(conn, start_date, end_date)
+        plan = explain(conn, start_date, end_date, "1min", TABLE_NAME)
+        print(f"legacy : {scan_types(legacy)} ({len(scanned_relations(legacy))} relations)")
+        print(f"current: {scan_types(plan)} ({len(scanned_relations(plan))} relations)")
+
+        if timescale:
+            expected = overlapping_chunks(conn, start_date, end_date)
+            scanned = len(scanned_relations(plan))
+            print(f"chunks : {scanned} scanned, {expected} overlapping")
+            assert scanned <= expected, "chunk exclusion 이 적용되지 않았습니다."
+        else:
+            assert all(
+                t in INDEX_SCANS for t in scan_types(plan)
+            ), "date 인덱스를 사용하지 않습니다."
+
+        # 두 쿼리의 결과가 같은지, 조회 시간이 얼마나 차이 나는지 확인
+        query = LEGACY_QUERY.format(table=sql.Identifier(TABLE_NAME))
+        with conn.cursor() as cur:
+            cur.execute(query, {"start_date": start_date, "end_date": end_date})
+            expected_rows = cur.fetchall()
+        df = _fetch(conn, start_date, end_date, "1min", TABLE_NAME)
+        assert len(df) == len(expected_rows), "조회 결과가 다릅니다."
+
+        def fetch_legacy():
+            with conn.cursor() as cur:
+                cur.execute(query, {"start_date": start_date, "end_date": end_date})
+                cur.fetchall()
+
+        def fetch_current():
+            with conn.cursor() as cur:
+                cur.execute(
+                    build_query(TABLE_NAME, "1min"),
+                    query_params(start_date, end_date, "1min"),
+                )
+                cur.fetchall()
+
+        print(f"legacy : {timed(fetch_legacy):.3f}s ({len(df)} rows)")
+        print(f"current: {timed(fetch_current):.3f}s ({len(df)} rows)")
+        print("실행 계획 확인 완료")
+        if not keep:
+            with conn.cursor() as cur:
+                cur.execute(
+                    sql.SQL("DROP TABLE IF EXISTS {}").format(
+                        sql.Identifier(TABLE_NAME)
+                    )
+                )
+            conn.commit()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+"""CLI 서브커맨드별 import 시간 측정 (`python -X importtime`)
+
+서브커맨드를 새 프로세스에서 `-X importtime`으로 실행해서 최상위 모듈별 누적 import 시간과
+전체 실행 시간을 출력합니다. `show`/`delete`처럼 전략 인덱스만 읽는 명령이 matplotlib, groq,
+pyupbit, psycopg2, polars 를 로드하면 AssertionError 를 냅니다.
+
+Example:
+    $ python -m benchmarks.importtime
+    $ python -m benchmarks.importtime --command="show" --top=20
+"""
+import os
+import re
+import subprocess
+import sys
+import time
+
+import fire
+
+HEAVY_MODULES = ("matplotlib", "groq", "pyupbit", "psycopg2", "polars")
+LINE_PATTERN = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def importtime(command: str):
+    """`python -X importtime cli.py <command>` 실행 결과(최상위 모듈별 누적 시간(us), 실행 시간(s))"""
+    t0 = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "cli.py", *command.split()],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "MPLBACKEND": "Agg"},
+    )
+    elapsed = time.perf_counter() - t0
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        # 들여쓰기가 없는 줄이 최상위 import
+        if match and match.group(3) == " ":
+            modules[match.group(4)] = int(match.group(2))
+    return modules, elapsed
+
+
+def run(command: str = "show", top: int = 10, repeat: int = 5):
+    runs = [importtime(command) for _ in range(repeat)]
+    modules, elapsed = min(runs, key=lambda item: item[1])
+    total = sum(modules.values())
+    print(f"python cli.py {command}: {elapsed:.3f}s (import {total / 1e6:.3f}s)")
+    for name, cumulative in sorted(modules.items(), key=lambda item: -item[1])[:top]:
+        print(f"{cumulative / 1e3:>9.1f} ms | {name}")
+    if command.split()[0] in ("show", "delete"):
+        loaded = [
+            name
+            for name in modules
+            if name.split(".")[0] in HEAVY_MODULES
+        ]
+        assert not loaded, f"불필요한 모듈을 로드합니다: {loaded}"
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
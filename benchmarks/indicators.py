@@ -0,0 +1,131 @@
+# -*- coding:utf-8 -*-
+"""notebooks 의 pandas 지표 계산과 trading.indicators polars 식 비교
+
+pandas 쪽은 notebooks/portfolio.py 에 있던 `_calculate_*` 구현을 그대로 옮겼습니다.
+
+Example:
+    $ python -m benchmarks.indicators
+    $ python -m benchmarks.indicators --bars=2000000 --repeat=3
+"""
+import time
+
+import fire
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from benchmarks.vectorized import make_chart
+from trading.indicators import by_names, with_indicators
+
+INDICATORS = [
+    "SMA_20",
+    "SMA_60",
+    "SMA_120",
+    "Bollinger_Upper",
+    "Bollinger_Lower",
+    "RSI",
+    "MACD",
+    "%K",
+    "VWAP",
+    "ATR",
+    "ADX",
+]
+
+
+def pandas_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for window in (20, 60, 120):
+        df[f"SMA_{window}"] = df["close"].rolling(window=window).mean()
+
+    df["SMA"] = df["close"].rolling(20).mean()
+    df["Bollinger_Upper"] = df["SMA"] + 2 * df["close"].rolling(20).std()
+    df["Bollinger_Lower"] = df["SMA"] - 2 * df["close"].rolling(20).std()
+
+    delta = df["close"].diff(1)
+    gain = np.where(delta > 0, delta, 0)
+    loss = np.where(delta < 0, -delta, 0)
+    avg_gain = pd.Series(gain, index=df.index).rolling(window=14).mean()
+    avg_loss = pd.Series(loss, index=df.index).rolling(window=14).mean()
+    df["RSI"] = 100 - (100 / (1 + avg_gain / avg_loss))
+
+    df["EMA_12"] = df["close"].ewm(span=12, adjust=False).mean()
+    df["EMA_26"] = df["close"].ewm(span=26, adjust=False).mean()
+    df["MACD"] = df["EMA_12"] - df["EMA_26"]
+    df["MACD_Signal"] = df["MACD"].ewm(span=9, adjust=False).mean()
+    df["MACD_Hist"] = df["MACD"] - df["MACD_Signal"]
+
+    df["Lowest_Low"] = df["low"].rolling(window=14).min()
+    df["Highest_High"] = df["high"].rolling(window=14).max()
+    df["%K"] = 100 * (
+        (df["close"] - df["Lowest_Low"]) / (df["Highest_High"] - df["Lowest_Low"])
+    )
+    df["%D"] = df["%K"].rolling(window=3).mean()
+
+    df["VWAP"] = (df["close"] * df["volume"]).cumsum() / df["volume"].cumsum()
+
+    df["TR"] = np.maximum(
+        (df["high"] - df["low"]),
+        np.maximum(
+            abs(df["high"] - df["close"].shift(1)),
+            abs(df["low"] - df["close"].shift(1)),
+        ),
+    )
+    df["ATR"] = df["TR"].rolling(window=14).mean()
+    df["+DM"] = np.where(
+        (df["high"] - df["high"].shift(1)) > (df["low"].shift(1) - df["low"]),
+        np.maximum((df["high"] - df["high"].shift(1)), 0),
+        0,
+    )
+    df["-DM"] = np.where(
+        (df["low"].shift(1) - df["low"]) > (df["high"] - df["high"].shift(1)),
+        np.maximum((df["low"].shift(1) - df["low"]), 0),
+        0,
+    )
+    df["+DI"] = 100 * (
+        df["+DM"].rolling(window=14).mean() / df["TR"].rolling(window=14).mean()
+    )
+    df["-DI"] = 100 * (
+        df["-DM"].rolling(window=14).mean() / df["TR"].rolling(window=14).mean()
+    )
+    df["DX"] = 100 * abs(df["+DI"] - df["-DI"]) / (df["+DI"] + df["-DI"])
+    df["ADX"] = df["DX"].rolling(window=14).mean()
+    return df
+
+
+def best_of(repeat: int, func) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - t0)
+    return min(elapsed)
+
+
+def run(bars: int = 1_000_000, repeat: int = 3):
+    df = make_chart(bars)
+    pdf = df.to_pandas().set_index("Date")
+    exprs = by_names(INDICATORS)
+
+    pandas_time = best_of(repeat, lambda: pandas_indicators(pdf))
+    polars_time = best_of(repeat, lambda: with_indicators(df, exprs))
+    print(f"{'bars':>10} | {'pandas (s)':>10} | {'polars (s)':>10} | {'speedup':>7}")
+    print(
+        f"{bars:>10} | {pandas_time:>10.3f} | {polars_time:>10.3f} | {pandas_time / polars_time:>6.1f}x"
+    )
+
+    # 결과 일치 확인(polars rolling_std 와 pandas 의 누적 방식 차이로 볼린저 밴드는 상대 오차 기준)
+    expected = pandas_indicators(pdf)
+    result = with_indicators(df, exprs)
+    for column in ("SMA_20", "RSI", "MACD", "%K", "%D", "VWAP", "ATR", "ADX"):
+        a = result[column].cast(pl.Float64).fill_null(np.nan).to_numpy()
+        b = expected[column].to_numpy()
+        assert np.allclose(a, b, rtol=1e-6, atol=1e-6, equal_nan=True), column
+    for column in ("Bollinger_Upper", "Bollinger_Lower"):
+        a = result[column].cast(pl.Float64).fill_null(np.nan).to_numpy()
+        b = expected[column].to_numpy()
+        assert np.allclose(a, b, rtol=1e-6, equal_nan=True), column
+    print("결과 일치")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
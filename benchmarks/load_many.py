@@ -0,0 +1,130 @@
+# -*- coding:utf-8 -*-
+"""여러 종목 순차 로드 vs `load_many` 동시 로드 비교
+
+.env 의 DB_* 접속 정보로 종목 수만큼 합성 1분봉 테이블을 만든 뒤, `search_db_data`를 종목마다
+차례로 호출할 때와 `load_many`로 한 번에 요청할 때의 시간을 잽니다. 가장 느린 종목 하나를 로드하는
+시간도 함께 출력합니다.
+
+Example:
+    $ python -m benchmarks.load_many --coins=10 --interval=1hour --rows=500000
+"""
+import asyncio
+import time
+
+import fire
+
+from benchmarks.loader import connect
+from trading.utils.db import ConnectionPool
+from trading.utils.loader import load_many, search_db_data
+
+TABLE_PREFIX = "BENCH-COIN"
+
+
+def table_names(coins: int):
+    return [f"{TABLE_PREFIX}-{i}" for i in range(coins)]
+
+
+def prepare(conn, coins: int, rows: int):
+    with conn.cursor() as cur:
+        for table_name in table_names(coins):
+            cur.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+            cur.execute(
+                f"""
+                CREATE TABLE "{table_name}" (
+                    date TIMESTAMP NOT NULL,
+                    open NUMERIC,
+                    high NUMERIC,
+                    low NUMERIC,
+                    close NUMERIC,
+                    volume REAL,
+                    PRIMARY KEY (date)
+                )
+                """
+            )
+            cur.execute(
+                f"""
+                INSERT INTO "{table_name}"
+                SELECT
+                    TIMESTAMP '2020-01-01' + i * INTERVAL '1 minute',
+                    round((50000000 + 1000 * sin(i / 100.0))::numeric, 1),
+                    round((50010000 + 1000 * sin(i / 100.0))::numeric, 1),
+                    round((49990000 + 1000 * sin(i / 100.0))::numeric, 1),
+                    round((50000000 + 1000 * cos(i / 100.0))::numeric, 1),
+                    (i %% 1000) / 10.0
+                FROM generate_series(0, %s - 1) AS i
+                """,
+                (rows,),
+            )
+            cur.execute(f'ANALYZE "{table_name}"')
+    conn.commit()
+
+
+def drop(conn, coins: int):
+    with conn.cursor() as cur:
+        for table_name in table_names(coins):
+            cur.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+    conn.commit()
+
+
+def best_of(func, repeat: int) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - t0)
+    return min(elapsed)
+
+
+def run(
+    coins: int = 10,
+    rows: int = 200_000,
+    interval: str = "1min",
+    start_date: str = "2020-01-01",
+    end_date: str = "2020-12-31",
+    workers: int = 10,
+    repeat: int = 3,
+    keep: bool = False,
+):
+    conn = connect()
+    try:
+        prepare(conn, coins, rows)
+    finally:
+        conn.close()
+
+    tickers = table_names(coins)
+    requests = [(t, interval, start_date, end_date) for t in tickers]
+    pool = ConnectionPool(minconn=workers, maxconn=workers)
+
+    def load_one(table_name: str):
+        with pool.connection() as conn:
+            return search_db_data(conn, start_date, end_date, interval, table_name)
+
+    def load_sequential():
+        return [load_one(t) for t in tickers]
+
+    def load_concurrent():
+        return asyncio.run(load_many(requests, pool=pool))
+
+    try:
+        expected = load_sequential()
+        frames = load_concurrent()
+        assert all(a.equals(b) for a, b in zip(expected, frames))
+        slowest = max(best_of(lambda: load_one(t), repeat) for t in tickers)
+        sequential = best_of(load_sequential, repeat)
+        concurrent = best_of(load_concurrent, repeat)
+    finally:
+        pool.close()
+
+    print(f"slowest ticker: {slowest:.3f}s ({len(expected[0])} rows)")
+    print(f"sequential    : {sequential:.3f}s")
+    print(f"load_many     : {concurrent:.3f}s ({sequential / concurrent:.1f}x)")
+    if not keep:
+        conn = connect()
+        try:
+            drop(conn, coins)
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
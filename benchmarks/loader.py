@@ -0,0 +1,119 @@
+# -*- coding:utf-8 -*-
+"""search_db_data 조회 경로 벤치마크 (fetchall + 튜플 변환 vs COPY 스트리밍)
+
+.env 의 DB_* 접속 정보로 로컬 Postgres/TimescaleDB 에 합성 1분봉 테이블을 만든 뒤 비교합니다.
+
+Example:
+    $ python -m benchmarks.loader --rows=3000000
+"""
+import os
+import time
+
+import fire
+import polars as pl
+import psycopg2
+from dotenv import load_dotenv
+
+from trading.utils.loader import _fetch
+
+TABLE_NAME = "BENCH-OHLCV"
+
+
+def connect():
+    load_dotenv()
+    return psycopg2.connect(
+        host=os.environ.get("DB_HOST"),
+        port=os.environ.get("DB_PORT"),
+        dbname=os.environ.get("DB_NAME"),
+        user=os.environ.get("DB_USER"),
+        password=os.environ.get("DB_PASSWORD"),
+    )
+
+
+def prepare(conn, rows: int):
+    with conn.cursor() as cur:
+        cur.execute(f'DROP TABLE IF EXISTS "{TABLE_NAME}"')
+        cur.execute(
+            f"""
+            CREATE TABLE "{TABLE_NAME}" (
+                date TIMESTAMP NOT NULL,
+                open NUMERIC,
+                high NUMERIC,
+                low NUMERIC,
+                close NUMERIC,
+                volume REAL,
+                PRIMARY KEY (date)
+            )
+            """
+        )
+        cur.execute(
+            f"""
+            INSERT INTO "{TABLE_NAME}"
+            SELECT
+                TIMESTAMP '2020-01-01' + i * INTERVAL '1 minute',
+                round((50000000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((50010000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((49990000 + 1000 * sin(i / 100.0))::numeric, 1),
+                round((50000000 + 1000 * cos(i / 100.0))::numeric, 1),
+                (i %% 1000) / 10.0
+            FROM generate_series(0, %s - 1) AS i
+            """,
+            (rows,),
+        )
+        cur.execute(f'ANALYZE "{TABLE_NAME}"')
+    conn.commit()
+
+
+def fetch_rows(conn, start_date: str, end_date: str) -> pl.DataFrame:
+    """기존 fetchall + Python 튜플 변환 경로"""
+    query = f"""
+        SELECT date as Date, open, high, low, close, volume
+        FROM "{TABLE_NAME}"
+        WHERE DATE(date) BETWEEN %s AND %s
+        ORDER BY date
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, (start_date, end_date))
+        data = cur.fetchall()
+        return pl.DataFrame(
+            [
+                (
+                    row[0],
+                    float(row[1]) if row[1] else None,
+                    float(row[2]) if row[2] else None,
+                    float(row[3]) if row[3] else None,
+                    float(row[4]) if row[4] else None,
+                    row[5],
+                )
+                for row in data
+            ],
+            schema=["Date", "open", "high", "low", "close", "volume"],
+            orient="row",
+        )
+
+
+def run(rows: int = 3_000_000, repeat: int = 3, keep: bool = False):
+    conn = connect()
+    try:
+        prepare(conn, rows)
+        start_date, end_date = "2020-01-01", "2030-12-31"
+        for name, fetch in [
+            ("fetchall", lambda: fetch_rows(conn, start_date, end_date)),
+            ("copy", lambda: _fetch(conn, start_date, end_date, "1min", TABLE_NAME)),
+        ]:
+            elapsed = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                df = fetch()
+                elapsed.append(time.perf_counter() - t0)
+            print(f"{name:>8}: {min(elapsed):.3f}s ({len(df)} rows)")
+        if not keep:
+            with conn.cursor() as cur:
+                cur.execute(f'DROP TABLE IF EXISTS "{TABLE_NAME}"')
+            conn.commit()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,41 @@
+# -*- coding:utf-8 -*-
+"""Logger.add_info 바 당 기록 비용 벤치마크
+
+Example:
+    $ python -m benchmarks.logger
+    $ python -m benchmarks.logger --sizes="[10000,100000,1000000]"
+"""
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import fire
+
+from trading.module import Logger
+
+
+def run(sizes: List[int] = (10_000, 100_000, 1_000_000)):
+    start = datetime(2024, 1, 1)
+    info = {
+        "총 매수": 1000000.0,
+        "평가손익": 1010000.0,
+        "총 평가": 2010000.0,
+        "수익률": 1.0,
+        "현금 잔액": 0.0,
+    }
+    print(f"{'bars':>10} | {'add_info (us/bar)':>18} | {'evaluation (ms)':>16}")
+    for n in sizes:
+        # 용량 증가 경로까지 포함해서 측정하도록 작은 용량으로 시작
+        logger = Logger(capacity=1024)
+        dates = [start + timedelta(minutes=i) for i in range(n)]
+        t0 = time.perf_counter()
+        for date in dates:
+            logger.add_info(info, date)
+        t1 = time.perf_counter()
+        logger.evaluation
+        t2 = time.perf_counter()
+        print(f"{n:>10} | {(t1 - t0) / n * 1e6:>18.3f} | {(t2 - t1) * 1e3:>16.1f}")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
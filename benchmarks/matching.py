@@ -0,0 +1,109 @@
+# -*- coding:utf-8 -*-
+"""미체결 지정가/스탑 주문 확인 비용 (가격 힙 주문장 vs 전체 순회)
+
+종목 하나에 `resting`개의 지정가/스탑 주문을 걸어두고 bar 마다 고가/저가에 닿은 주문을 꺼냅니다.
+전체 순회는 bar 마다 모든 주문의 조건을 확인하고, `OrderBook`은 힙의 맨 앞만 확인합니다.
+체결된 주문 수만큼 같은 종류의 주문을 다시 넣어 미체결 주문 수를 유지합니다.
+
+Example:
+    $ python -m benchmarks.matching
+    $ python -m benchmarks.matching --resting=10000 --bars=20000
+"""
+import time
+from typing import List
+
+import fire
+import numpy as np
+
+from trading.module import Order, OrderBook
+
+ORDER_KINDS = [
+    ("buy", "limit"),
+    ("sell", "limit"),
+    ("buy", "stop"),
+    ("sell", "stop"),
+    ("buy", "take_profit"),
+    ("sell", "take_profit"),
+]
+
+
+def make_orders(rng: np.random.Generator, count: int, price: float) -> List[Order]:
+    kinds = rng.integers(0, len(ORDER_KINDS), count)
+    # 현재 가격에서 1% ~ 30% 떨어진 곳에 주문을 걸어둠
+    offsets = rng.uniform(0.01, 0.3, count)
+    orders = []
+    for kind, offset in zip(kinds.tolist(), offsets.tolist()):
+        action, order_type = ORDER_KINDS[kind]
+        rising = (action == "buy") == (order_type == "stop")
+        order_price = price * (1 + offset if rising else 1 - offset)
+        orders.append(Order(action, 1, order_price, "KRW-BENCH", order_type))
+    return orders
+
+
+def triggered(order: Order, high: float, low: float) -> bool:
+    if (order.action == "buy") == (order.order_type == "stop"):
+        return high >= order.order_price
+    return low <= order.order_price
+
+
+def run_scan(orders: List[Order], bars, rng: np.random.Generator) -> int:
+    resting = list(orders)
+    fills = 0
+    for high, low, close in bars:
+        kept = []
+        filled = 0
+        for order in resting:
+            if triggered(order, high, low):
+                filled += 1
+            else:
+                kept.append(order)
+        resting = kept
+        if filled:
+            fills += filled
+            resting.extend(make_orders(rng, filled, close))
+    return fills
+
+
+def run_book(orders: List[Order], bars, rng: np.random.Generator) -> int:
+    book = OrderBook()
+    for order in orders:
+        book.push(order)
+    fills = 0
+    for high, low, close in bars:
+        filled = len(book.pop_crossed(low, high)) + len(book.pop_crossed(high, low))
+        if filled:
+            fills += filled
+            for order in make_orders(rng, filled, close):
+                book.push(order)
+    return fills
+
+
+def run(resting=(1_000, 10_000), bars: int = 20_000, seed: int = 0):
+    if isinstance(resting, int):
+        resting = (resting,)
+    rng = np.random.default_rng(seed)
+    close = 50_000 * np.exp(np.cumsum(rng.normal(0, 0.002, bars)))
+    spread = np.abs(rng.normal(0, 0.002, bars))
+    high = (close * (1 + spread)).tolist()
+    low = (close * (1 - spread)).tolist()
+    path = list(zip(high, low, close.tolist()))
+
+    print(
+        f"{'resting':>10} | {'scan us/bar':>12} | {'book us/bar':>12} | {'speedup':>8} | {'fills':>8}"
+    )
+    for count in resting:
+        orders = make_orders(np.random.default_rng(seed), count, path[0][2])
+        results = []
+        for func in (run_scan, run_book):
+            t0 = time.perf_counter()
+            fills = func(orders, path, np.random.default_rng(seed + 1))
+            results.append((time.perf_counter() - t0, fills))
+        (scan, scan_fills), (book, book_fills) = results
+        assert scan_fills == book_fills, (scan_fills, book_fills)
+        print(
+            f"{count:>10} | {scan / bars * 1e6:>12.2f} | {book / bars * 1e6:>12.2f} | {scan / book:>7.1f}x | {book_fills:>8}"
+        )
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,65 @@
+# -*- coding:utf-8 -*-
+"""Monte Carlo / bootstrap 시뮬레이션 시간
+
+합성 1시간봉 1년치로 벡터화 백테스트를 한 번 돌린 뒤, 거래별 bootstrap 과 bar 수익률 block
+bootstrap 으로 `sims`개 경로를 만드는 시간을 잽니다. 비교용으로 백테스트 한 번의 시간에
+`sims`를 곱한 값(경로마다 `Engine.run_vectorized`를 다시 돌리는 경우)을 함께 출력합니다.
+
+Example:
+    $ python -m benchmarks.montecarlo
+    $ python -m benchmarks.montecarlo --sims=10000 --bars=8760
+"""
+import time
+
+import fire
+import numpy as np
+import polars as pl
+
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+from trading.utils.montecarlo import summarize
+
+
+def make_chart(bars: int, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.exp(np.cumsum(rng.normal(0, 0.01, bars))) * 50_000_000
+    return pl.DataFrame(
+        {
+            "Date": pl.datetime_range(
+                pl.datetime(2020, 1, 1),
+                pl.datetime(2020, 1, 1) + pl.duration(hours=bars - 1),
+                "1h",
+                eager=True,
+            ),
+            "open": close,
+            "high": close * 1.005,
+            "low": close * 0.995,
+            "close": close,
+            "volume": np.ones(bars),
+        }
+    )
+
+
+def run(sims: int = 10_000, bars: int = 24 * 365, seed: int = 0):
+    engine = Engine(
+        strategy=TestStrategy,
+        chart_data=make_chart(bars, seed),
+        strategy_config={"short_ma": 20, "long_ma": 100},
+        market_info={"slippage": 0.001, "fee": 0.0005},
+        initial_margin=1000000.0,
+    )
+    t0 = time.perf_counter()
+    engine.run_vectorized(ticker_name="KRW-BENCH")
+    backtest = time.perf_counter() - t0
+    print(f"backtest x1      : {backtest:.3f}s (x{sims} = {backtest * sims:,.0f}s)")
+
+    for method in ("trades", "bars"):
+        t0 = time.perf_counter()
+        results = engine.monte_carlo(method=method, n_sims=sims, seed=seed)
+        elapsed = time.perf_counter() - t0
+        print(f"{method:<6} x{sims:<9}: {elapsed:.3f}s")
+        print(summarize(results))
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
@@ -0,0 +1,77 @@
+# -*- coding:utf-8 -*-
+"""작업마다 새로 연결 vs 연결 풀 재사용 비교
+
+.env 의 DB_* 접속 정보로 합성 1분봉 테이블(`benchmarks.loader`와 같은 테이블)을 만든 뒤,
+짧은 기간 조회 작업을 스레드 여러 개에서 실행하면서 작업마다 `psycopg2.connect`로 새로 연결할 때와
+`trading.utils.db.ConnectionPool`에서 빌려 쓸 때의 처리 시간을 잽니다.
+
+Example:
+    $ python -m benchmarks.pool --jobs=200 --workers=4
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import fire
+
+from benchmarks.loader import TABLE_NAME, connect, prepare
+from trading.utils.db import ConnectionPool
+from trading.utils.loader import search_db_data
+
+
+def windows(jobs: int):
+    start = date(2020, 1, 1)
+    return [(start + timedelta(days=i % 365)).isoformat() for i in range(jobs)]
+
+
+def load_reconnect(day: str) -> int:
+    conn = connect()
+    try:
+        return len(search_db_data(conn, day, day, "1hour", TABLE_NAME))
+    finally:
+        conn.close()
+
+
+def timed(func, days, workers: int) -> float:
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        rows = sum(executor.map(func, days))
+    elapsed = time.perf_counter() - t0
+    assert rows == 24 * len(days), rows
+    return elapsed
+
+
+def run(jobs: int = 200, workers: int = 4, rows: int = 600_000, keep: bool = False):
+    conn = connect()
+    try:
+        prepare(conn, rows)
+    finally:
+        conn.close()
+
+    pool = ConnectionPool(minconn=workers, maxconn=workers)
+
+    def load_pooled(day: str) -> int:
+        with pool.connection() as conn:
+            return len(search_db_data(conn, day, day, "1hour", TABLE_NAME))
+
+    days = windows(jobs)
+    try:
+        reconnect = timed(load_reconnect, days, workers)
+        pooled = timed(load_pooled, days, workers)
+    finally:
+        pool.close()
+    print(f"reconnect: {reconnect:.3f}s ({reconnect / jobs * 1000:.2f} ms/job)")
+    print(f"pooled   : {pooled:.3f}s ({pooled / jobs * 1000:.2f} ms/job)")
+    print(f"speedup  : {reconnect / pooled:.1f}x")
+    if not keep:
+        conn = connect()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f'DROP TABLE IF EXISTS "{TABLE_NAME}"')
+            conn.commit()
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
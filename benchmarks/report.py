@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+"""결과 리포트 생성 시간 (전체 점 그리기 vs LTTB 다운샘플링)
+
+합성 1분봉으로 벡터화 백테스트를 돌린 뒤 지표 계산(`Engine.summary`), 모든 점을 그린 PNG,
+LTTB 로 줄여서 그린 PNG/HTML 리포트(`Engine.get_result`)의 시간을 잽니다.
+
+Example:
+    $ python -m benchmarks.report --bars=1000000
+"""
+import os
+import tempfile
+import time
+
+import fire
+import numpy as np
+import polars as pl
+
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+from trading.utils.report import MAX_POINTS
+
+
+def make_chart(bars: int, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = np.exp(np.cumsum(rng.normal(0, 0.002, bars))) * 50_000_000
+    return pl.DataFrame(
+        {
+            "Date": pl.datetime_range(
+                pl.datetime(2020, 1, 1),
+                pl.datetime(2020, 1, 1) + pl.duration(minutes=bars - 1),
+                "1m",
+                eager=True,
+            ),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": np.ones(bars),
+        }
+    )
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+
+def run(bars: int = 1_000_000, max_points: int = MAX_POINTS, full: bool = True):
+    engine = Engine(
+        strategy=TestStrategy,
+        chart_data=make_chart(bars),
+        strategy_config={"short_ma": 50, "long_ma": 200},
+        market_info={"slippage": 0.001, "fee": 0.0005},
+        initial_margin=1000000.0,
+    )
+    engine.run_vectorized(ticker_name="KRW-BENCH")
+    output_dir = tempfile.mkdtemp()
+
+    elapsed, metrics = timed(engine.summary)
+    print(f"summary          : {elapsed:.3f}s")
+    for key, value in metrics.items():
+        print(f"  {key:>10}: {value:,.4f}")
+    if full:
+        elapsed, _ = timed(
+            lambda: engine.get_result("full.png", output_dir, max_points=bars)
+        )
+        print(f"full png         : {elapsed:.3f}s ({bars} points)")
+    elapsed, result = timed(
+        lambda: engine.get_result("report", output_dir, max_points=max_points)
+    )
+    print(f"lttb png + html  : {elapsed:.3f}s ({max_points} points)")
+    for path in result["files"]:
+        print(f"  {path} ({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
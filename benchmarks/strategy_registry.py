@@ -0,0 +1,90 @@
+# -*- coding:utf-8 -*-
+"""전략 탐색 콜드 스타트 비교 (모든 전략 import vs 캐시된 인덱스)
+
+trading/strategy 에 TestStrategy 를 복제한 전략 파일을 `--strategies`개 만든 뒤, 새 프로세스에서
+다음 두 방식으로 `cli.py run`/`show`가 하는 전략 탐색을 실행하는 시간을 잽니다. 만든 파일은 끝나면 지웁니다.
+
+- legacy: 디렉토리의 모든 모듈을 import 하고 `inspect.getmembers`로 전략을 찾은 뒤 인스턴스화
+- registry: 캐시된 인덱스로 이름/설명을 읽고 요청한 전략 모듈만 import
+
+Example:
+    $ python -m benchmarks.strategy_registry --strategies=50
+"""
+import os
+import subprocess
+import sys
+import time
+
+import fire
+
+from trading.strategy.registry import STRATEGY_DIR
+
+FILE_PREFIX = "bench_strategy_"
+
+LEGACY = """
+import importlib, inspect, os
+from trading.strategy.base import Strategy
+current_dir = os.path.join("trading", "strategy")
+strategies = []
+for file in os.listdir(current_dir):
+    if file.endswith(".py") and file not in ("base.py", "__init__.py", "registry.py"):
+        module = importlib.import_module(f".{file[:-3]}", package="trading.strategy")
+        for name, obj in inspect.getmembers(module):
+            if inspect.isclass(obj) and issubclass(obj, Strategy) and obj != Strategy:
+                strategies.append(obj())
+names = [s.__name__ for s in strategies]
+assert "TestStrategy" in names
+docs = [s.__doc__.split("\\n")[0] for s in strategies]
+"""
+
+REGISTRY = """
+from trading.strategy import get_strategy_infos, search_strategies
+names = [info["name"] for info in get_strategy_infos()]
+assert "TestStrategy" in names
+docs = [info["doc"] for info in get_strategy_infos()]
+search_strategies("TestStrategy")
+"""
+
+
+def generate(count: int):
+    with open(os.path.join(STRATEGY_DIR, "test.py"), "r", encoding="utf-8") as f:
+        source = f.read()
+    for i in range(count):
+        path = os.path.join(STRATEGY_DIR, f"{FILE_PREFIX}{i}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source.replace("TestStrategy", f"Bench{i}Strategy"))
+
+
+def cleanup():
+    for file in os.listdir(STRATEGY_DIR):
+        if file.startswith(FILE_PREFIX):
+            os.remove(os.path.join(STRATEGY_DIR, file))
+
+
+def cold_start(code: str, repeat: int) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        elapsed.append(time.perf_counter() - t0)
+    return min(elapsed)
+
+
+def run(strategies: int = 50, repeat: int = 5):
+    generate(strategies)
+    try:
+        baseline = cold_start("import trading.strategy", repeat)
+        # 첫 실행에서 인덱스를 만들어 두고 이후 실행은 캐시를 읽음
+        cold_start(REGISTRY, 1)
+        legacy = cold_start(LEGACY, repeat)
+        registry = cold_start(REGISTRY, repeat)
+    finally:
+        cleanup()
+    print(f"strategies: {strategies + 1}")
+    print(f"import    : {baseline:.3f}s")
+    print(f"legacy    : {legacy:.3f}s")
+    print(f"registry  : {registry:.3f}s ({legacy / registry:.1f}x)")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
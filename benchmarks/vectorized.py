@@ -0,0 +1,67 @@
+# -*- coding:utf-8 -*-
+"""Engine.run 과 Engine.run_vectorized 실행 시간 비교
+
+Example:
+    $ python -m benchmarks.vectorized
+    $ python -m benchmarks.vectorized --bars=1000000 --compare=False
+"""
+import time
+from datetime import datetime, timedelta
+
+import fire
+import numpy as np
+import polars as pl
+
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+
+
+def make_chart(bars: int, seed: int = 0) -> pl.DataFrame:
+    """랜덤워크 기반 1분봉 차트 생성"""
+    rng = np.random.default_rng(seed)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.001, bars)))
+    open_ = np.r_[close[0], close[:-1]]
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "Date": pl.datetime_range(
+                start, start + timedelta(minutes=bars - 1), "1m", eager=True
+            ),
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.001,
+            "low": np.minimum(open_, close) * 0.999,
+            "close": close,
+            "volume": rng.uniform(1, 100, bars),
+        }
+    )
+
+
+def run(
+    bars: int = 1_000_000,
+    short_ma: int = 60,
+    long_ma: int = 240,
+    compare: bool = True,
+):
+    df = make_chart(bars)
+    config = {"short_ma": short_ma, "long_ma": long_ma}
+    market_info = {"slippage": 0.01, "fee": 0.0005}
+
+    def engine() -> Engine:
+        return Engine(TestStrategy, df, config, market_info, 1000000.0)
+
+    vectorized = engine()
+    t0 = time.perf_counter()
+    vectorized.run_vectorized(ticker_name="KRW-BTC")
+    evaluation = vectorized.evaluation
+    print(f"run_vectorized: {time.perf_counter() - t0:.3f}s ({bars} bars)")
+
+    if compare:
+        looped = engine()
+        t0 = time.perf_counter()
+        looped.run(ticker_name="KRW-BTC")
+        print(f"run:            {time.perf_counter() - t0:.3f}s ({bars} bars)")
+        print(f"동일한 평가금 곡선: {looped.evaluation.equals(evaluation)}")
+
+
+if __name__ == "__main__":
+    fire.Fire(run)
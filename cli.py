@@ -2,39 +2,34 @@
 import json
 import os
 import re
-from typing import List
+from typing import List, Optional
 
 import fire
-import psycopg2
 from dotenv import load_dotenv
-from groq import Groq
 
 from trading.constant import TEMPLATE_CLASS_NAME
-from trading.engine import Engine
-from trading.strategy import get_all_strategies, search_strategies
-from trading.utils.loader import search_db_data
+from trading.strategy import get_strategy_infos, search_strategies
+from trading.utils.validation import parse_range
 
 
 class Backtest:
     def __init__(self):
         load_dotenv()
-        self.client = Groq(
-            api_key=os.environ.get("GROQ_API_KEY"),
-        )
-        try:
-            self.db = psycopg2.connect(
-                host=os.environ.get("DB_HOST"),
-                port=os.environ.get("DB_PORT"),
-                dbname=os.environ.get("DB_NAME"),
-                user=os.environ.get("DB_USER"),
-                password=os.environ.get("DB_PASSWORD"),
+        self.__client = None
+
+    def __groq(self):
+        # Groq 클라이언트는 전략 생성(make)에서만 필요하므로 처음 사용할 때 로드
+        if self.__client is None:
+            from groq import Groq
+
+            self.__client = Groq(
+                api_key=os.environ.get("GROQ_API_KEY"),
             )
-        except Exception as e:
-            print(f"Error connecting to TimescaleDB: {e}")
+        return self.__client
 
     def __recommend_strategy(self, strategies: List[str]):
         strategies = "\n- ".join(strategies)
-        chat_completion = self.client.chat.completions.create(
+        chat_completion = self.__groq().chat.completions.create(
             messages=[
                 {"role": "system", "content": "you are a helpful assistant."},
                 {
@@ -71,7 +66,7 @@ class Backtest:
             return []
 
     def __make_strategy(self, name: str, description: str, reference_code: str):
-        chat_completion = self.client.chat.completions.create(
+        chat_completion = self.__groq().chat.completions.create(
             messages=[
                 {"role": "system", "content": "you are a helpful assistant."},
                 {
@@ -104,27 +99,248 @@ class Backtest:
         print("UPBIT_API_ACCESS_KEY", os.environ["UPBIT_API_ACCESS_KEY"])
         print("GROQ_API_KEY", os.environ["GROQ_API_KEY"])
 
-    def run(self, name: str, sd: str, ed: str, it: str, tn: str):
+    def run(
+        self,
+        name: str,
+        sd: str,
+        ed: str,
+        it: str,
+        tn: str,
+        cache: bool = True,
+        show: bool = False,
+        store: bool = True,
+        force: bool = False,
+    ):
         """백테스트를 실행합니다.
 
+        결과 리포트(PNG/HTML)는 data/ 에 저장하고 지표를 출력합니다. --show 를 주면 차트 창을 띄웁니다.
+        결과(지표, 평가금 곡선, 체결 내역)는 runs.db 에 저장하며, 전략/설정/종목/주기/기간/데이터가 같은 실행은
+        다시 계산하지 않고 저장된 결과를 출력합니다. --force 를 주면 다시 계산합니다.
+        --show 로 실행하면 리포트 파일이 없으므로 저장하거나 저장된 결과를 쓰지 않습니다.
+
         Example:
             $ python cli.py run
+            $ python cli.py run --nocache
+            $ python cli.py run --show
+            $ python cli.py run --force
         """
-        strategies = get_all_strategies()
-        _strategies = list(map(lambda x: x.__name__, strategies))
+        _strategies = [info["name"] for info in get_strategy_infos()]
         if name in _strategies:
+            from trading.utils.cache import OHLCVCache
+            from trading.utils.db import connection
+            from trading.utils.loader import search_db_data
+            from trading.utils.store import RunStore, run_key
+
             strategy = search_strategies(name)
-            df = search_db_data(self.db, sd, ed, it, tn)
+            with connection() as conn:
+                df = search_db_data(
+                    conn, sd, ed, it, tn, cache=OHLCVCache() if cache else None
+                )
+            strategy_config = {"short_ma": 5, "long_ma": 20}
+            market_info = {"slippage": 0.01, "fee": 0.0005}
+            initial_margin = 1000000.0
+            run_store = RunStore() if store and not show else None
+            if run_store is not None:
+                store_key, metadata = run_key(
+                    strategy,
+                    strategy_config,
+                    tn,
+                    it,
+                    sd,
+                    ed,
+                    df,
+                    market_info,
+                    initial_margin,
+                )
+                stored = None if force else run_store.get(store_key)
+                if stored is not None:
+                    print(f"저장된 결과를 사용합니다. (run {stored['id']}, {stored['created_at']})")
+                    files = stored["files"]
+                    result = {
+                        "file_name": files[0] if files else None,
+                        "files": files,
+                        **stored["metrics"],
+                    }
+                    for key, value in result.items():
+                        print(f"{key}: {value}")
+                    return
+
+            from trading.engine import Engine
+
             engine = Engine(
                 strategy=strategy,
                 chart_data=df,
-                strategy_config={"short_ma": 5, "long_ma": 20},
+                strategy_config=strategy_config,
+                market_info=market_info,
+                initial_margin=initial_margin,
+                is_progress=True,
+            )
+            engine.run(ticker_name=tn)
+            if show:
+                engine.get_result()
+                return
+            result = engine.get_result(f"{name}_{tn}_{it}_{sd}_{ed}")
+            for key, value in result.items():
+                print(f"{key}: {value}")
+            if run_store is not None:
+                files = result.pop("files")
+                result.pop("file_name")
+                run_store.put(
+                    store_key,
+                    metadata,
+                    result,
+                    {"equity": engine.evaluation, "transactions": engine.transactions},
+                    files=files,
+                )
+        else:
+            print(f"전략 {name}은 존재하지 않습니다.")
+
+    def runs(
+        self,
+        name: Optional[str] = None,
+        tn: Optional[str] = None,
+        it: Optional[str] = None,
+        limit: int = 20,
+    ):
+        """저장된 백테스트 결과 목록을 출력합니다.
+
+        Example:
+            $ python cli.py runs --name=TestStrategy --tn=KRW-AVAX
+        """
+        from trading.utils.store import RunStore
+
+        runs = RunStore().find(strategy=name, ticker_name=tn, interval=it, limit=limit)
+        for run in runs:
+            metrics = run["metrics"]
+            print(
+                f"[{run['id']}] {run['created_at']} {run['strategy']} {run['config']} "
+                f"{run['ticker_name']} {run['interval']} {run['start_date']}~{run['end_date']} "
+                f"return: {metrics.get('return', 0.0):.2f}%, mdd: {metrics.get('mdd', 0.0):.2f}%"
+            )
+
+    def sweep(
+        self,
+        name: str,
+        sd: str,
+        ed: str,
+        it: str,
+        tn: str,
+        short_ma: str = "3:30",
+        long_ma: str = "10:200:10",
+        workers: Optional[int] = None,
+        output: Optional[str] = None,
+        top: int = 20,
+        cache: bool = True,
+    ):
+        """파라미터 그리드로 백테스트를 병렬 실행합니다.
+
+        Example:
+            $ python cli.py sweep --name=TestStrategy --sd=2024-01-01 --ed=2024-11-30 --it=1day --tn=KRW-AVAX --short_ma=3:30 --long_ma=10:200:10
+        """
+        _strategies = [info["name"] for info in get_strategy_infos()]
+        if name in _strategies:
+            from trading.engine import Engine
+            from trading.utils.cache import OHLCVCache
+            from trading.utils.db import connection
+            from trading.utils.loader import search_db_data
+
+            strategy = search_strategies(name)
+            with connection() as conn:
+                df = search_db_data(
+                    conn, sd, ed, it, tn, cache=OHLCVCache() if cache else None
+                )
+            result = Engine.sweep(
+                strategy=strategy,
+                chart_data=df,
+                param_grid={
+                    "short_ma": parse_range(short_ma),
+                    "long_ma": parse_range(long_ma),
+                },
                 market_info={"slippage": 0.01, "fee": 0.0005},
                 initial_margin=1000000.0,
+                ticker_name=tn,
+                max_workers=workers,
+                where=lambda config: config["short_ma"] < config["long_ma"],
                 is_progress=True,
             )
-            engine.run(ticker_name=tn)
-            engine.get_result()
+            if output is not None:
+                if output.endswith(".parquet"):
+                    result.write_parquet(output)
+                else:
+                    result.write_csv(output)
+            print(result.head(top))
+        else:
+            print(f"전략 {name}은 존재하지 않습니다.")
+
+    def walkforward(
+        self,
+        name: str,
+        sd: str,
+        ed: str,
+        it: str,
+        tn: str,
+        train: str = "180d",
+        test: str = "30d",
+        step: Optional[str] = None,
+        anchored: bool = False,
+        metric: str = "return",
+        short_ma: str = "3:30",
+        long_ma: str = "10:200:10",
+        workers: Optional[int] = None,
+        output: Optional[str] = None,
+        cache: bool = True,
+    ):
+        """in-sample 구간에서 파라미터를 고르고 바로 뒤 out-of-sample 구간으로 검증합니다.
+
+        --output 을 주면 fold 결과와 이어 붙인 평가금을 {output}_folds, {output}_equity 로 저장합니다(.parquet 또는 .csv).
+
+        Example:
+            $ python cli.py walkforward --name=TestStrategy --sd=2022-01-01 --ed=2024-11-30 --it=1day --tn=KRW-AVAX --train=180d --test=30d
+        """
+        _strategies = [info["name"] for info in get_strategy_infos()]
+        if name in _strategies:
+            from trading.engine import Engine
+            from trading.utils.cache import OHLCVCache
+            from trading.utils.db import connection
+            from trading.utils.loader import search_db_data
+            from trading.utils.metrics import compute_metrics
+
+            strategy = search_strategies(name)
+            with connection() as conn:
+                df = search_db_data(
+                    conn, sd, ed, it, tn, cache=OHLCVCache() if cache else None
+                )
+            initial_margin = 1000000.0
+            folds, equity = Engine.walk_forward(
+                strategy=strategy,
+                chart_data=df,
+                param_grid={
+                    "short_ma": parse_range(short_ma),
+                    "long_ma": parse_range(long_ma),
+                },
+                market_info={"slippage": 0.01, "fee": 0.0005},
+                initial_margin=initial_margin,
+                train=train,
+                test=test,
+                step=step,
+                anchored=anchored,
+                metric=metric,
+                ticker_name=tn,
+                max_workers=workers,
+                where=lambda config: config["short_ma"] < config["long_ma"],
+                is_progress=True,
+            )
+            if output is not None:
+                stem, ext = os.path.splitext(output)
+                for suffix, frame in (("folds", folds), ("equity", equity)):
+                    if ext == ".parquet":
+                        frame.write_parquet(f"{stem}_{suffix}{ext}")
+                    else:
+                        frame.write_csv(f"{stem}_{suffix}{ext or '.csv'}")
+            print(folds)
+            if len(equity):
+                for key, value in compute_metrics(equity, initial_margin).items():
+                    print(f"{key}: {value}")
         else:
             print(f"전략 {name}은 존재하지 않습니다.")
 
@@ -134,16 +350,15 @@ class Backtest:
         Example:
             $ python cli.py show
         """
-        strategies = get_all_strategies()
+        strategies = get_strategy_infos()
 
         print("=== 사용 가능한 전략 목록 ===")
         idx = 1
         for strategy in strategies:
-            if hasattr(strategy, "ready") and strategy.ready:
-                print(f"{idx}. {strategy.__name__}")
-                if strategy.__doc__:
-                    doc_first_line = strategy.__doc__.split("\n")[0].strip()
-                    print(f"   설명: {doc_first_line}")
+            if strategy["ready"]:
+                print(f"{idx}. {strategy['name']}")
+                if strategy["doc"]:
+                    print(f"   설명: {strategy['doc']}")
                 idx += 1
 
     def make(self, name: str):
@@ -158,14 +373,9 @@ class Backtest:
             if os.path.exists(f"trading/strategy/{filename}.py"):
                 print(f"전략 {filename}은 이미 존재합니다.")
             else:
-                strategies = get_all_strategies()
+                strategies = get_strategy_infos()
                 strategies = list(
-                    map(
-                        lambda x: "{} : {}".format(
-                            x.__name__, x.__doc__.split("\n")[0].strip()
-                        ),
-                        strategies,
-                    )
+                    map(lambda x: "{} : {}".format(x["name"], x["doc"]), strategies)
                 )
                 recommended_strategies = self.__recommend_strategy(strategies)
                 if len(recommended_strategies) > 0:
@@ -211,10 +421,9 @@ class Backtest:
             $ python cli.py delete --name=<name>
             $ python cli.py delete --name <name>
         """
-        strategies = get_all_strategies()
-        strategies = list(map(lambda x: x.__name__, strategies))
+        strategies = {info["name"]: info for info in get_strategy_infos()}
         if name in strategies:
-            os.remove(f"trading/strategy/{name.replace('Strategy', '').lower()}.py")
+            os.remove(strategies[name]["path"])
         else:
             print(f"전략 {name}은 존재하지 않습니다.")
 
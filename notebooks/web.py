@@ -1,12 +1,20 @@
+import os
 import re
+import sys
 import warnings
+from datetime import datetime, timedelta
 
 import koreanize_matplotlib
 import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
+import polars as pl
 import streamlit as st
 
+# `streamlit run notebooks/web.py`로 실행해도 trading 패키지를 찾을 수 있도록 저장소 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trading.indicators import by_names, indicator_cache
+from trading.utils.resample import resample
+
 warnings.filterwarnings("ignore")
 
 
@@ -29,158 +37,28 @@ class Portfolio:
         if session_key in st.session_state:
             self.df = st.session_state[session_key]
         else:
-            self.df = pd.read_csv(path, index_col=0, parse_dates=True)
+            self.df = pl.read_csv(path, try_parse_dates=True)
+            self.df = self.df.rename({self.df.columns[0]: "Date"})
             if begin_date:
-                self.df = self.df.loc[begin_date:]
+                self.df = self.df.filter(
+                    pl.col("Date") >= datetime.fromisoformat(begin_date)
+                )
             if end_date:
-                self.df = self.df.loc[:end_date]
-            if group == "day":
-                self.df = self.df.resample("D").agg(
-                    {
-                        "open": "first",
-                        "high": "max",
-                        "low": "min",
-                        "close": "last",
-                        "volume": "sum",
-                        "value": "sum",
-                    }
+                self.df = self.df.filter(
+                    pl.col("Date") < datetime.fromisoformat(end_date) + timedelta(days=1)
                 )
-            self.df["Volume_Indicator"] = self.df["volume"]
-            self.df["변동성"] = (
-                (self.df["high"] - self.df["low"]) / self.df["open"] * 100
+            if group == "day":
+                self.df = resample(self.df, "1day")
+            self.df = self.df.with_columns(
+                pl.col("volume").alias("Volume_Indicator"),
+                ((pl.col("high") - pl.col("low")) / pl.col("open") * 100).alias(
+                    "변동성"
+                ),
             )
 
             # 처리된 데이터를 세션 상태에 저장
             st.session_state[session_key] = self.df
 
-    # 단순 이동평균선(SMA) 계산
-    def _calculate_sma(self, window: int):
-        self.df[f"SMA_{window}"] = self.df["close"].rolling(window=window).mean()
-
-    # 볼린저 밴드(Bollinger Bands) 계산
-    def _calculate_bollinger_bands(self, window: int, num_std: int = 2):
-        self.df["SMA"] = self.df["close"].rolling(window).mean()
-        self.df["Bollinger_Upper"] = (
-            self.df["SMA"] + num_std * self.df["close"].rolling(window).std()
-        )
-        self.df["Bollinger_Lower"] = (
-            self.df["SMA"] - num_std * self.df["close"].rolling(window).std()
-        )
-
-    # 상대강도지수(RSI) 계산
-    def _calculate_rsi(self, window: int = 14):
-        delta = self.df["close"].diff(1)
-        gain = np.where(delta > 0, delta, 0)
-        loss = np.where(delta < 0, -delta, 0)
-
-        avg_gain = pd.Series(gain).rolling(window=window).mean()
-        avg_loss = pd.Series(loss).rolling(window=window).mean()
-
-        rs = avg_gain / avg_loss
-        self.df["RSI"] = 100 - (100 / (1 + rs))
-
-    # MACD 계산
-    def _calculate_macd(
-        self,
-        short_window: int = 12,
-        long_window: int = 26,
-        signal_window: int = 9,
-    ):
-        self.df["EMA_12"] = self.df["close"].ewm(span=short_window, adjust=False).mean()
-        self.df["EMA_26"] = self.df["close"].ewm(span=long_window, adjust=False).mean()
-        self.df["MACD"] = self.df["EMA_12"] - self.df["EMA_26"]
-        self.df["MACD_Signal"] = (
-            self.df["MACD"].ewm(span=signal_window, adjust=False).mean()
-        )
-        self.df["MACD_Hist"] = self.df["MACD"] - self.df["MACD_Signal"]
-
-    # 스토캐스틱 계산
-    def _calculate_stochastic(self, k_window: int = 14, d_window: int = 3):
-        self.df["Lowest_Low"] = self.df["low"].rolling(window=k_window).min()
-        self.df["Highest_High"] = self.df["high"].rolling(window=k_window).max()
-        self.df["%K"] = 100 * (
-            (self.df["close"] - self.df["Lowest_Low"])
-            / (self.df["Highest_High"] - self.df["Lowest_Low"])
-        )
-        self.df["%D"] = self.df["%K"].rolling(window=d_window).mean()
-
-    # VWAP 계산
-    def _calculate_vwap(self):
-        self.df["Cumulative_Price_Volume"] = (
-            self.df["close"] * self.df["volume"]
-        ).cumsum()
-        self.df["Cumulative_Volume"] = self.df["volume"].cumsum()
-        self.df["VWAP"] = (
-            self.df["Cumulative_Price_Volume"] / self.df["Cumulative_Volume"]
-        )
-
-    # 피보나치 되돌림/확장 (Fibonacci Retracement/Extension)
-    def _calculate_fibonacci(self):
-        max_price = self.df["high"].max()
-        min_price = self.df["low"].min()
-
-        levels = {
-            "Fib_23.6%": max_price - (max_price - min_price) * 0.236,
-            "Fib_38.2%": max_price - (max_price - min_price) * 0.382,
-            "Fib_50.0%": max_price - (max_price - min_price) * 0.5,
-            "Fib_61.8%": max_price - (max_price - min_price) * 0.618,
-            "Fib_100%": min_price,
-        }
-
-        for level in levels:
-            self.df[level] = levels[level]
-
-    # ADX 계산
-    def _calculate_adx(self, window: int = 14):
-        self.df["TR"] = np.maximum(
-            (self.df["high"] - self.df["low"]),
-            np.maximum(
-                abs(self.df["high"] - self.df["close"].shift(1)),
-                abs(self.df["low"] - self.df["close"].shift(1)),
-            ),
-        )
-
-        self.df["+DM"] = np.where(
-            (self.df["high"] - self.df["high"].shift(1))
-            > (self.df["low"].shift(1) - self.df["low"]),
-            np.maximum((self.df["high"] - self.df["high"].shift(1)), 0),
-            0,
-        )
-        self.df["-DM"] = np.where(
-            (self.df["low"].shift(1) - self.df["low"])
-            > (self.df["high"] - self.df["high"].shift(1)),
-            np.maximum((self.df["low"].shift(1) - self.df["low"]), 0),
-            0,
-        )
-
-        self.df["+DI"] = 100 * (
-            self.df["+DM"].rolling(window=window).mean()
-            / self.df["TR"].rolling(window=window).mean()
-        )
-        self.df["-DI"] = 100 * (
-            self.df["-DM"].rolling(window=window).mean()
-            / self.df["TR"].rolling(window=window).mean()
-        )
-
-        self.df["DX"] = (
-            100
-            * abs(self.df["+DI"] - self.df["-DI"])
-            / (self.df["+DI"] + self.df["-DI"])
-        )
-        self.df["ADX"] = self.df["DX"].rolling(window=window).mean()
-
-    # ATR(Average True Range) 계산
-    def _calculate_atr(self, window: int = 14):
-        self.df["TR"] = np.maximum(
-            (self.df["high"] - self.df["low"]),
-            np.maximum(
-                abs(self.df["high"] - self.df["close"].shift(1)),
-                abs(self.df["low"] - self.df["close"].shift(1)),
-            ),
-        )
-
-        self.df["ATR"] = self.df["TR"].rolling(window=window).mean()
-
     def run_streamlit(self):
         st.title("비트코인 가격 시각화")
 
@@ -232,30 +110,12 @@ class Portfolio:
         if st.sidebar.button("분석 실행"):
             self.load_data(path, group, begin_date, end_date)
 
-            # 선택된 지표 계산
+            # 선택된 지표 추가(이전 실행에서 계산한 지표는 캐시에서 재사용)
             selected_values = [value for label, value in options if label in indicators]
-            for indicator in selected_values:
-                if indicator.startswith("SMA_"):
-                    window = int(indicator.split("_")[1])
-                    self._calculate_sma(window)
-                elif indicator in ["Bollinger_Upper", "Bollinger_Lower"]:
-                    self._calculate_bollinger_bands(window=20)
-                elif indicator == "RSI":
-                    self._calculate_rsi()
-                elif indicator == "MACD":
-                    self._calculate_macd()
-                elif indicator == "ATR":
-                    self._calculate_atr()
-                elif indicator == "VWAP":
-                    self._calculate_vwap()
-                elif indicator.startswith("Fib_") and indicator.endswith("%"):
-                    self._calculate_fibonacci()
-                elif indicator == "ADX":
-                    self._calculate_adx()
+            self.df = indicator_cache.with_columns(self.df, by_names(selected_values))
 
             # 차트 데이터 준비
-            chart_data = pd.DataFrame(index=self.df.index)
-            chart_data["종가"] = self.df["close"]
+            chart_columns = [pl.col("Date"), pl.col("close").alias("종가")]
 
             for label, value in options:
                 if label in indicators:
@@ -276,7 +136,8 @@ class Portfolio:
                         column_name = label
 
                     if value in self.df.columns:
-                        chart_data[column_name] = self.df[value]
+                        chart_columns.append(pl.col(value).alias(column_name))
+            chart_data = self.df.select(chart_columns)
 
             # 파스텔 톤 색상 팔레트 정의
             pastel_colors = [
@@ -305,17 +166,22 @@ class Portfolio:
             # Streamlit line_chart로 그래프 그리기
             st.line_chart(
                 chart_data,
-                color=pastel_colors[: len(chart_data.columns)],
+                x="Date",
+                color=pastel_colors[: len(chart_data.columns) - 1],
             )
 
             # 변동성 차트
-            st.area_chart(self.df["변동성"], color="rgba(192, 192, 192, 0.4)")
+            st.area_chart(
+                self.df.select("Date", "변동성"),
+                x="Date",
+                color="rgba(192, 192, 192, 0.4)",
+            )
 
             # 그래프 그리기
             fig, ax1 = plt.subplots(figsize=(20, 7))
 
             ax1.plot(
-                self.df.index, self.df["close"], label="종가", color=pastel_colors[0]
+                self.df["Date"], self.df["close"], label="종가", color=pastel_colors[0]
             )  # 종가는 조금 더 진한 색상으로 설정
 
             for i, (label, value) in enumerate(options):
@@ -323,7 +189,7 @@ class Portfolio:
                     color = pastel_colors[
                         i % len(pastel_colors)
                     ]  # 색상을 순환하여 사용
-                    ax1.plot(self.df.index, self.df[value], label=label, color=color)
+                    ax1.plot(self.df["Date"], self.df[value], label=label, color=color)
 
             ax1.set_xlabel("날짜")
             ax1.set_ylabel("가격 (KRW)")
@@ -336,7 +202,7 @@ class Portfolio:
 
             ax2 = ax1.twinx()
             ax2.fill_between(
-                self.df.index,
+                self.df["Date"],
                 self.df["변동성"],
                 alpha=0.3,
                 color="#C0C0C0",
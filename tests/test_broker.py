@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from trading.account import Account
+from trading.broker import Broker
+from trading.module import Order
+
+TICKER = "KRW-TEST"
+
+
+def _bar(day: int, open_: float, high: float, low: float, close: float):
+    return {
+        "Date": datetime(2024, 1, 1) + timedelta(days=day),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+    }
+
+
+def _broker(balance: float = 1000.0, slippage: float = 0.0, **kwargs):
+    account = Account(balance=balance)
+    account.track(TICKER)
+    broker = Broker(account, {"slippage": slippage, "fee": 0.0}, **kwargs)
+    return account, broker
+
+
+def _order(action, quantity, price, order_type="market"):
+    return Order(
+        action=action,
+        quantity=quantity,
+        price=price,
+        ticker_name=TICKER,
+        order_type=order_type,
+    )
+
+
+def _fills(transactions):
+    return [(t.action, t.order_type, t.price, t.status) for t in transactions]
+
+
+def test_limit_gapped_through_fills_at_open():
+    account, broker = _broker()
+    broker.place_order(
+        [_order("buy", 1, 100.0, "limit"), _order("buy", 1, 90.0, "limit")]
+    )
+    # 시가가 두 지정가보다 낮게 열리면 지정가가 아니라 시가에 체결
+    transactions = broker.execute_orders(_bar(0, 85.0, 88.0, 84.0, 86.0))
+    assert _fills(transactions) == [
+        ("buy", "limit", 85.0, "filled"),
+        ("buy", "limit", 85.0, "filled"),
+    ]
+    assert account.balance == pytest.approx(1000.0 - 170.0)
+
+    broker.place_order([_order("sell", 2, 110.0, "limit")])
+    transactions = broker.execute_orders(_bar(1, 115.0, 120.0, 112.0, 118.0))
+    assert _fills(transactions) == [("sell", "limit", 115.0, "filled")]
+    assert account.get_count(TICKER) == 0
+
+
+@pytest.mark.parametrize(
+    "intrabar, first",
+    [
+        ("ohlc", ("sell", "take_profit", 110.0, "filled")),
+        ("olhc", ("sell", "stop", 95.0, "filled")),
+        # 시가에서 저가(7)가 고가(12)보다 가까우므로 저가를 먼저 지남
+        ("nearest", ("sell", "stop", 95.0, "filled")),
+    ],
+)
+def test_stop_and_take_profit_follow_intrabar_path(intrabar, first):
+    account, broker = _broker(intrabar=intrabar)
+    broker.place_order([_order("buy", 2, 100.0)])
+    broker.execute_orders(_bar(0, 100.0, 100.0, 100.0, 100.0))
+    assert account.get_count(TICKER) == 2
+
+    broker.place_order(
+        [_order("sell", 2, 95.0, "stop"), _order("sell", 2, 110.0, "take_profit")]
+    )
+    transactions = broker.execute_orders(_bar(1, 100.0, 112.0, 93.0, 100.0))
+    # 먼저 닿은 주문이 전량 매도하므로 나중에 닿은 주문은 보유 수량 부족으로 거부
+    assert _fills(transactions)[0] == first
+    assert [t.status for t in transactions] == ["filled", "rejected"]
+    assert account.get_count(TICKER) == 0
+    assert account.balance == pytest.approx(1000.0 - 200.0 + 2 * first[2])
+    assert not broker.has_pending
+
+
+def test_stop_fills_with_slippage_but_limit_does_not():
+    account, broker = _broker(slippage=0.01, intrabar="olhc")
+    broker.place_order(
+        [_order("buy", 1, 105.0, "stop"), _order("buy", 1, 95.0, "limit")]
+    )
+    transactions = broker.execute_orders(_bar(0, 100.0, 106.0, 94.0, 100.0))
+    assert _fills(transactions) == [
+        ("buy", "limit", 95.0, "filled"),
+        ("buy", "stop", pytest.approx(105.0 * 1.01), "filled"),
+    ]
+
+
+def test_rejected_orders_leave_account_unchanged():
+    account, broker = _broker(balance=100.0)
+    broker.place_order([_order("buy", 2, 60.0), _order("sell", 1, 60.0)])
+    transactions = broker.execute_orders(_bar(0, 60.0, 60.0, 60.0, 60.0))
+    assert _fills(transactions) == [
+        ("buy", "market", 60.0, "rejected"),
+        ("sell", "market", 60.0, "rejected"),
+    ]
+    assert account.balance == 100.0
+    assert account.get_count(TICKER) == 0
+    assert broker.transaction_frame()["status"].to_list() == ["rejected"] * 2
+
+
+def test_untouched_orders_stay_pending_across_bars():
+    account, broker = _broker()
+    broker.place_order(
+        [_order("buy", 1, 90.0, "limit"), _order("buy", 1, 80.0, "limit")]
+    )
+    transactions = broker.execute_orders(_bar(0, 100.0, 101.0, 85.0, 95.0))
+    assert _fills(transactions) == [("buy", "limit", 90.0, "filled")]
+    assert broker.has_pending
+
+    # 닿지 않는 bar 에서는 그대로 남음
+    assert broker.execute_orders(_bar(1, 95.0, 97.0, 82.0, 96.0)) == []
+    assert broker.has_pending
+
+    transactions = broker.execute_orders(_bar(2, 90.0, 91.0, 78.0, 79.0))
+    assert _fills(transactions) == [("buy", "limit", 80.0, "filled")]
+    assert not broker.has_pending
+    assert account.get_count(TICKER) == 2
+    assert account.balance == pytest.approx(1000.0 - 170.0)
@@ -0,0 +1,132 @@
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from trading.utils.cache import OHLCV_SCHEMA, OHLCVCache
+
+
+def _minutes(start_date: str, end_date: str, close: float = 1.0) -> pl.DataFrame:
+    dates = pl.datetime_range(
+        datetime.fromisoformat(start_date),
+        datetime.fromisoformat(end_date) + timedelta(days=1) - timedelta(minutes=1),
+        "1h",
+        eager=True,
+    )
+    n = len(dates)
+    return pl.DataFrame(
+        {
+            "Date": dates.cast(pl.Datetime("us")),
+            "open": [close] * n,
+            "high": [close] * n,
+            "low": [close] * n,
+            "close": [close] * n,
+            "volume": [1.0] * n,
+        }
+    )
+
+
+class FakeSource:
+    def __init__(self):
+        self.close = 1.0
+        self.fetched = []
+        self.stats = 0
+
+    def fetch(self, start_date, end_date):
+        self.fetched.append((start_date, end_date))
+        return _minutes(start_date, end_date, self.close)
+
+    def stat(self, start_date, end_date):
+        self.stats += 1
+        return [len(_minutes(start_date, end_date)), self.close]
+
+
+def test_hit_does_not_refetch(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    source = FakeSource()
+    first = cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    second = cache.load("KRW-T", "1min", "2020-01-02", "2020-01-05", source.fetch, source.stat)
+    assert source.fetched == [("2020-01-01", "2020-01-10")]
+    assert len(first) == 240 and len(second) == 96
+    # 기본값은 재확인하지 않으므로 원본 요약값도 조회하지 않음
+    assert source.stats == 0
+
+
+def test_extend_fetches_missing_days_only(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    source = FakeSource()
+    cache.load("KRW-T", "1min", "2020-01-05", "2020-01-10", source.fetch, source.stat)
+    df = cache.load("KRW-T", "1min", "2020-01-01", "2020-01-12", source.fetch, source.stat)
+    assert source.fetched[1:] == [
+        ("2020-01-01", "2020-01-04"),
+        ("2020-01-11", "2020-01-12"),
+    ]
+    assert df["Date"].is_sorted() and len(df) == 12 * 24
+
+
+def test_revalidation_waits_for_interval(tmp_path):
+    cache = OHLCVCache(str(tmp_path), revalidate_after=timedelta(hours=1))
+    source = FakeSource()
+    cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    source.close = 2.0
+    df = cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    # 확인 주기가 지나지 않았으므로 저장할 때 한 번만 요약값을 조회
+    assert source.stats == 1 and len(source.fetched) == 1
+    assert df["close"].to_list() == [1.0] * len(df)
+
+
+def test_changed_source_is_refetched(tmp_path):
+    cache = OHLCVCache(str(tmp_path), revalidate_after=timedelta(0))
+    source = FakeSource()
+    cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    # 지난 날짜가 다시 적재됨
+    source.close = 2.0
+    df = cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    assert len(source.fetched) == 2
+    assert df["close"].to_list() == [2.0] * len(df)
+    # 새 요약값으로 다시 저장되었으므로 이후에는 캐시 사용
+    reopened = OHLCVCache(str(tmp_path), revalidate_after=timedelta(0))
+    reopened.load("KRW-T", "1min", "2020-01-01", "2020-01-10", source.fetch, source.stat)
+    assert len(source.fetched) == 2
+
+
+def test_empty_parts_keep_ohlcv_schema(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    empty = lambda sd, ed: pl.DataFrame(schema=OHLCV_SCHEMA)
+    cache.load("KRW-T", "1min", "2020-01-05", "2020-01-06", empty)
+    df = cache.load("KRW-T", "1min", "2020-01-01", "2020-01-10", empty)
+    assert len(df) == 0
+    assert df.schema == pl.Schema(OHLCV_SCHEMA)
+
+
+def test_range_to_today_fetches_open_tail_only(tmp_path):
+    cache = OHLCVCache(str(tmp_path))
+    source = FakeSource()
+    today = date.today()
+    start = (today - timedelta(days=5)).isoformat()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    cache.load("KRW-T", "1min", start, today.isoformat(), source.fetch)
+    df = cache.load("KRW-T", "1min", start, today.isoformat(), source.fetch)
+    assert source.fetched == [
+        (start, yesterday),
+        (today.isoformat(), today.isoformat()),
+        (today.isoformat(), today.isoformat()),
+    ]
+    assert df["Date"].is_sorted() and len(df) == 6 * 24
+
+
+class NoDatabase:
+    def cursor(self):
+        raise AssertionError("캐시 적중인데 DB 를 조회함")
+
+
+def test_loader_hit_does_not_query_database(tmp_path):
+    from trading.utils.loader import search_db_data
+
+    cache = OHLCVCache(str(tmp_path))
+    source = FakeSource()
+    for interval in ("1min", "1hour"):
+        cache.load("KRW-T", interval, "2020-01-01", "2020-01-10", source.fetch)
+        df = search_db_data(
+            NoDatabase(), "2020-01-02", "2020-01-03", interval, "KRW-T", cache
+        )
+        assert len(df) == 48
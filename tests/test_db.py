@@ -0,0 +1,56 @@
+import gc
+
+import psycopg2
+import pytest
+
+from trading.utils.db import ConnectionPool
+
+
+@pytest.fixture
+def pool():
+    try:
+        pool = ConnectionPool(minconn=3, maxconn=3, health_check_interval=0)
+    except psycopg2.OperationalError:
+        pytest.skip("DB 에 연결할 수 없습니다(DB_HOST, DB_NAME, DB_USER 확인).")
+    yield pool
+    pool.close()
+
+
+def _terminate(conns):
+    # 풀 밖의 별도 연결에서 서버 쪽 연결을 끊음
+    admin = ConnectionPool(minconn=1, maxconn=1)
+    try:
+        with admin.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT pg_terminate_backend(pid) FROM unnest(%s) pid",
+                    ([dead.get_backend_pid() for dead in conns],),
+                )
+    finally:
+        admin.close()
+
+
+def test_replaces_every_dead_connection(pool):
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    _terminate(conns)
+
+    # 풀에 남은 3개가 모두 끊어졌어도 확인을 통과한 연결을 받음
+    conn = pool.getconn()
+    try:
+        assert all(conn is not dead for dead in conns)
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            assert cur.fetchone() == (1,)
+    finally:
+        pool.putconn(conn)
+
+
+def test_last_used_follows_connection_object(pool):
+    conn = pool.getconn()
+    pool.putconn(conn, close=True)
+    del conn
+    gc.collect()
+    # 닫힌 연결의 기록은 남지 않음(id 가 재사용되어도 새 연결과 섞이지 않음)
+    assert len(pool._ConnectionPool__last_used) == 0
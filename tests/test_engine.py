@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+
+MARKET_INFO = {"slippage": 0.01, "fee": 0.0005}
+
+
+def _chart(seed: int, n: int = 5000, price: float = 100.0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = price * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    open_ = np.r_[close[0], close[:-1]]
+    return pl.DataFrame(
+        {
+            "Date": [datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(n)],
+            "open": open_,
+            "high": np.maximum(open_, close) * 1.001,
+            "low": np.minimum(open_, close) * 0.999,
+            "close": close,
+            "volume": np.ones(n),
+        }
+    )
+
+
+def _engine(chart: pl.DataFrame, initial_margin: float, **kwargs) -> Engine:
+    return Engine(
+        strategy=TestStrategy,
+        chart_data=chart,
+        strategy_config={"short_ma": 5, "long_ma": 20},
+        market_info=MARKET_INFO,
+        initial_margin=initial_margin,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "seed, initial_margin, fill_at",
+    [
+        (0, 1_000_000.0, "close"),
+        (1, 1_000_000.0, "open"),
+        # 1개 가격보다 잔고가 적어지면 신호 bar 에서 주문하지 않다가 가격이 내려오면 다시 매수
+        (2, 150.0, "close"),
+        (3, 150.0, "open"),
+    ],
+)
+def test_vectorized_matches_run(seed, initial_margin, fill_at):
+    chart = _chart(seed)
+    looped = _engine(chart, initial_margin, fill_at=fill_at)
+    looped.run(ticker_name="KRW-TEST")
+    vectorized = _engine(chart, initial_margin, fill_at=fill_at)
+    vectorized.run_vectorized(ticker_name="KRW-TEST")
+
+    assert len(looped.transactions) > 0
+    assert vectorized.evaluation.equals(looped.evaluation)
+    assert vectorized.transactions.equals(looped.transactions)
+
+
+def test_vectorized_resumes_after_declined_entries():
+    chart = _chart(2)
+    engine = _engine(chart, 150.0)
+    engine.run_vectorized(ticker_name="KRW-TEST")
+    entry = (chart["close"].rolling_mean(5) > chart["close"].rolling_mean(20)).fill_null(
+        False
+    )
+    index = {date: i for i, date in enumerate(chart["Date"])}
+    # 매수는 주문 다음 bar 에 체결되므로 주문 bar 는 체결 bar - 1.
+    # 주문 bar 직전도 신호 bar 였다면 그 bar 에서 주문하지 않고 건너뛴 뒤 다시 매수한 것
+    resumed = [
+        date
+        for date in engine.transactions.filter(pl.col("action") == "buy")["date"]
+        if entry[index[date] - 2]
+    ]
+    assert resumed
+
+
+def test_single_ticker_portfolio_matches_run():
+    chart = _chart(4)
+    single = _engine(chart, 1_000_000.0)
+    single.run(ticker_name="KRW-TEST")
+    portfolio = _engine({"KRW-TEST": chart}, 1_000_000.0)
+    portfolio.run()
+
+    assert len(single.transactions) > 0
+    assert portfolio.evaluation.equals(single.evaluation)
+    assert portfolio.transactions.equals(single.transactions)
+
+
+def test_portfolio_reserves_balance_for_same_bar_orders():
+    # 두 종목의 신호가 같은 bar 에 나오면 먼저 실행한 종목의 매수 금액(수수료 포함)을 잔고에서 빼고
+    # 다음 종목에 넘기므로, 두 번째 종목은 주문하지 않음(예약하지 않으면 체결 시 잔고 부족으로 거부)
+    chart = _chart(5)
+    engine = _engine({"KRW-A": chart, "KRW-B": chart}, 1_000.0)
+    engine.run()
+    transactions = engine.transactions
+
+    alone = _engine(chart, 1_000.0)
+    alone.run(ticker_name="KRW-A")
+    assert len(transactions) > 0
+    assert transactions["ticker_name"].unique().to_list() == ["KRW-A"]
+    assert transactions.equals(alone.transactions)
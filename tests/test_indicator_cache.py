@@ -0,0 +1,98 @@
+import numpy as np
+import polars as pl
+
+from trading.indicators import IndicatorCache, sma
+from trading.strategy import TestStrategy
+
+
+def _chart(n: int = 1000, seed: int = 0) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pl.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.uniform(1, 10, n),
+        }
+    )
+
+
+def _ma(window: int) -> pl.Expr:
+    return pl.col("close").rolling_mean(window).alias(f"ma{window}")
+
+
+def test_hit_on_same_data_in_new_frame():
+    cache = IndicatorCache()
+    df = _chart()
+    first = cache.with_columns(df, [_ma(5), _ma(20)])
+    # 같은 값의 다른 객체, 지표가 읽지 않는 컬럼만 바뀐 객체도 적중
+    again = cache.with_columns(df.clone(), [_ma(5), _ma(20)])
+    volume = cache.with_columns(
+        df.with_columns(pl.col("volume") * 2), [_ma(5), _ma(20)]
+    )
+    assert (cache.hits, cache.misses) == (4, 2)
+    assert again.equals(first)
+    assert volume.select("ma5", "ma20").equals(first.select("ma5", "ma20"))
+
+
+def test_miss_when_input_or_expression_changes():
+    cache = IndicatorCache()
+    df = _chart()
+    cache.with_columns(df, [_ma(5)])
+    # 양 끝 값은 그대로 두고 중간 값 하나만 바뀐 경우
+    changed = df.with_columns(
+        pl.when(pl.int_range(pl.len()) == 500)
+        .then(pl.col("close") + 1)
+        .otherwise(pl.col("close"))
+        .alias("close")
+    )
+    result = cache.with_columns(changed, [_ma(5)])
+    cache.with_columns(df, [_ma(6)])
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert result["ma5"].equals(changed["close"].rolling_mean(5).alias("ma5"))
+
+
+def test_dependent_expression_follows_referenced_key():
+    cache = IndicatorCache()
+    df = _chart()
+    signal = (pl.col("ma5") > pl.col("ma20")).alias("signal")
+    first = cache.with_columns(df, [_ma(5), _ma(20), signal])
+    cache.with_columns(df, [_ma(5), _ma(20), signal])
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert first["signal"].equals((first["ma5"] > first["ma20"]).alias("signal"))
+
+
+def test_evicts_least_recently_used():
+    df = _chart()
+    entry_size = df.select(_ma(5)).estimated_size()
+    cache = IndicatorCache(max_bytes=2 * entry_size)
+    cache.with_columns(df, [_ma(5)])
+    cache.with_columns(df, [_ma(6)])
+    cache.with_columns(df, [_ma(5)])  # ma5 를 최근 사용으로
+    cache.with_columns(df, [_ma(7)])  # 가장 오래 사용하지 않은 ma6 삭제
+    assert len(cache) == 2 and cache.size <= 2 * entry_size
+    misses = cache.misses
+    cache.with_columns(df, [_ma(5)])
+    assert cache.misses == misses
+    cache.with_columns(df, [_ma(6)])
+    assert cache.misses == misses + 1
+
+
+def test_persists_to_disk(tmp_path):
+    df = _chart()
+    IndicatorCache(cache_dir=str(tmp_path)).with_columns(df, [sma(10)])
+    reopened = IndicatorCache(cache_dir=str(tmp_path))
+    reopened.with_columns(df, [sma(10)])
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+def test_strategy_cache_is_optional():
+    df = _chart()
+    config = {"short_ma": 5, "long_ma": 20}
+    cache = IndicatorCache()
+    plain = TestStrategy(config).update(df)
+    cached = TestStrategy(config, cache=cache).update(df)
+    assert len(cache) == 2
+    assert cached.equals(plain)
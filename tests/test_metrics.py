@@ -0,0 +1,65 @@
+import math
+import statistics
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+from trading.utils.metrics import compute_metrics, trade_returns
+from trading.utils.montecarlo import bar_returns
+
+INITIAL = 1000.0
+
+
+@pytest.fixture
+def evaluation() -> pl.DataFrame:
+    # 현금 1000 → 2일차에 500 어치(5개 @100) 매수 → 120 → 90 → 5일차에 110 에 전량 매도
+    cash = [1000.0, 500.0, 500.0, 500.0, 1050.0, 1050.0]
+    purchase = [0.0, 500.0, 500.0, 500.0, 0.0, 0.0]
+    market = [0.0, 500.0, 600.0, 450.0, 0.0, 0.0]
+    return pl.DataFrame(
+        {
+            "Date": [datetime(2024, 1, 1) + timedelta(days=i) for i in range(6)],
+            "총 매수": purchase,
+            "평가 손익": [m - p for m, p in zip(market, purchase)],
+            "현금 잔액": cash,
+            # Logger 와 같이 총 평가 = 총 매수 + 평가금 + 현금(보유 중 매수 금액이 두 번 들어감)
+            "총 평가": [p + m + c for p, m, c in zip(purchase, market, cash)],
+        }
+    )
+
+
+def test_metrics_use_liquidation_value(evaluation):
+    # 손으로 계산한 청산 가치(현금 + 보유 평가액)
+    value = [1000.0, 1000.0, 1100.0, 950.0, 1050.0, 1050.0]
+    returns = [b / a - 1 for a, b in zip([INITIAL] + value[:-1], value)]
+    ppy = 365.0
+    growth = value[-1] / INITIAL
+    expected = {
+        "last_value": 1050.0,
+        "return": 5.0,
+        "mdd": (1100 - 950) / 1100 * 100,
+        "cagr": (growth ** (365 / 5) - 1) * 100,
+        "sharpe": statistics.mean(returns) / statistics.stdev(returns) * math.sqrt(ppy),
+        "sortino": statistics.mean(returns)
+        / math.sqrt(statistics.mean(min(r, 0) ** 2 for r in returns))
+        * math.sqrt(ppy),
+        "win_rate": 100.0,
+        "trades": 1,
+        "exposure": 50.0,
+    }
+    metrics = compute_metrics(evaluation, INITIAL)
+    assert metrics.keys() == expected.keys()
+    for key, target in expected.items():
+        assert metrics[key] == pytest.approx(target, rel=1e-9), key
+
+
+def test_trade_and_bar_returns_agree(evaluation):
+    assert trade_returns(evaluation, INITIAL).to_list() == pytest.approx([0.05])
+    assert bar_returns(evaluation).tolist() == pytest.approx(
+        [0.0, 0.1, 950 / 1100 - 1, 1050 / 950 - 1, 0.0]
+    )
+
+
+def test_default_initial_margin_is_first_liquidation_value(evaluation):
+    assert compute_metrics(evaluation) == compute_metrics(evaluation, INITIAL)
@@ -0,0 +1,65 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from trading.utils.montecarlo import simulate, summarize
+
+RETURNS = np.random.default_rng(0).normal(0.001, 0.02, 50)
+
+
+def _reference(returns, n_sims, horizon, initial_value, seed):
+    # 경로마다 i.i.d. 로 뽑아 평가금, MDD, 수면 아래 기간을 한 bar 씩 계산
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, len(returns), size=(n_sims, horizon))
+    rows = []
+    for path in returns[index]:
+        value = peak = initial_value
+        mdd = underwater = since_peak = 0
+        for r in path:
+            value *= 1 + r
+            since_peak += 1
+            if value >= peak:
+                peak, since_peak = value, 0
+            mdd = max(mdd, (1 - value / peak) * 100)
+            underwater = max(underwater, since_peak)
+        rows.append((value, mdd, underwater))
+    return rows
+
+
+def test_shape_and_columns():
+    results = simulate(RETURNS, n_sims=200, horizon=30, block_size=5, seed=1)
+    assert results.shape == (200, 4)
+    assert results.schema == pl.Schema(
+        {
+            "final_value": pl.Float64,
+            "return": pl.Float64,
+            "mdd": pl.Float64,
+            "underwater": pl.Int64,
+        }
+    )
+    assert results["underwater"].max() <= 30
+    assert summarize(results)["stat"].to_list() == [
+        "mean",
+        "q5",
+        "q25",
+        "q50",
+        "q75",
+        "q95",
+    ]
+
+
+def test_iid_bootstrap_matches_reference():
+    results = simulate(RETURNS, n_sims=100, horizon=40, initial_value=1000.0, seed=7)
+    expected = _reference(RETURNS, 100, 40, 1000.0, 7)
+    assert results["final_value"].to_list() == pytest.approx([r[0] for r in expected])
+    assert results["mdd"].to_list() == pytest.approx([r[1] for r in expected])
+    assert results["underwater"].to_list() == [r[2] for r in expected]
+
+
+@pytest.mark.parametrize("block_size", [1, 4])
+def test_chunking_does_not_change_results(block_size):
+    kwargs = dict(n_sims=300, horizon=50, block_size=block_size, seed=3)
+    whole = simulate(RETURNS, **kwargs)
+    # 한 chunk 에 시뮬레이션 몇 개만 들어가도록 메모리 상한을 줄임
+    chunked = simulate(RETURNS, max_bytes=50 * 8 * 4 * 7, **kwargs)
+    assert chunked.equals(whole)
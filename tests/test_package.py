@@ -0,0 +1,20 @@
+import subprocess
+import sys
+
+import trading
+
+
+def test_star_import_exports_lazy_names():
+    namespace = {}
+    exec("from trading import *", namespace)
+    for name in ("Engine", "Broker", "Account", "Order", "OrderBook", "Strategy"):
+        assert namespace[name] is getattr(trading, name)
+    assert set(trading.__all__) == set(trading._EXPORTS)
+
+
+def test_import_does_not_load_heavy_modules():
+    code = "import sys, trading; print(any(m in sys.modules for m in ('polars', 'numpy')))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
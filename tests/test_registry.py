@@ -0,0 +1,81 @@
+import os
+
+from trading.strategy import registry as default_registry
+from trading.strategy.registry import DEFAULT_INDEX_PATH, STRATEGY_DIR, StrategyRegistry
+
+STRATEGY = '''
+from trading.strategy.base import Strategy
+
+
+class {name}(Strategy):
+    """{doc}"""
+
+    def __init__(self, config={{}}, ready={ready}):
+        super().__init__(config, ready=ready)
+
+
+class Helper:
+    pass
+'''
+
+
+def _write(path, mtime=None, **kwargs):
+    path.write_text(STRATEGY.format(**kwargs), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def _registry(tmp_path) -> StrategyRegistry:
+    return StrategyRegistry(
+        str(tmp_path / "strategies"), str(tmp_path / "index" / "strategies.json")
+    )
+
+
+def test_index_path_does_not_depend_on_working_directory():
+    assert os.path.isabs(DEFAULT_INDEX_PATH)
+    assert DEFAULT_INDEX_PATH.startswith(STRATEGY_DIR + os.sep)
+    assert "TestStrategy" in default_registry.names()
+
+
+def test_index_is_reused_until_a_file_changes(tmp_path):
+    (tmp_path / "strategies").mkdir()
+    path = tmp_path / "strategies" / "mine.py"
+    _write(path, mtime=1_000_000_000, name="First", doc="첫 번째", ready=True)
+    index = _registry(tmp_path).index()
+    assert list(index) == ["First"]
+    assert index["First"]["doc"] == "첫 번째" and index["First"]["ready"] is True
+
+    # 다른 작업 디렉토리에서 만든 registry 도 같은 인덱스 파일을 읽음
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        assert list(_registry(tmp_path).index()) == ["First"]
+    finally:
+        os.chdir(cwd)
+
+    _write(path, mtime=2_000_000_000, name="Second", doc="두 번째", ready=False)
+    index = _registry(tmp_path).index()
+    assert list(index) == ["Second"] and index["Second"]["ready"] is False
+
+
+def test_same_mtime_with_different_size_is_reparsed(tmp_path):
+    (tmp_path / "strategies").mkdir()
+    path = tmp_path / "strategies" / "mine.py"
+    _write(path, mtime=1_000_000_000, name="Short", doc="짧음", ready=True)
+    assert list(_registry(tmp_path).index()) == ["Short"]
+    # 수정 시각 해상도가 낮은 파일 시스템처럼 mtime 이 그대로인 경우
+    _write(path, mtime=1_000_000_000, name="Longer", doc="조금 더 김", ready=True)
+    assert list(_registry(tmp_path).index()) == ["Longer"]
+
+
+def test_removed_and_added_files(tmp_path):
+    (tmp_path / "strategies").mkdir()
+    first = tmp_path / "strategies" / "a.py"
+    _write(first, name="A", doc="a", ready=True)
+    registry = _registry(tmp_path)
+    assert registry.names() == ["A"]
+
+    first.unlink()
+    _write(tmp_path / "strategies" / "b.py", name="B", doc="b", ready=True)
+    assert registry.names() == ["B"]
+    assert _registry(tmp_path).names() == ["B"]
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from trading.utils.resample import (
+    BUCKET_ORIGIN,
+    is_day_aligned,
+    resample,
+    to_timedelta,
+)
+
+
+@pytest.fixture(scope="module")
+def minutes() -> pl.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 60 * 24 * 10
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    return pl.DataFrame(
+        {
+            "Date": pl.datetime_range(
+                datetime(2024, 1, 1),
+                datetime(2024, 1, 1) + timedelta(minutes=n - 1),
+                "1m",
+                eager=True,
+            ),
+            "open": close,
+            "high": close + 0.05,
+            "low": close - 0.05,
+            "close": close,
+            "volume": rng.uniform(0, 1, n),
+        }
+    )
+
+
+def _bucket(ts: datetime, every: timedelta) -> datetime:
+    # TimescaleDB time_bucket: 기준 시각(2000-01-03)부터 every 단위로 내림
+    return ts - (ts - datetime(2000, 1, 3)) % every
+
+
+def test_origin_matches_time_bucket_default():
+    assert BUCKET_ORIGIN == datetime(2000, 1, 3)
+
+
+@pytest.mark.parametrize("interval", ["5min", "1hour", "5hour", "1day", "3day"])
+def test_resample_matches_time_bucket(minutes, interval):
+    every = to_timedelta(interval)
+    expected = (
+        minutes.with_columns(
+            pl.col("Date").map_elements(
+                lambda ts: _bucket(ts, every), return_dtype=pl.Datetime("us")
+            )
+        )
+        .group_by("Date", maintain_order=True)
+        .agg(
+            pl.col("open").first(),
+            pl.col("high").max(),
+            pl.col("low").min(),
+            pl.col("close").last(),
+            pl.col("volume").sum(),
+        )
+    )
+    result = resample(minutes, interval)
+    assert result["Date"].to_list() == expected["Date"].to_list()
+    for column in ["open", "high", "low", "close", "volume"]:
+        np.testing.assert_allclose(result[column], expected[column], rtol=1e-12)
+
+
+def test_day_aligned():
+    assert is_day_aligned("1min") and is_day_aligned("4hour") and is_day_aligned("1day")
+    assert not is_day_aligned("5hour") and not is_day_aligned("3day")
+
+
+@pytest.mark.parametrize("interval", ["0min", "0hour", "00hour", "0day"])
+def test_non_positive_interval(interval):
+    with pytest.raises(ValueError):
+        to_timedelta(interval)
+    with pytest.raises(ValueError):
+        is_day_aligned(interval)
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import polars as pl
+import pytest
+
+from trading.module.scrap import Scraper
+
+STEP = timedelta(minutes=5)  # 하루 288개 → 200개씩 두 페이지
+
+
+class FakeUpbit(ThreadingHTTPServer):
+    """업비트 캔들 API 흉내(5분마다 한 개, `failures`에 남은 상태 코드를 먼저 응답)"""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.requests = []
+        self.failures = []
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        to = datetime.fromisoformat(query["to"][0]).replace(tzinfo=None)
+        with self.server.lock:
+            status = self.server.failures.pop(0) if self.server.failures else 200
+            self.server.requests.append((time.monotonic(), status, to))
+        if status != 200:
+            self.send_response(status)
+            self.end_headers()
+            return
+        candles = []
+        t = to - STEP
+        while len(candles) < int(query["count"][0]):
+            candles.append(
+                {
+                    "candle_date_time_kst": t.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "opening_price": 100.0,
+                    "high_price": 101.0,
+                    "low_price": 99.0,
+                    "trade_price": 100.5,
+                    "candle_acc_trade_volume": 0.1,
+                    "candle_acc_trade_price": 10.0,
+                }
+            )
+            t -= STEP
+        body = json.dumps(candles).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = FakeUpbit()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _days(server):
+    return sorted({(to - timedelta(seconds=1)).date() for _, _, to in server.requests})
+
+
+def test_writes_one_partition_per_day(server, tmp_path):
+    scraper = Scraper(out_dir=str(tmp_path), base_url=server.base_url, rate=100)
+    scraper.run(coins=["KRW-BTC"], start="2024-01-01", end="2024-01-03", merge=False)
+
+    for i in range(3):
+        day = date(2024, 1, 1) + timedelta(days=i)
+        df = pl.read_parquet(scraper.partition_path("KRW-BTC", day))
+        assert len(df) == 288
+        assert df["Date"][0] == f"{day.isoformat()} 00:00:00"
+        assert df["Date"].is_sorted() and df["Date"].n_unique() == 288
+    assert not [name for name in os.listdir(tmp_path / "KRW-BTC") if name.endswith(".tmp")]
+
+
+def test_failed_write_keeps_previous_partition(server, tmp_path, monkeypatch):
+    scraper = Scraper(out_dir=str(tmp_path), base_url=server.base_url, rate=100)
+    scraper.run(coins=["KRW-BTC"], start="2024-01-01", end="2024-01-01", merge=False)
+    path = scraper.partition_path("KRW-BTC", date(2024, 1, 1))
+    before = pl.read_parquet(path)
+
+    def broken(self, file, *args, **kwargs):
+        with open(file, "wb") as f:
+            f.write(b"PAR1")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", broken)
+    with pytest.raises(OSError):
+        # 완료된 일자를 다시 수집하다가 저장 중 실패
+        asyncio.run(scraper.scrape([("KRW-BTC", date(2024, 1, 1))]))
+    monkeypatch.undo()
+    # 쓰다 만 파일이 완료된 partition 을 덮어쓰거나 남지 않음
+    assert pl.read_parquet(path).equals(before)
+    assert os.listdir(tmp_path / "KRW-BTC") == ["2024-01-01.parquet"]
+
+
+def test_rerun_skips_completed_days(server, tmp_path):
+    scraper = Scraper(out_dir=str(tmp_path), base_url=server.base_url, rate=100)
+    scraper.run(coins=["KRW-BTC"], start="2024-01-01", end="2024-01-02", merge=False)
+    assert _days(server) == [date(2024, 1, 1), date(2024, 1, 2)]
+
+    server.requests.clear()
+    scraper.run(coins=["KRW-BTC"], start="2024-01-01", end="2024-01-04", merge=False)
+    assert _days(server) == [date(2024, 1, 3), date(2024, 1, 4)]
+
+
+def test_retries_429_and_5xx_within_rate(server, tmp_path):
+    # 재시도 대기(0.5초, 1초)보다 토큰 간격(1초)이 길어야 재시도가 제한을 거치는지 확인됨
+    rate, burst = 1.0, 1
+    server.failures = [429, 503, 500]
+    scraper = Scraper(
+        out_dir=str(tmp_path), base_url=server.base_url, rate=rate, burst=burst
+    )
+    scraper.run(coins=["KRW-BTC"], start="2024-01-01", end="2024-01-01", merge=False)
+
+    assert [status for _, status, _ in server.requests] == [429, 503, 500, 200, 200]
+    # 어느 구간이든 요청 수가 burst + rate * 경과 시간을 넘지 않음
+    times = [t for t, _, _ in server.requests]
+    for i in range(len(times)):
+        for j in range(i + 1, len(times)):
+            assert j - i + 1 <= burst + rate * (times[j] - times[i]) + 0.05
+    df = pl.read_parquet(scraper.partition_path("KRW-BTC", date(2024, 1, 1)))
+    assert len(df) == 288
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+from trading.strategy import TestStrategy
+from trading.utils import store
+from trading.utils.store import RunStore, run_key
+
+CONFIG = {"short_ma": 5, "long_ma": 20}
+MARKET_INFO = {"slippage": 0.01, "fee": 0.0005}
+
+
+@pytest.fixture
+def chart() -> pl.DataFrame:
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+    close = [100.0 + i for i in range(30)]
+    return pl.DataFrame(
+        {
+            "Date": dates,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": [1.0] * 30,
+        }
+    )
+
+
+def _key(chart, **overrides):
+    args = {
+        "strategy": TestStrategy,
+        "config": CONFIG,
+        "ticker_name": "KRW-BTC",
+        "interval": "1day",
+        "start": "2024-01-01",
+        "end": "2024-01-30",
+        "chart_data": chart,
+        "market_info": MARKET_INFO,
+        "initial_margin": 1000000.0,
+        **overrides,
+    }
+    return run_key(**args)[0]
+
+
+def test_key_is_stable_and_depends_on_inputs(chart):
+    key = _key(chart)
+    assert key == _key(chart)
+    assert key != _key(chart, config={"short_ma": 5, "long_ma": 30})
+    assert key != _key(chart, chart_data=chart.with_columns(pl.col("close") * 2))
+
+
+def test_key_changes_with_engine_code(chart, monkeypatch):
+    key = _key(chart)
+    monkeypatch.setattr(store, "_engine_hash", lambda: "changed-engine")
+    assert _key(chart) != key
+
+
+def test_put_and_get_round_trip(chart, tmp_path):
+    run_store = RunStore(str(tmp_path / "runs.db"))
+    key = _key(chart)
+    _, metadata = run_key(
+        TestStrategy,
+        CONFIG,
+        "KRW-BTC",
+        "1day",
+        "2024-01-01",
+        "2024-01-30",
+        chart,
+        MARKET_INFO,
+        1000000.0,
+    )
+    metrics = {"last_value": 1.0, "return": 0.5, "mdd": 0.1}
+    run_id = run_store.put(key, metadata, metrics, {"equity": chart}, files=["a.html"])
+
+    run = run_store.get(key)
+    assert run["id"] == run_id and run["files"] == ["a.html"]
+    # 지표 순서 유지
+    assert list(run["metrics"].items()) == list(metrics.items())
+    assert run_store.frame(run_id, "equity").equals(chart)
+    assert [row["key"] for row in run_store.find(strategy="TestStrategy")] == [key]
+    assert run_store.delete(key) and run_store.get(key) is None
+
+
+def test_package_hash_covers_modules_but_not_strategies(tmp_path):
+    for path, source in [
+        ("engine.py", "ENGINE = 1\n"),
+        ("module/position.py", "POSITION = 1\n"),
+        ("strategy/base.py", "BASE = 1\n"),
+        ("strategy/custom.py", "STRATEGY = 1\n"),
+    ]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(source)
+    strategy_dir = str(tmp_path / "strategy")
+    original = store._package_hash(str(tmp_path), strategy_dir)
+
+    (tmp_path / "strategy/custom.py").write_text("STRATEGY = 2\n")
+    assert store._package_hash(str(tmp_path), strategy_dir) == original
+    for path in ("module/position.py", "strategy/base.py"):
+        (tmp_path / path).write_text("CHANGED = 2\n")
+        changed = store._package_hash(str(tmp_path), strategy_dir)
+        assert changed != original
+        original = changed
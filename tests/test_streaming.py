@@ -0,0 +1,122 @@
+import math
+from typing import Any, List, Optional
+
+import numpy as np
+import polars as pl
+import pytest
+
+from trading.indicators import expressions as ex
+from trading.indicators import streaming as st
+
+N = 500
+
+
+@pytest.fixture(scope="module")
+def chart() -> pl.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, N)))
+    # 가격이 멈춘 구간(0 으로 나누는 RSI/스토캐스틱/ADX)도 포함
+    close[200:240] = close[199]
+    spread = np.abs(rng.normal(0, 0.01, N)) * close
+    spread[200:240] = 0.0
+    return pl.DataFrame(
+        {
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.uniform(0, 10, N),
+        }
+    )
+
+
+def _stream(indicator: st.StreamingIndicator, chart: pl.DataFrame) -> List[Any]:
+    return [indicator.update(bar) for bar in chart.iter_rows(named=True)]
+
+
+def _assert_close(streamed: List[Optional[float]], expected: pl.Series):
+    assert len(streamed) == len(expected)
+    for i, (value, target) in enumerate(zip(streamed, expected.to_list())):
+        # 워밍업(null) 구간과 nan 위치까지 같아야 함
+        if target is None:
+            assert value is None, f"{expected.name}[{i}]: {value} != null"
+        elif math.isnan(target):
+            assert value is not None and math.isnan(value), f"{expected.name}[{i}]"
+        else:
+            assert value == pytest.approx(target, rel=1e-9, abs=1e-9), (
+                f"{expected.name}[{i}]: {value} != {target}"
+            )
+
+
+def _field(values: List[Optional[tuple]], index: int) -> List[Optional[float]]:
+    return [None if value is None else value[index] for value in values]
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_sma(chart, window):
+    expected = chart.select(ex.sma(window)).to_series()
+    _assert_close(_stream(st.SMA(window), chart), expected)
+
+
+@pytest.mark.parametrize("span", [3, 12, 26])
+def test_ema(chart, span):
+    expected = chart.select(ex.ema(span)).to_series()
+    _assert_close(_stream(st.EMA(span), chart), expected)
+
+
+@pytest.mark.parametrize("window", [2, 14])
+def test_rsi(chart, window):
+    expected = chart.select(ex.rsi(window)).to_series()
+    _assert_close(_stream(st.RSI(window), chart), expected)
+
+
+def test_macd(chart):
+    expected = ex.with_indicators(chart, ex.macd())
+    streamed = _stream(st.MACD(), chart)
+    for index, name in enumerate(["MACD", "MACD_Signal", "MACD_Hist"]):
+        _assert_close(_field(streamed, index), expected[name])
+
+
+@pytest.mark.parametrize("window", [2, 20])
+def test_bollinger_bands(chart, window):
+    expected = ex.with_indicators(chart, ex.bollinger_bands(window))
+    streamed = _stream(st.BollingerBands(window), chart)
+    names = ["Bollinger_Mid", "Bollinger_Upper", "Bollinger_Lower"]
+    for index, name in enumerate(names):
+        _assert_close(_field(streamed, index), expected[name])
+
+
+@pytest.mark.parametrize("window", [1, 14])
+def test_atr(chart, window):
+    expected = chart.select(ex.atr(window)).to_series()
+    _assert_close(_stream(st.ATR(window), chart), expected)
+
+
+@pytest.mark.parametrize("window", [3, 14])
+def test_adx(chart, window):
+    expected = chart.select(ex.adx(window)).to_series()
+    _assert_close(_stream(st.ADX(window), chart), expected)
+
+
+@pytest.mark.parametrize("k_window, d_window", [(14, 3), (5, 1)])
+def test_stochastic(chart, k_window, d_window):
+    expected = ex.with_indicators(chart, ex.stochastic(k_window, d_window))
+    streamed = _stream(st.Stochastic(k_window, d_window), chart)
+    _assert_close(_field(streamed, 0), expected["%K"])
+    _assert_close(_field(streamed, 1), expected["%D"])
+
+
+def test_vwap(chart):
+    expected = chart.select(ex.vwap()).to_series()
+    _assert_close(_stream(st.VWAP(), chart), expected)
+
+
+def test_warmup_matches_update(chart):
+    warmed = st.BollingerBands(20)
+    warmed.warmup(chart.head(300))
+    updated = st.BollingerBands(20)
+    _stream(updated, chart.head(300))
+    assert warmed.value == updated.value
+    assert warmed.update(chart.row(300, named=True)) == updated.update(
+        chart.row(300, named=True)
+    )
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from trading.engine import Engine
+from trading.strategy import TestStrategy
+from trading.utils.metrics import compute_metrics
+from trading.walkforward import make_folds, walk_forward
+
+CONFIGS = [
+    {"short_ma": 2, "long_ma": 5},
+    {"short_ma": 3, "long_ma": 10},
+    {"short_ma": 5, "long_ma": 20},
+]
+MARKET_INFO = {"slippage": 0.0, "fee": 0.0}
+INITIAL = 1_000_000.0
+TRAIN_BARS = 90
+
+
+def _chart(seed: int = 3, n: int = 120) -> pl.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, n)))
+    return pl.DataFrame(
+        {
+            "Date": [datetime(2024, 1, 1) + timedelta(days=i) for i in range(n)],
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": np.ones(n),
+        }
+    )
+
+
+def _in_sample(chart: pl.DataFrame, config) -> pl.DataFrame:
+    engine = Engine(
+        strategy=TestStrategy,
+        chart_data=chart.head(TRAIN_BARS),
+        strategy_config=config,
+        market_info=MARKET_INFO,
+        initial_margin=INITIAL,
+    )
+    engine.run_vectorized(ticker_name="KRW-TEST")
+    return engine.evaluation
+
+
+def test_selects_best_in_sample_liquidation_return():
+    chart = _chart()
+    last = [_in_sample(chart, config).row(-1, named=True) for config in CONFIGS]
+    liquidation = [row["총 평가"] - row["총 매수"] for row in last]
+    best = int(np.argmax(liquidation))
+    # 이 차트에서는 보유 중 매수 금액이 두 번 들어간 총 평가로 고르면 다른 설정이 뽑힘
+    assert int(np.argmax([row["총 평가"] for row in last])) != best
+
+    folds, equity = walk_forward(
+        TestStrategy,
+        chart,
+        {"short_ma": [2, 3, 5], "long_ma": [5, 10, 20]},
+        MARKET_INFO,
+        INITIAL,
+        train=f"{TRAIN_BARS}d",
+        test="30d",
+        ticker_name="KRW-TEST",
+        max_workers=1,
+        where=lambda config: config in CONFIGS,
+    )
+    assert len(folds) == 1
+    fold = folds.row(0, named=True)
+    assert {key: fold[key] for key in CONFIGS[best]} == CONFIGS[best]
+    assert fold["is_return"] == (liquidation[best] / INITIAL - 1) * 100
+
+    # 이어 붙인 곡선의 지표도 청산 가치 기준(fold 하나면 out-of-sample 지표와 같음)
+    stitched = compute_metrics(equity, INITIAL)
+    assert stitched["return"] == fold["oos_return"]
+    assert stitched["mdd"] == fold["oos_mdd"]
+
+
+def test_out_of_sample_windows_do_not_overlap():
+    dates = _chart()["Date"]
+    folds = make_folds(dates, train="30d", test="20d", step="25d")
+    assert len(folds) == 4
+    for previous, fold in zip(folds, folds[1:]):
+        assert previous["end"] <= fold["split"]
+
+    with pytest.raises(ValueError):
+        make_folds(dates, train="30d", test="20d", step="10d")
@@ -1,4 +1,42 @@
-from .module import *
-from .strategy import *
+import importlib
 
 __version__ = "0.1.0"
+
+# 패키지 최상위에서 쓰는 이름은 처음 접근할 때 import(`cli.py show` 등이 polars 를 로드하지 않도록)
+_EXPORTS = {
+    "Account": "trading.account",
+    "Broker": "trading.broker",
+    "Engine": "trading.engine",
+    "ORDER_TYPES": "trading.module",
+    "Logger": "trading.module",
+    "MarketInfo": "trading.module",
+    "Order": "trading.module",
+    "OrderBook": "trading.module",
+    "Position": "trading.module",
+    "RowView": "trading.module",
+    "Transaction": "trading.module",
+    "add_target": "trading.module",
+    "get_active_targets": "trading.module",
+    "get_all_targets": "trading.module",
+    "Strategy": "trading.strategy",
+    "StrategyRegistry": "trading.strategy",
+    "get_all_strategies": "trading.strategy",
+    "get_strategy_infos": "trading.strategy",
+    "registry": "trading.strategy",
+    "search_strategies": "trading.strategy",
+}
+# `from trading import *`(노트북)은 __all__ 의 이름을 모두 import
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    strategy = importlib.import_module("trading.strategy")
+    if not name.startswith("__") and name in strategy.registry.index():
+        return getattr(strategy, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
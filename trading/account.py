@@ -2,7 +2,6 @@ import os
 from typing import Any, Dict, Literal
 
 from dotenv import load_dotenv
-from pyupbit import Upbit
 
 from trading.module import Position, get_active_targets
 
@@ -20,14 +19,11 @@ class Account:
         """
         load_dotenv()
         self.__is_live = is_live
+        self.__client = None
         if self.__is_live:
             self.__balance = self.client.get_balance("KRW")
         else:
             self.__balance = balance
-        # 업비트 클라이언트 정의
-        self.client = Upbit(
-            os.environ["UPBIT_API_ACCESS_KEY"], os.environ["UPBIT_API_SECRET_KEY"]
-        )
         # 현재 active 상태 목록
         self.__target_coin = get_active_targets()
         self.__position = Position()
@@ -39,6 +35,21 @@ class Account:
             else:
                 self.__position.add(coin, 0.0, 0.0)
 
+    @property
+    def client(self):
+        """업비트 클라이언트(처음 사용할 때 생성하므로 백테스트에서는 pyupbit 를 로드하지 않음)
+
+        Returns:
+            Upbit: 업비트 클라이언트
+        """
+        if self.__client is None:
+            from pyupbit import Upbit
+
+            self.__client = Upbit(
+                os.environ["UPBIT_API_ACCESS_KEY"], os.environ["UPBIT_API_SECRET_KEY"]
+            )
+        return self.__client
+
     @property
     def balance(self) -> float:
         """현금 잔고
@@ -51,6 +62,15 @@ class Account:
         else:
             return self.__balance
 
+    def track(self, ticker_name: str):
+        """투자종목 목록에 없는 종목을 빈 포지션으로 추가(백테스트용)
+
+        Args:
+            ticker_name (str): 종목명
+        """
+        if ticker_name not in self.__position:
+            self.__position.add(ticker_name, 0.0, 0.0)
+
     def has_position(self, ticker_name: str) -> bool:
         return self.__position.has_position(ticker_name)
 
@@ -1,26 +1,53 @@
-from collections import deque
-from typing import Dict, List, Literal
+from collections import defaultdict
+from typing import Any, Dict, List, Literal, Mapping, Optional
 
 import polars as pl
 
 from trading.account import Account
-from trading.module import MarketInfo, Order, Transaction
+from trading.module import MarketInfo, Order, OrderBook, Transaction
+
+# 종목 보유 수량 비교 허용 오차(부동소수점 수량)
+QUANTITY_TOLERANCE = 1e-9
 
 
 class Broker:
     """실제 거래 모듈
 
     별도로 추상화를 하여 live와 백테스팅 분리가 필요
+
+    주문은 종목별 `OrderBook`에 두고, bar 마다 시가 → 고가/저가 → 종가 경로를 따라 감시 가격에
+    닿는 지정가/스탑/익절 주문을 닿는 순서대로 체결합니다. 시장가 주문은 `fill_at` 가격에 체결합니다.
+    매수는 체결 전에 잔고(체결 금액 + 수수료)를, 매도는 보유 수량을 확인하고 부족하면 계좌를 바꾸지
+    않고 거부합니다. 체결/거부 내역은 `transactions`에 남습니다.
     """
 
     def __init__(
-        self, account: Account, market_info: Dict[Literal["slippage", "fee"], float]
+        self,
+        account: Account,
+        market_info: Dict[Literal["slippage", "fee"], float],
+        fill_at: Literal["open", "close"] = "close",
+        intrabar: Literal["nearest", "ohlc", "olhc"] = "nearest",
     ):
+        """브로커 초기화
+
+        Args:
+            account (Account): 계좌
+            market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
+            fill_at (Literal["open", "close"], optional): 시장가 주문 체결 가격(다음 bar 의 시가/종가). Defaults to "close".
+            intrabar (Literal["nearest", "ohlc", "olhc"], optional): bar 안의 가격 경로 가정.
+                "ohlc"는 고가를 먼저, "olhc"는 저가를 먼저, "nearest"는 시가에 가까운 쪽을 먼저 지난다고 봅니다. Defaults to "nearest".
+        """
+        if fill_at not in ("open", "close"):
+            raise ValueError(f"지원하지 않는 체결 가격입니다: {fill_at}")
+        if intrabar not in ("nearest", "ohlc", "olhc"):
+            raise ValueError(f"지원하지 않는 가격 경로입니다: {intrabar}")
         self.__account = account
         self.__market_info = MarketInfo(
             slippage=market_info["slippage"], fee=market_info["fee"]
         )
-        self.__queue: deque[Order] = deque()
+        self.__fill_at = fill_at
+        self.__intrabar = intrabar
+        self.__books: Dict[str, OrderBook] = defaultdict(OrderBook)  # 종목별 미체결 주문
         self.transactions: List[Transaction] = []
 
     @property
@@ -31,38 +58,124 @@ class Broker:
     def slippage(self):
         return self.__market_info.slippage
 
+    @property
+    def has_pending(self) -> bool:
+        """미체결 주문 존재 여부"""
+        return any(len(book) > 0 for book in self.__books.values())
+
     def execute_orders(
         self,
-        data: Dict[
-            Literal["Date", "high", "open", "close", "low", "volume", "value"], float
+        data: Mapping[
+            Literal["Date", "high", "open", "close", "low", "volume", "value"], Any
         ],
+        ticker_name: Optional[str] = None,
     ) -> List[Transaction]:
-        for _ in range(len(self.__queue)):
-            # 큐 pop
-            order = self.__queue.popleft()
-            copy_order = order
-            # 수수료 적용
-            order.fee = self.__market_info.fee
-            # 체결 가격(이때, 미래 참조를 하게 되는 것이므로 미래시점 체결)
-            order.realized_price = data["close"]
-
-            # 예상 구매 금액
-            price = data["close"] * order.quantity * (1 + self.__market_info.slippage)
-            # 수수료 금액
-            fee = price * order.fee
-            self.__account.update(
-                price, order.quantity, order.ticker_name, order.action
-            )
-            # 체결 처리
-            if order.action == "buy":
-                if self.__account.balance >= price - fee:
-                    self.__account.deposit(-price - fee)
-                else:
-                    self.__queue.append(copy_order)
+        """미체결 주문을 현재 bar 가격으로 체결
+
+        Args:
+            data (Mapping): 현재 bar
+            ticker_name (Optional[str], optional): bar 의 종목명. 지정하면 해당 종목 주문만 체결합니다. Defaults to None(전체).
+
+        Returns:
+            List[Transaction]: 이번 bar 의 체결/거부 내역
+        """
+        if ticker_name is None:
+            books = [book for book in self.__books.values() if book]
+        else:
+            book = self.__books.get(ticker_name)
+            books = [book] if book else None
+        if not books:
+            # 미체결 주문이 없는 bar 는 바로 반환
+            return []
+        start = len(self.transactions)
+        for book in books:
+            self.__execute_book(book, data)
+        return self.transactions[start:]
+
+    def __execute_book(self, book: OrderBook, data: Mapping[str, Any]):
+        if book.market and self.__fill_at == "open":
+            for order in book.pop_market():
+                self.__fill(order, data["open"], data)
+        if book.has_resting:
+            open_, high, low, close = data["open"], data["high"], data["low"], data["close"]
+            if self.__intrabar == "ohlc" or (
+                self.__intrabar == "nearest" and high - open_ <= open_ - low
+            ):
+                path = (open_, high, low, close)
             else:
-                self.__account.deposit(price - fee)
+                path = (open_, low, high, close)
+            # 시가에서 이미 조건을 만족하면(갭) 시가에 체결
+            for price, order in book.pop_touched(open_):
+                self.__fill(order, price, data)
+            for start, end in zip(path, path[1:]):
+                for price, order in book.pop_crossed(start, end):
+                    self.__fill(order, price, data)
+        if book.market:
+            for order in book.pop_market():
+                self.__fill(order, data["close"], data)
+
+    def __fill(self, order: Order, price: float, data: Mapping[str, Any]):
+        # 시장가로 나가는 주문(시장가, 스탑)만 불리한 방향으로 슬리피지 적용
+        if order.order_type in ("market", "stop"):
+            slippage = self.__market_info.slippage
+            price = price * (1 + slippage if order.action == "buy" else 1 - slippage)
+        fee_rate = self.__market_info.fee
+        quantity = order.quantity
+        account = self.__account
+        ticker_name = order.ticker_name
+        if order.action == "buy":
+            amount = price * quantity
+            fee = amount * fee_rate
+            filled = quantity > 0 and account.balance >= amount + fee
+            if filled:
+                account.update(amount, quantity, ticker_name, "buy")
+                account.deposit(-amount - fee)
+        else:
+            held = account.get_count(ticker_name)
+            filled = 0 < quantity <= held * (1 + QUANTITY_TOLERANCE)
+            if filled:
+                quantity = min(quantity, held)
+            amount = price * quantity
+            fee = amount * fee_rate
+            if filled:
+                account.update(amount, quantity, ticker_name, "sell")
+                account.deposit(amount - fee)
+        order.fee = fee_rate
+        order.realized_price = price
+        self.transactions.append(
+            Transaction(
+                data.get("Date"),
+                ticker_name,
+                order.action,
+                order.order_type,
+                quantity,
+                price,
+                amount,
+                fee,
+                "filled" if filled else "rejected",
+            )
+        )
 
     def place_order(self, actions: List[Order]):
-        # 다음 tick에 체결되는 주문들을 queue에 넣어둠
+        # 다음 tick부터 체결되는 주문들을 종목별 주문장에 넣어둠
         for order in actions:
-            self.__queue.append(order)
+            self.__account.track(order.ticker_name)
+            self.__books[order.ticker_name].push(order)
+
+    def cancel_orders(self, ticker_name: Optional[str] = None):
+        """미체결 주문 취소
+
+        Args:
+            ticker_name (Optional[str], optional): 종목명. Defaults to None(전체).
+        """
+        if ticker_name is None:
+            for book in self.__books.values():
+                book.clear()
+        elif ticker_name in self.__books:
+            self.__books[ticker_name].clear()
+
+    def transaction_frame(self) -> pl.DataFrame:
+        """체결/거부 내역 DataFrame"""
+        if not self.transactions:
+            return pl.DataFrame(schema=list(Transaction.__slots__))
+        return pl.DataFrame([t.to_dict() for t in self.transactions])
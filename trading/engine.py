@@ -1,159 +1,523 @@
-from typing import Dict, List, Literal, Optional
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-import koreanize_matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 import polars as pl
 from tqdm import tqdm
 
 from trading.account import Account
 from trading.broker import Broker
-from trading.constant import PALETTE
-from trading.module import Logger
+from trading.module import Logger, RowView
 from trading.strategy import Strategy
+from trading.utils.metrics import compute_metrics
+from trading.utils.report import FIGSIZE, MAX_POINTS, draw, write_report
 
 
 class Engine:
     def __init__(
         self,
         strategy: Strategy,
-        chart_data: pl.DataFrame,
+        chart_data: Union[pl.DataFrame, Dict[str, pl.DataFrame]],
         strategy_config: Dict[Literal["short_ma", "long_ma"], int],
         market_info: Dict[Literal["slippage", "fee"], float],
         initial_margin: float,
         is_live: bool = False,
         is_progress: bool = False,
+        fill_at: Literal["open", "close"] = "close",
+        intrabar: Literal["nearest", "ohlc", "olhc"] = "nearest",
+        warmup: int = 0,
     ):
         """엔진 초기화
 
         Args:
             strategy (Strategy): 전략 클래스
-            chart_data (pl.DataFrame): 차트 데이터
+            chart_data (Union[pl.DataFrame, Dict[str, pl.DataFrame]]): 차트 데이터. {종목명: 차트} 형태로 넘기면 여러 종목을 한 계좌로 백테스트합니다.
             strategy_config (Dict[Literal["short_ma", "long_ma"], int]): 전략 설정 파라미터
             market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
             initial_margin (float): 초기 투자금
             is_live (bool, optional): 실제 거래 여부. Defaults to False.
             is_progress (bool, optional): 진행률 표시 여부. Defaults to False.
+            fill_at (Literal["open", "close"], optional): 시장가 주문 체결 가격. Defaults to "close".
+            intrabar (Literal["nearest", "ohlc", "olhc"], optional): 지정가/스탑/익절 주문을 확인할 bar 안의 가격 경로 가정. Defaults to "nearest".
+            warmup (int, optional): 지표 계산에만 쓰고 백테스트에서는 빼는 앞쪽 bar 수(종목별). Defaults to 0.
         """
         self.__strategy_config = strategy_config
         self.__strategy: Strategy = strategy(config=strategy_config)
-        self.__df = self.__strategy.update(chart_data)
+        if isinstance(chart_data, dict):
+            # 종목별로 지표를 계산한 뒤 시간순으로 병합
+            self.__tickers: Optional[List[str]] = list(chart_data.keys())
+            self.__df = self.__merge(
+                {
+                    ticker_name: self.__strategy.update(df).slice(warmup)
+                    for ticker_name, df in chart_data.items()
+                }
+            )
+        else:
+            self.__tickers = None
+            self.__df = self.__strategy.update(chart_data).slice(warmup)
         self.__account = Account(is_live=is_live, balance=initial_margin)
-        self.__broker = Broker(self.__account, market_info)  # 거래 실행 모듈 계좌 사용
-        self.__logger = Logger()  # 백테스팅 정보 로깅
+        # 거래 실행 모듈 계좌 사용
+        self.__broker = Broker(
+            self.__account, market_info, fill_at=fill_at, intrabar=intrabar
+        )
+        self.__logger = Logger(capacity=len(self.__df))  # 백테스팅 정보 로깅
+        self.__initial_margin = initial_margin
+        self.__is_live = is_live
         self.__is_progress = is_progress
 
+    @property
+    def evaluation(self) -> pl.DataFrame:
+        """bar 별 평가 정보"""
+        return self.__logger.evaluation
+
+    @property
+    def transactions(self) -> pl.DataFrame:
+        """체결/거부 내역"""
+        return self.__broker.transaction_frame()
+
+    @staticmethod
+    def __merge(frames: Dict[str, pl.DataFrame]) -> pl.DataFrame:
+        """종목별 차트를 `ticker` 컬럼을 붙여 시간순으로 병합(k-way merge)
+
+        정렬된 차트를 두 개씩 `merge_sorted`로 합치므로 O(n log k)이며, 같은 시각의 bar 는
+        종목 순서대로 놓입니다.
+        """
+        schema = pl.concat(
+            [df.head(0) for df in frames.values()], how="vertical_relaxed"
+        ).schema
+        merged = [
+            df.cast(schema)
+            .sort("Date")
+            .with_columns(pl.lit(ticker_name).alias("ticker"))
+            for ticker_name, df in frames.items()
+        ]
+        while len(merged) > 1:
+            pairs = [
+                left.merge_sorted(right, key="Date")
+                for left, right in zip(merged[::2], merged[1::2])
+            ]
+            if len(merged) % 2 == 1:
+                pairs.append(merged[-1])
+            merged = pairs
+        return merged[0]
+
     def run(self, ticker_name: str = "KRW-AVAX"):
-        iterator = self.__df.iter_rows()
-        cols: List[
-            Literal["Date", "high", "open", "close", "low", "volume", "value"]
-        ] = self.__df.columns
+        if self.__tickers is not None:
+            return self.__run_portfolio()
+        self.__account.track(ticker_name)
+        n = len(self.__df)
+        # bar 마다 dict 를 만들지 않고 하나의 view 를 옮겨가며 전략에 전달
+        state = RowView(self.__df)
+        state["ticker_name"] = ticker_name
+        state["fee"] = self.__broker.fee
+        state["slippage"] = self.__broker.slippage
+        close = state.column("close")
+        dates = state.column("Date")
         if self.__is_progress:
-            pbar = tqdm(total=len(self.__df), desc="백테스팅 진행률")
-        for i, data in enumerate(iterator):
-            if self.__is_progress:
-                pbar.update(1)
-            if i == len(self.__df) - 1:
-                if self.__is_progress:
-                    pbar.close()
-            data = dict(zip(cols, data))
+            pbar = tqdm(total=n, desc="백테스팅 진행률")
+        for i in range(n):
+            state.index = i
 
             # 미체결 주문 처리(이전 data에서 주문 넣고, 현재 data로 처리되므로 미래시점 체결)
-            self.__broker.execute_orders(data)
+            self.__broker.execute_orders(state)
 
             # 현재 가격 기준으로 포트폴리오 최신화
-            self.__account.update_price(data["close"], ticker_name)
-            state_dict = {
-                "ticker_name": ticker_name,
-                "price": data["close"],
-                "position": self.__account.has_position(ticker_name),
-                "balance": self.__account.balance,
-                "count": self.__account.get_count(ticker_name),
-                "fee": self.__broker.fee,
-                "slippage": self.__broker.slippage,
-                **data,
-            }
+            self.__account.update_price(close[i], ticker_name)
+            state["price"] = close[i]
+            state["position"] = self.__account.has_position(ticker_name)
+            state["balance"] = self.__account.balance
+            state["count"] = self.__account.get_count(ticker_name)
 
             # 해당 정보로 전략의 execute 메서드 실행시 매수 또는 매도 액션 return
-            actions = self.__strategy.execute(state_dict)
+            actions = self.__strategy.execute(state)
 
             # broker 가 체결 처리
             self.__broker.place_order(actions)
 
             # Logger에 필요한 정보 넣기(거래 내역 및 잔고 등)
-            self.__logger.add_info(self.__account.info(), data["Date"])
+            self.__logger.add_info(self.__account.info(), dates[i])
+            if self.__is_progress:
+                pbar.update(1)
+        if self.__is_progress:
+            pbar.close()
 
-    def get_result(self, file_name: Optional[str] = None) -> Optional[Dict[str, float]]:
-        # 서브플롯 생성
-        fig, (ax1, ax3) = plt.subplots(2, 1, figsize=(20, 12), height_ratios=[2, 1])
-        fig.subplots_adjust(hspace=0.3)
+    def __run_portfolio(self):
+        """여러 종목 백테스트
 
-        # 제목에 슬리피지와 수수료율 표시
-        fig.suptitle(
-            f"슬리피지: {self.__broker.slippage*100}%, 수수료율: {self.__broker.fee*100}%",
-            fontsize=12,
+        병합된 차트를 한 번 순회하면서 같은 시각의 bar 들을 모아, 먼저 모든 종목의 미체결 주문과
+        가격을 갱신한 뒤 종목별로 전략을 실행합니다. 전략에는 단일 종목과 같은 `state_dict`에
+        모든 종목의 최신 종가(`prices`)가 함께 전달되며, 평가금은 시각마다 한 번 기록됩니다.
+        """
+        for ticker_name in self.__tickers:
+            self.__account.track(ticker_name)
+        n = len(self.__df)
+        prices: Dict[str, float] = {}
+        state = RowView(self.__df)
+        state["fee"] = self.__broker.fee
+        state["slippage"] = self.__broker.slippage
+        state["prices"] = prices
+        close = state.column("close")
+        dates = state.column("Date")
+        tickers = state.column("ticker")
+        if self.__is_progress:
+            pbar = tqdm(total=n, desc="백테스팅 진행률")
+
+        def step(start: int, end: int):
+            for i in range(start, end):
+                # 미체결 주문 처리 및 가격 최신화
+                state.index = i
+                self.__broker.execute_orders(state, tickers[i])
+                self.__account.update_price(close[i], tickers[i])
+                prices[tickers[i]] = close[i]
+            # 같은 시각에 먼저 낸 매수 주문 금액은 다음 종목이 쓸 수 있는 잔고에서 제외
+            balance = self.__account.balance
+            for i in range(start, end):
+                ticker_name = tickers[i]
+                state.index = i
+                state["ticker_name"] = ticker_name
+                state["price"] = close[i]
+                state["position"] = self.__account.has_position(ticker_name)
+                state["balance"] = balance
+                state["count"] = self.__account.get_count(ticker_name)
+                orders = self.__strategy.execute(state)
+                for order in orders:
+                    if order.action == "buy":
+                        balance -= order.order_price * order.quantity * (
+                            1 + self.__broker.fee
+                        )
+                self.__broker.place_order(orders)
+            self.__logger.add_info(self.__account.info(), dates[start])
+
+        # 같은 시각의 bar 는 연속해 있으므로 [start, i) 구간 단위로 실행
+        start = 0
+        for i in range(1, n):
+            if dates[i] != dates[start]:
+                step(start, i)
+                if self.__is_progress:
+                    pbar.update(i - start)
+                start = i
+        if n:
+            step(start, n)
+        if self.__is_progress:
+            pbar.update(n - start)
+            pbar.close()
+
+    def run_vectorized(self, ticker_name: str = "KRW-AVAX"):
+        """신호 컬럼 기반 벡터화 백테스트
+
+        `Strategy.signals`로 주문이 나올 수 있는 bar만 골라 `run`과 같은 체결 규칙으로 처리하고,
+        나머지 bar의 평가금은 NumPy 컬럼 연산으로 채웁니다. 결과는 `run`과 동일합니다.
+        신호를 지원하지 않는 전략이거나 실제 거래 모드 또는 여러 종목이면 `run`으로 실행합니다.
+
+        Args:
+            ticker_name (str, optional): 종목명. Defaults to "KRW-AVAX".
+        """
+        signals = (
+            None
+            if self.__is_live or self.__tickers is not None
+            else self.__strategy.signals(self.__df)
         )
+        if signals is None:
+            return self.run(ticker_name=ticker_name)
+        self.__account.track(ticker_name)
+
+        n = len(self.__df)
+        initial_balance = self.__account.balance
+        entries = np.flatnonzero(signals["entry"].fill_null(False).to_numpy())
+        exits = np.flatnonzero(signals["exit"].fill_null(False).to_numpy())
+        entry_ends = self.__run_ends(entries)
+        exit_ends = self.__run_ends(exits)
 
-        # 첫 번째 서브플롯 - 가격과 변동성
+        # 계좌 상태가 바뀔 수 있는 bar와 그 시점의 계좌 스냅샷
+        marks: List[int] = []
+        purchases: List[float] = []
+        counts: List[float] = []
+        balances: List[float] = []
+        # run 과 같은 RowView 를 방문하는 bar 로만 옮겨가며 전략에 전달
+        state = RowView(self.__df)
+        state["ticker_name"] = ticker_name
+        state["fee"] = self.__broker.fee
+        state["slippage"] = self.__broker.slippage
+        close = state.column("close")
         i = 0
-        for key, value in self.__strategy.description().items():
-            ax1.plot(self.__df["Date"], self.__df[key], label=value, color=PALETTE[i])
+        while i < n:
+            if not self.__broker.has_pending:
+                # 미체결 주문이 없으면 다음 신호 bar까지 계좌 상태는 변하지 않음
+                candidates = (
+                    exits if self.__account.has_position(ticker_name) else entries
+                )
+                k = np.searchsorted(candidates, i)
+                if k == len(candidates):
+                    break
+                i = int(candidates[k])
+            state.index = i
+            self.__broker.execute_orders(state)
+            self.__account.update_price(close[i], ticker_name)
+            state["price"] = close[i]
+            state["position"] = self.__account.has_position(ticker_name)
+            state["balance"] = self.__account.balance
+            state["count"] = self.__account.get_count(ticker_name)
+            orders = self.__strategy.execute(state)
+            if not orders and not self.__broker.has_pending:
+                # 신호 bar 에서 주문하지 않았으면(잔고 부족 등) 계좌가 그대로이므로, 같은 신호 구간의
+                # 남은 bar 는 체결/평가 없이 가격만 바꿔 전략을 실행하다가 주문이 나온 bar 에서 이어감
+                candidates, ends = (
+                    (exits, exit_ends) if state["position"] else (entries, entry_ends)
+                )
+                k = np.searchsorted(candidates, i)
+                if k < len(candidates) and candidates[k] == i:
+                    for j in range(i + 1, int(ends[k]) + 1):
+                        state.index = j
+                        state["price"] = close[j]
+                        orders = self.__strategy.execute(state)
+                        if orders:
+                            i = j
+                            self.__account.update_price(close[i], ticker_name)
+                            break
+                    else:
+                        i = int(ends[k])
+                        state.index = i
+                        self.__account.update_price(close[i], ticker_name)
+            self.__broker.place_order(orders)
+            info = self.__account.info()
+            marks.append(i)
+            purchases.append(info["총 매수"])
+            counts.append(self.__account.get_count(ticker_name))
+            balances.append(info["현금 잔액"])
             i += 1
 
-        ax1.set_xlabel("날짜")
-        ax1.set_ylabel("가격 (KRW)")
-        ax1.tick_params(axis="y")
-        ax1.yaxis.set_major_formatter(
-            plt.FuncFormatter(lambda x, p: format(int(x), ","))
+        # 각 bar에 직전 스냅샷을 채워 평가금 계산(첫 스냅샷 이전은 초기 상태)
+        slot = np.searchsorted(np.asarray(marks, dtype=np.int64), np.arange(n), "right")
+        purchase = np.r_[0.0, purchases][slot]
+        count = np.r_[0.0, counts][slot]
+        balance = np.r_[initial_balance, balances][slot]
+        evaluation = self.__df["close"].cast(pl.Float64).to_numpy() * count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(
+                purchase != 0, (evaluation - purchase) / purchase * 100, 0.0
+            )
+        self.__logger.extend(
+            self.__df["Date"],
+            {
+                "총 매수": purchase,
+                "평가손익": evaluation,
+                "총 평가": purchase + evaluation + balance,
+                "수익률": ratio,
+                "현금 잔액": balance,
+            },
         )
 
-        ax2 = ax1.twinx()
-        ax2.fill_between(
-            self.__df["Date"],
-            self.__df["변동성"],
-            alpha=0.1,
-            color="blue",
-            label="변동성",
+    @staticmethod
+    def __run_ends(candidates: np.ndarray) -> np.ndarray:
+        """정렬된 신호 bar 번호마다 그 bar 가 속한 연속 구간의 마지막 bar 번호"""
+        if len(candidates) == 0:
+            return candidates
+        last = np.r_[np.flatnonzero(np.diff(candidates) != 1), len(candidates) - 1]
+        return candidates[last[np.searchsorted(last, np.arange(len(candidates)))]]
+
+    def summary(self) -> Dict[str, float]:
+        """백테스트 결과 요약(그림을 그리지 않고 지표만 계산)
+
+        Returns:
+            Dict[str, float]: 최종 평가금, 수익률(%), 최대 낙폭(%), CAGR(%), Sharpe, Sortino, 승률(%), 거래 수, 노출 비율(%)
+        """
+        return compute_metrics(self.__logger.evaluation, self.__initial_margin)
+
+    def monte_carlo(
+        self,
+        method: Literal["trades", "bars"] = "trades",
+        n_sims: int = 10_000,
+        block_size: Optional[int] = None,
+        horizon: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> pl.DataFrame:
+        """백테스트 결과의 거래/bar 수익률을 다시 뽑아 최종 평가금, MDD, 수면 아래 기간 분포를 계산
+
+        Args:
+            method (Literal["trades", "bars"], optional): 거래별 bootstrap 또는 bar 수익률 block bootstrap. Defaults to "trades".
+            n_sims (int, optional): 시뮬레이션 수. Defaults to 10,000.
+            block_size (Optional[int], optional): bars 의 block 길이. Defaults to 표본 수의 세제곱근.
+            horizon (Optional[int], optional): 경로 길이. Defaults to 표본 수.
+            seed (Optional[int], optional): 난수 시드. Defaults to None.
+
+        Returns:
+            pl.DataFrame: 시뮬레이션별 final_value, return, mdd, underwater (`summarize`로 요약)
+        """
+        from trading.utils.montecarlo import monte_carlo
+
+        return monte_carlo(
+            self.__logger.evaluation,
+            self.__initial_margin,
+            method=method,
+            n_sims=n_sims,
+            block_size=block_size,
+            horizon=horizon,
+            seed=seed,
         )
-        ax2.set_ylabel("변동성 (%)")
-        ax2.tick_params(axis="y")
-
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
-
-        # 두 번째 서브플롯 - 평가금
-        ax3.plot(
-            self.__logger.evaluation["Date"],
-            self.__logger.evaluation["총 평가"],
-            label="평가금",
-            color=PALETTE[i],
+
+    @staticmethod
+    def sweep(
+        strategy: Type[Strategy],
+        chart_data: pl.DataFrame,
+        param_grid: Dict[str, Iterable[Any]],
+        market_info: Dict[Literal["slippage", "fee"], float],
+        initial_margin: float,
+        ticker_name: str = "KRW-AVAX",
+        max_workers: Optional[int] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        is_progress: bool = False,
+    ) -> pl.DataFrame:
+        """파라미터 그리드 전체를 프로세스 풀에서 백테스트
+
+        Args:
+            strategy (Type[Strategy]): 전략 클래스
+            chart_data (pl.DataFrame): 차트 데이터
+            param_grid (Dict[str, Iterable[Any]]): 파라미터별 후보 값
+            market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
+            initial_margin (float): 초기 투자금
+            ticker_name (str, optional): 종목명. Defaults to "KRW-AVAX".
+            max_workers (Optional[int], optional): 프로세스 수. Defaults to CPU 코어 수.
+            where (Optional[Callable[[Dict[str, Any]], bool]], optional): 실행할 조합 필터. Defaults to None.
+            is_progress (bool, optional): 진행률 표시 여부. Defaults to False.
+
+        Returns:
+            pl.DataFrame: 조합별 파라미터와 last_value, mdd, return
+        """
+        from trading.sweep import sweep
+
+        return sweep(
+            strategy,
+            chart_data,
+            param_grid,
+            market_info,
+            initial_margin,
+            ticker_name=ticker_name,
+            max_workers=max_workers,
+            where=where,
+            is_progress=is_progress,
         )
-        ax3.set_xlabel("날짜")
-        ax3.set_ylabel("평가금 (KRW)")
-        ax3.tick_params(axis="y")
-        ax3.yaxis.set_major_formatter(
-            plt.FuncFormatter(lambda x, p: format(int(x), ","))
+
+    @staticmethod
+    def walk_forward(
+        strategy: Type[Strategy],
+        chart_data: pl.DataFrame,
+        param_grid: Dict[str, Iterable[Any]],
+        market_info: Dict[Literal["slippage", "fee"], float],
+        initial_margin: float,
+        train: str,
+        test: str,
+        step: Optional[str] = None,
+        anchored: bool = False,
+        metric: str = "return",
+        ticker_name: str = "KRW-AVAX",
+        max_workers: Optional[int] = None,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        is_progress: bool = False,
+    ) -> Tuple[pl.DataFrame, pl.DataFrame]:
+        """in-sample 최적화와 out-of-sample 평가를 fold 별로 프로세스 풀에서 실행
+
+        Args:
+            strategy (Type[Strategy]): 전략 클래스
+            chart_data (pl.DataFrame): 차트 데이터
+            param_grid (Dict[str, Iterable[Any]]): 파라미터별 후보 값
+            market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
+            initial_margin (float): 초기 투자금
+            train (str): in-sample 길이(예: "180d")
+            test (str): out-of-sample 길이(예: "30d")
+            step (Optional[str], optional): 다음 fold 까지 이동 간격(test 이상). Defaults to test.
+            anchored (bool, optional): in-sample 시작 고정 여부. Defaults to False.
+            metric (str, optional): 최적화 지표. Defaults to "return".
+            ticker_name (str, optional): 종목명. Defaults to "KRW-AVAX".
+            max_workers (Optional[int], optional): 프로세스 수. Defaults to CPU 코어 수.
+            where (Optional[Callable[[Dict[str, Any]], bool]], optional): 실행할 조합 필터. Defaults to None.
+            is_progress (bool, optional): 진행률 표시 여부. Defaults to False.
+
+        Returns:
+            Tuple[pl.DataFrame, pl.DataFrame]: fold 별 파라미터/지표, 이어 붙인 out-of-sample 평가금
+        """
+        from trading.walkforward import walk_forward
+
+        return walk_forward(
+            strategy,
+            chart_data,
+            param_grid,
+            market_info,
+            initial_margin,
+            train,
+            test,
+            step=step,
+            anchored=anchored,
+            metric=metric,
+            ticker_name=ticker_name,
+            max_workers=max_workers,
+            where=where,
+            is_progress=is_progress,
         )
-        ax3.legend(loc="upper left")
+
+    def get_result(
+        self,
+        file_name: Optional[str] = None,
+        output_dir: str = "data",
+        max_points: int = MAX_POINTS,
+    ) -> Optional[Dict[str, Any]]:
+        """결과 차트와 지표
+
+        `file_name`을 지정하면 화면 없이(Agg) `output_dir`에 PNG/HTML 리포트를 저장하고,
+        지정하지 않으면 pyplot 창으로 보여줍니다. 곡선은 LTTB 로 `max_points`개까지 줄여서 그립니다.
+
+        Example:
+            >>> engine.get_result("TestStrategy_KRW-BTC")  # data/TestStrategy_KRW-BTC.png, .html
+            >>> engine.get_result("result.png")  # data/result.png 만 저장
+
+        Args:
+            file_name (Optional[str], optional): 저장할 파일 이름(확장자가 없으면 png, html 모두 저장). Defaults to None.
+            output_dir (str, optional): 저장 디렉토리. Defaults to "data".
+            max_points (int, optional): 곡선 하나당 최대 점 수. Defaults to 2000.
+
+        Returns:
+            Optional[Dict[str, Any]]: 저장한 파일 경로(file_name, files)와 지표
+        """
+        # 제목에 슬리피지와 수수료율 표시
+        title = f"슬리피지: {self.__broker.slippage*100}%, 수수료율: {self.__broker.fee*100}%"
+        lines = {} if self.__tickers is not None else self.__strategy.description()
         if file_name is not None:
-            # plt.savefig(f"data/{file_name}")
-            cummax = self.__logger.evaluation.select(
-                pl.col("총 평가").cum_max()
-            ).get_column("총 평가")
-            drawdown = (
-                (self.__logger.evaluation["총 평가"] - cummax) / cummax * 100
-            ).alias("drawdown")
-            mdd = abs(
-                self.__logger.evaluation.with_columns(drawdown)
-                .get_column("drawdown")
-                .min()
+            metrics = self.summary()
+            files = write_report(
+                os.path.join(output_dir, file_name),
+                self.__df,
+                self.__logger.evaluation,
+                lines,
+                title,
+                metrics,
+                tickers=self.__tickers,
+                max_points=max_points,
             )
+            return {"file_name": files[0], "files": files, **metrics}
 
-            return {
-                "file_name": f"data/{file_name}",
-                "last_value": self.__logger.evaluation["총 평가"].tail(1).item(),
-                "mdd": mdd,
-            }
-        else:
-            plt.show()
-            return None
+        # matplotlib 은 import 가 무거우므로 결과를 그릴 때만 로드
+        import koreanize_matplotlib  # noqa: F401
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=FIGSIZE)
+        draw(
+            fig,
+            self.__df,
+            self.__logger.evaluation,
+            lines,
+            title,
+            tickers=self.__tickers,
+            max_points=max_points,
+        )
+        plt.show()
+        return None
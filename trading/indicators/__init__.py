@@ -0,0 +1,29 @@
+from .expressions import (
+    adx,
+    atr,
+    bollinger_bands,
+    by_names,
+    ema,
+    fibonacci,
+    macd,
+    rsi,
+    sma,
+    stochastic,
+    true_range,
+    vwap,
+    with_indicators,
+)
+from .streaming import (
+    ADX,
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    SMA,
+    VWAP,
+    BollingerBands,
+    RollingWindow,
+    Stochastic,
+    StreamingIndicator,
+)
+from .cache import IndicatorCache, indicator_cache
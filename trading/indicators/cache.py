@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import polars as pl
+
+from trading.indicators.expressions import with_indicators
+
+DEFAULT_MAX_BYTES = 512 * 1024**2  # 512MB
+
+
+class IndicatorCache:
+    """지표 계산 결과 캐시
+
+    (데이터 지문, 지표 이름, 파라미터)를 키로 계산된 컬럼을 메모리에 보관하고, 전체 크기가
+    `max_bytes`를 넘으면 가장 오래 사용하지 않은 항목부터 버립니다. `cache_dir`를 지정하면
+    Parquet 파일로도 저장해서 프로세스가 바뀌어도 재사용합니다.
+
+    데이터 지문은 지표가 읽는 입력 컬럼만으로 계산합니다. 컬럼마다 길이, null 수, 양 끝 값과
+    값의 비트를 더한 합과 위치 가중 합(2^64 나머지)을 쓰므로 행 해시보다 훨씬 싸고, 같은
+    DataFrame 객체는 한 번만 계산합니다.
+
+    Example:
+        >>> df = indicator_cache.with_columns(df, [sma(20), *bollinger_bands()])
+        >>> ma = indicator_cache.get(df, "ma", {"window": 20}, lambda: df.select(...))
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, cache_dir: Optional[str] = None
+    ):
+        """캐시 초기화
+
+        Args:
+            max_bytes (int, optional): 메모리 캐시 최대 크기(byte). Defaults to 512MB.
+            cache_dir (Optional[str], optional): Parquet 저장 경로. Defaults to None(메모리만 사용).
+        """
+        self.__max_bytes = max_bytes
+        self.__cache_dir = cache_dir
+        self.__entries: "OrderedDict[str, pl.DataFrame]" = OrderedDict()
+        self.__size = 0
+        self.__fingerprints: Dict[
+            int, Tuple[weakref.ref, Dict[Tuple[str, ...], str]]
+        ] = {}
+        self.__hits = 0
+        self.__misses = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        """메모리 캐시 크기(byte)"""
+        return self.__size
+
+    @property
+    def hits(self) -> int:
+        """캐시 적중 횟수"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """캐시 미스 횟수"""
+        return self.__misses
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def fingerprint(
+        self, df: pl.DataFrame, columns: Optional[Iterable[str]] = None
+    ) -> str:
+        """데이터 지문(컬럼 스키마와 컬럼별 요약값)
+
+        Args:
+            df (pl.DataFrame): 데이터
+            columns (Optional[Iterable[str]], optional): 지문에 넣을 컬럼. Defaults to 전체 컬럼.
+
+        Returns:
+            str: 데이터 지문
+        """
+        names = tuple(df.columns if columns is None else sorted(set(columns)))
+        memo = self.__fingerprints.get(id(df))
+        if memo is not None and memo[0]() is df:
+            fingerprint = memo[1].get(names)
+            if fingerprint is not None:
+                return fingerprint
+        else:
+            # DataFrame 이 사라지면 id 가 재사용될 수 있으므로 약한 참조로 함께 보관
+            memo = (
+                weakref.ref(df, lambda _, key=id(df): self.__fingerprints.pop(key, None)),
+                {},
+            )
+            self.__fingerprints[id(df)] = memo
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(len(df).to_bytes(8, "little"))
+        for name in names:
+            series = df.get_column(name)
+            digest.update(repr((name, series.dtype)).encode("utf-8"))
+            digest.update(self.__checksum(series))
+        fingerprint = memo[1][names] = digest.hexdigest()
+        return fingerprint
+
+    @staticmethod
+    def __checksum(series: pl.Series) -> bytes:
+        # 값의 비트를 64bit 정수로 보고 합과 위치 가중 합(overflow 는 2^64 나머지)을 계산
+        values = series.to_physical()
+        if values.dtype.is_float():
+            values = values.cast(pl.Float64)
+        elif values.dtype.is_integer() or values.dtype == pl.Boolean:
+            values = values.cast(pl.Int64)
+        else:
+            values = values.hash(seed=0)
+        bits = values.to_numpy().view(np.uint64)
+        weights = np.arange(1, len(bits) + 1, dtype=np.uint64)
+        summary = np.array(
+            [
+                series.null_count(),
+                bits.sum(dtype=np.uint64) if len(bits) else 0,
+                np.dot(bits, weights) if len(bits) else 0,
+                bits[0] if len(bits) else 0,
+                bits[-1] if len(bits) else 0,
+            ],
+            dtype=np.uint64,
+        )
+        return summary.tobytes()
+
+    @staticmethod
+    def key(fingerprint: str, name: str, params: Union[Dict[str, Any], bytes]) -> str:
+        """캐시 키(데이터 지문, 지표 이름, 파라미터의 해시)"""
+        if not isinstance(params, bytes):
+            params = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (fingerprint.encode("utf-8"), name.encode("utf-8"), params):
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def __load(self, key: str) -> Optional[pl.DataFrame]:
+        columns = self.__entries.get(key)
+        if columns is not None:
+            self.__entries.move_to_end(key)
+            return columns
+        if self.__cache_dir is not None:
+            path = os.path.join(self.__cache_dir, f"{key}.parquet")
+            if os.path.exists(path):
+                columns = pl.read_parquet(path)
+                self.__store(key, columns, persist=False)
+                return columns
+        return None
+
+    def __store(self, key: str, columns: pl.DataFrame, persist: bool = True):
+        if key in self.__entries:
+            self.__size -= self.__entries.pop(key).estimated_size()
+        self.__entries[key] = columns
+        self.__size += columns.estimated_size()
+        # 가장 오래 사용하지 않은 항목부터 삭제
+        while self.__size > self.__max_bytes and len(self.__entries) > 1:
+            _, evicted = self.__entries.popitem(last=False)
+            self.__size -= evicted.estimated_size()
+        if persist and self.__cache_dir is not None:
+            path = os.path.join(self.__cache_dir, f"{key}.parquet")
+            tmp_path = f"{path}.tmp"
+            columns.write_parquet(tmp_path)
+            os.replace(tmp_path, path)
+
+    def get(
+        self,
+        df: pl.DataFrame,
+        name: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Union[pl.DataFrame, pl.Series]],
+    ) -> pl.DataFrame:
+        """캐시된 지표 컬럼을 반환하고, 없으면 `compute`로 계산해서 저장합니다.
+
+        Args:
+            df (pl.DataFrame): 지표를 계산할 원본 데이터
+            name (str): 지표 이름
+            params (Dict[str, Any]): 지표 파라미터(JSON 으로 직렬화 가능한 값)
+            compute (Callable[[], Union[pl.DataFrame, pl.Series]]): 원본과 같은 길이의 지표 컬럼을 계산하는 함수
+
+        Returns:
+            pl.DataFrame: 지표 컬럼
+        """
+        key = self.key(self.fingerprint(df), name, params)
+        columns = self.__load(key)
+        if columns is not None:
+            self.__hits += 1
+            return columns
+        self.__misses += 1
+        columns = compute()
+        if isinstance(columns, pl.Series):
+            columns = columns.to_frame()
+        self.__store(key, columns)
+        return columns
+
+    def with_columns(self, df: pl.DataFrame, exprs: Iterable[pl.Expr]) -> pl.DataFrame:
+        """지표 식을 캐시를 거쳐 계산하고 원본에 컬럼으로 붙입니다.
+
+        식마다 (출력 컬럼 이름, 직렬화한 식)을 키로 쓰며, 다른 지표 컬럼을 참조하는 식은
+        참조하는 식의 키도 함께 반영합니다. 캐시에 없는 식만 한 번의 `with_indicators`로 계산합니다.
+
+        Args:
+            df (pl.DataFrame): 원본 데이터
+            exprs (Iterable[pl.Expr]): 지표 식 목록
+
+        Returns:
+            pl.DataFrame: 원본 + 지표 컬럼
+        """
+        exprs = list(exprs)
+        produced = {expr.meta.output_name() for expr in exprs}
+        # 지표 결과는 식이 읽는 원본 컬럼에만 의존하므로 그 컬럼만 지문에 넣음
+        fingerprint = self.fingerprint(
+            df,
+            {
+                root
+                for expr in exprs
+                for root in expr.meta.root_names()
+                if root in df.columns and root not in produced
+            },
+        )
+        keys: Dict[str, str] = {}
+        pending = list(range(len(exprs)))
+        while pending:
+            # 참조하는 지표 컬럼의 키가 먼저 정해져야 하므로 의존 순서대로 계산
+            remaining = []
+            for i in pending:
+                name = exprs[i].meta.output_name()
+                roots = [
+                    root
+                    for root in exprs[i].meta.root_names()
+                    if root in produced and root != name
+                ]
+                if any(root not in keys for root in roots):
+                    remaining.append(i)
+                    continue
+                params = exprs[i].meta.serialize() + "".join(
+                    keys[root] for root in roots
+                ).encode("utf-8")
+                keys[name] = self.key(fingerprint, name, params)
+            if len(remaining) == len(pending):
+                raise ValueError("지표 식 사이에 순환 참조가 있습니다.")
+            pending = remaining
+
+        cached: Dict[str, pl.DataFrame] = {}
+        missing: List[pl.Expr] = []
+        for expr in exprs:
+            name = expr.meta.output_name()
+            columns = self.__load(keys[name])
+            if columns is None:
+                missing.append(expr)
+            else:
+                cached[name] = columns
+
+        if missing:
+            # 캐시에 있는 컬럼을 참조하는 식도 있으므로 캐시된 컬럼을 붙인 뒤 계산
+            base = df.with_columns([columns.to_series() for columns in cached.values()])
+            computed = with_indicators(base, missing)
+            for expr in missing:
+                name = expr.meta.output_name()
+                cached[name] = computed.select(name)
+                self.__store(keys[name], cached[name])
+        self.__hits += len(exprs) - len(missing)
+        self.__misses += len(missing)
+        return df.with_columns(
+            [cached[expr.meta.output_name()].to_series() for expr in exprs]
+        )
+
+    def clear(self):
+        """메모리 캐시 전체 삭제(디스크 파일은 유지)"""
+        self.__entries.clear()
+        self.__size = 0
+
+
+indicator_cache = IndicatorCache()
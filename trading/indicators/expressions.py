@@ -0,0 +1,213 @@
+from typing import Dict, Iterable, List, Union
+
+import polars as pl
+
+FIBONACCI_RATIOS = {
+    "Fib_23.6%": 0.236,
+    "Fib_38.2%": 0.382,
+    "Fib_50.0%": 0.5,
+    "Fib_61.8%": 0.618,
+}
+
+
+def true_range(high: str = "high", low: str = "low", close: str = "close") -> pl.Expr:
+    """실제 범위(TR)
+
+    직전 종가가 없는 첫 bar 는 null 입니다(max_horizontal 은 null 을 건너뛰므로 명시적으로 처리).
+    """
+    prev_close = pl.col(close).shift(1)
+    return pl.when(prev_close.is_not_null()).then(
+        pl.max_horizontal(
+            pl.col(high) - pl.col(low),
+            (pl.col(high) - prev_close).abs(),
+            (pl.col(low) - prev_close).abs(),
+        )
+    )
+
+
+def sma(window: int, column: str = "close") -> pl.Expr:
+    """단순 이동평균(`SMA_{window}`)"""
+    return pl.col(column).rolling_mean(window_size=window).alias(f"SMA_{window}")
+
+
+def ema(span: int, column: str = "close") -> pl.Expr:
+    """지수 이동평균(adjust=False, `EMA_{span}`)"""
+    return pl.col(column).ewm_mean(span=span, adjust=False).alias(f"EMA_{span}")
+
+
+def bollinger_bands(
+    window: int = 20, num_std: float = 2, column: str = "close"
+) -> List[pl.Expr]:
+    """볼린저 밴드(`Bollinger_Mid`, `Bollinger_Std`, `Bollinger_Upper`, `Bollinger_Lower`)
+
+    이동평균과 표준편차를 한 번만 계산하도록 상단/하단은 앞의 두 컬럼을 참조합니다.
+    `with_indicators`로 계산하거나 `with_columns`를 두 번 나눠 적용해야 합니다.
+    """
+    mid = pl.col("Bollinger_Mid")
+    std = pl.col("Bollinger_Std")
+    return [
+        pl.col(column).rolling_mean(window_size=window).alias("Bollinger_Mid"),
+        pl.col(column).rolling_std(window_size=window).alias("Bollinger_Std"),
+        (mid + num_std * std).alias("Bollinger_Upper"),
+        (mid - num_std * std).alias("Bollinger_Lower"),
+    ]
+
+
+def rsi(window: int = 14, column: str = "close") -> pl.Expr:
+    """상대강도지수(상승폭/하락폭의 단순 이동평균 기준, `RSI`)"""
+    delta = pl.col(column).diff()
+    gain = pl.when(delta > 0).then(delta).otherwise(0.0)
+    loss = pl.when(delta < 0).then(-delta).otherwise(0.0)
+    rs = gain.rolling_mean(window_size=window) / loss.rolling_mean(window_size=window)
+    return (100 - 100 / (1 + rs)).alias("RSI")
+
+
+def macd(
+    short_window: int = 12,
+    long_window: int = 26,
+    signal_window: int = 9,
+    column: str = "close",
+) -> List[pl.Expr]:
+    """MACD 선, 신호선, 히스토그램(`MACD`, `MACD_Signal`, `MACD_Hist`)
+
+    신호선과 히스토그램은 앞의 컬럼을 참조합니다(`with_indicators`로 계산).
+    """
+    line = pl.col(column).ewm_mean(span=short_window, adjust=False) - pl.col(
+        column
+    ).ewm_mean(span=long_window, adjust=False)
+    return [
+        line.alias("MACD"),
+        pl.col("MACD").ewm_mean(span=signal_window, adjust=False).alias("MACD_Signal"),
+        (pl.col("MACD") - pl.col("MACD_Signal")).alias("MACD_Hist"),
+    ]
+
+
+def stochastic(k_window: int = 14, d_window: int = 3) -> List[pl.Expr]:
+    """스토캐스틱(`%K`, `%D`)
+
+    `%D`는 `%K` 컬럼을 참조합니다(`with_indicators`로 계산).
+    """
+    lowest = pl.col("low").rolling_min(window_size=k_window)
+    highest = pl.col("high").rolling_max(window_size=k_window)
+    return [
+        (100 * (pl.col("close") - lowest) / (highest - lowest)).alias("%K"),
+        pl.col("%K").rolling_mean(window_size=d_window).alias("%D"),
+    ]
+
+
+def vwap() -> pl.Expr:
+    """누적 거래량 가중 평균 가격(`VWAP`)"""
+    return (
+        (pl.col("close") * pl.col("volume")).cum_sum() / pl.col("volume").cum_sum()
+    ).alias("VWAP")
+
+
+def fibonacci() -> List[pl.Expr]:
+    """전체 구간 고가/저가 기준 피보나치 되돌림(`Fib_23.6%` ~ `Fib_100%`)"""
+    max_price = pl.col("high").max()
+    min_price = pl.col("low").min()
+    return [
+        (max_price - (max_price - min_price) * ratio).alias(name)
+        for name, ratio in FIBONACCI_RATIOS.items()
+    ] + [min_price.alias("Fib_100%")]
+
+
+def atr(window: int = 14) -> pl.Expr:
+    """평균 실제 범위(`ATR`)"""
+    return true_range().rolling_mean(window_size=window).alias("ATR")
+
+
+def adx(window: int = 14) -> pl.Expr:
+    """평균 방향 지수(`ADX`)
+
+    +DI 와 -DI 는 같은 TR 이동평균으로 나누므로 DX 에서는 TR 이 약분됩니다.
+    +DM/-DM 이동합만으로 DX 를 구하고, TR 이 없는 첫 bar 는 제외해서 창 위치를 맞춥니다.
+    """
+    up = pl.col("high").diff()
+    down = -pl.col("low").diff()
+    has_prev = pl.col("close").shift(1).is_not_null()
+    plus_dm = pl.when(has_prev).then(
+        pl.when(up > down).then(up.clip(lower_bound=0)).otherwise(0.0)
+    )
+    minus_dm = pl.when(has_prev).then(
+        pl.when(down > up).then(down.clip(lower_bound=0)).otherwise(0.0)
+    )
+    plus = plus_dm.rolling_sum(window_size=window)
+    minus = minus_dm.rolling_sum(window_size=window)
+    dx = 100 * (plus - minus).abs() / (plus + minus)
+    return dx.rolling_mean(window_size=window).alias("ADX")
+
+
+def by_names(names: Iterable[str]) -> List[pl.Expr]:
+    """지표 컬럼 이름으로 식 목록을 만듭니다.
+
+    같은 식에서 나오는 컬럼(예: `Bollinger_Upper`와 `Bollinger_Lower`)은 한 번만 추가합니다.
+
+    Args:
+        names (Iterable[str]): `SMA_20`, `Bollinger_Upper`, `RSI`, `MACD`, `ATR`, `VWAP`, `ADX`, `%K`, `Fib_50.0%` 등
+
+    Returns:
+        List[pl.Expr]: `with_columns`에 넘길 식 목록
+    """
+    exprs: Dict[str, pl.Expr] = {}
+
+    def add(items: Union[pl.Expr, List[pl.Expr]]):
+        for expr in items if isinstance(items, list) else [items]:
+            exprs.setdefault(expr.meta.output_name(), expr)
+
+    for name in names:
+        if name.startswith("SMA_"):
+            add(sma(int(name.split("_")[1])))
+        elif name.startswith("EMA_"):
+            add(ema(int(name.split("_")[1])))
+        elif name in ("Bollinger_Upper", "Bollinger_Lower"):
+            add(bollinger_bands())
+        elif name == "RSI":
+            add(rsi())
+        elif name in ("MACD", "MACD_Signal", "MACD_Hist"):
+            add(macd())
+        elif name in ("%K", "%D"):
+            add(stochastic())
+        elif name == "VWAP":
+            add(vwap())
+        elif name.startswith("Fib_"):
+            add(fibonacci())
+        elif name == "ATR":
+            add(atr())
+        elif name == "ADX":
+            add(adx())
+        else:
+            raise ValueError(f"유효하지 않은 지표: {name}")
+    return list(exprs.values())
+
+
+def with_indicators(
+    df: Union[pl.DataFrame, pl.LazyFrame], exprs: Iterable[pl.Expr]
+) -> pl.DataFrame:
+    """여러 지표를 한 lazy plan 으로 계산합니다.
+
+    다른 지표 컬럼을 참조하는 식(예: `%D`, `Bollinger_Upper`)은 참조하는 컬럼이 만들어진 뒤의
+    `with_columns` 단계에 배치하고, 같은 단계의 식은 함께 실행되며 공통 부분식 제거가 적용됩니다.
+
+    Example:
+        >>> df = with_indicators(df, [sma(20), *bollinger_bands(), atr(), adx()])
+    """
+    lf = df.lazy()
+    available = set(lf.collect_schema().names())
+    pending = list(exprs)
+    while pending:
+        ready = [
+            i
+            for i, expr in enumerate(pending)
+            if set(expr.meta.root_names()) <= available
+        ]
+        if not ready:
+            missing = {
+                name for expr in pending for name in expr.meta.root_names()
+            } - available
+            raise ValueError(f"존재하지 않는 컬럼: {sorted(missing)}")
+        layer = [pending[i] for i in ready]
+        lf = lf.with_columns(layer)
+        available |= {expr.meta.output_name() for expr in layer}
+        pending = [expr for i, expr in enumerate(pending) if i not in ready]
+    return lf.collect(comm_subexpr_elim=True)
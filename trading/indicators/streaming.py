@@ -0,0 +1,353 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Mapping, Optional, Tuple
+
+import polars as pl
+
+NAN = float("nan")
+
+
+def _div(a: float, b: float) -> float:
+    # polars/numpy 와 같은 IEEE 나눗셈(0 으로 나누면 inf 또는 nan)
+    if b == 0:
+        if a == 0 or math.isnan(a):
+            return NAN
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return a / b
+
+
+class RollingWindow:
+    """고정 길이 링 버퍼 위의 이동 합/평균
+
+    값이 들어오고 나갈 때마다 합을 갱신하므로 bar 당 O(1)입니다(분할 상환).
+    nan 이 창 안에 하나라도 있으면 평균은 nan 입니다(pandas/polars 와 동일).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window는 1 이상이어야 합니다.")
+        self.__window = window
+        self.__values = [0.0] * window
+        self.__pos = 0
+        self.__count = 0
+        self.__nan = 0
+        self.__sum = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        return self.__count == self.__window
+
+    @property
+    def mean(self) -> Optional[float]:
+        if not self.is_ready:
+            return None
+        if self.__nan > 0:
+            return NAN
+        return self.__sum / self.__window
+
+    def push(self, value: float) -> Optional[float]:
+        if self.is_ready:
+            old = self.__values[self.__pos]
+            if math.isnan(old):
+                self.__nan -= 1
+            else:
+                self.__sum -= old
+        else:
+            self.__count += 1
+        self.__values[self.__pos] = value
+        self.__pos = (self.__pos + 1) % self.__window
+        if math.isnan(value):
+            self.__nan += 1
+        else:
+            self.__sum += value
+        if self.__pos == 0:
+            # 뺄셈 누적 오차가 쌓이지 않도록 한 바퀴마다 합을 다시 계산(분할 상환 O(1))
+            self.__sum = math.fsum(v for v in self.__values if not math.isnan(v))
+        return self.mean
+
+
+class StreamingIndicator(ABC):
+    """bar 하나씩 O(1)로 갱신되는 지표
+
+    `columns`에 적힌 컬럼을 bar 에서 읽어 상태를 갱신합니다. 창이 다 차기 전에는 None 을
+    반환하고, 이후 값은 같은 정의의 polars 일괄 계산 결과와 같습니다.
+
+    Example:
+        >>> sma = SMA(20)
+        >>> sma.warmup(history)  # 과거 차트로 상태 채우기
+        >>> value = sma.update({"close": 61500000.0})  # 새 캔들마다 호출
+    """
+
+    columns: Tuple[str, ...] = ("close",)
+
+    def __init__(self):
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        """마지막으로 계산된 값"""
+        return self._value
+
+    @abstractmethod
+    def _push(self, *values: float) -> Any:
+        pass
+
+    def update(self, bar: Mapping[str, Any]) -> Any:
+        """새 bar 로 상태를 갱신하고 현재 값을 반환합니다.
+
+        Args:
+            bar (Mapping[str, Any]): `columns`에 해당하는 값이 들어있는 bar
+
+        Returns:
+            Any: 지표 값(워밍업 중에는 None)
+        """
+        self._value = self._push(*(float(bar[column]) for column in self.columns))
+        return self._value
+
+    def warmup(self, df: pl.DataFrame) -> Any:
+        """과거 차트 전체를 순서대로 반영합니다.
+
+        Args:
+            df (pl.DataFrame): 과거 차트 데이터
+
+        Returns:
+            Any: 마지막 bar 기준 지표 값
+        """
+        columns = [df[column].cast(pl.Float64).to_list() for column in self.columns]
+        for values in zip(*columns):
+            self._value = self._push(*values)
+        return self._value
+
+
+class SMA(StreamingIndicator):
+    """단순 이동평균"""
+
+    def __init__(self, window: int, column: str = "close"):
+        super().__init__()
+        self.columns = (column,)
+        self.__window = RollingWindow(window)
+
+    def _push(self, value: float) -> Optional[float]:
+        return self.__window.push(value)
+
+
+class EMA(StreamingIndicator):
+    """지수 이동평균(adjust=False, 첫 값부터 시작)"""
+
+    def __init__(self, span: int, column: str = "close"):
+        super().__init__()
+        self.columns = (column,)
+        self.__alpha = 2 / (span + 1)
+        self.__ema: Optional[float] = None
+
+    def _push(self, value: float) -> float:
+        if self.__ema is None:
+            self.__ema = value
+        else:
+            self.__ema += self.__alpha * (value - self.__ema)
+        return self.__ema
+
+
+class RSI(StreamingIndicator):
+    """상대강도지수(상승폭/하락폭의 단순 이동평균 기준)"""
+
+    def __init__(self, window: int = 14, column: str = "close"):
+        super().__init__()
+        self.columns = (column,)
+        self.__gain = RollingWindow(window)
+        self.__loss = RollingWindow(window)
+        self.__prev: Optional[float] = None
+
+    def _push(self, close: float) -> Optional[float]:
+        delta = 0.0 if self.__prev is None else close - self.__prev
+        self.__prev = close
+        avg_gain = self.__gain.push(delta if delta > 0 else 0.0)
+        avg_loss = self.__loss.push(-delta if delta < 0 else 0.0)
+        if avg_gain is None:
+            return None
+        return 100 - _div(100, 1 + _div(avg_gain, avg_loss))
+
+
+class MACD(StreamingIndicator):
+    """MACD 선, 신호선, 히스토그램
+
+    `update`는 (macd, signal, hist) 튜플을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        short_window: int = 12,
+        long_window: int = 26,
+        signal_window: int = 9,
+        column: str = "close",
+    ):
+        super().__init__()
+        self.columns = (column,)
+        self.__short = EMA(short_window, column)
+        self.__long = EMA(long_window, column)
+        self.__signal = EMA(signal_window)
+
+    def _push(self, close: float) -> Tuple[float, float, float]:
+        macd = self.__short._push(close) - self.__long._push(close)
+        signal = self.__signal._push(macd)
+        return macd, signal, macd - signal
+
+
+class BollingerBands(StreamingIndicator):
+    """볼린저 밴드(표본 표준편차)
+
+    창에서 빠지는 값과 들어오는 값으로 평균과 제곱편차 합을 갱신(Welford)하므로
+    가격이 커도 합/제곱합 방식처럼 자릿수가 손실되지 않습니다.
+    `update`는 (mid, upper, lower) 튜플을 반환합니다.
+    """
+
+    def __init__(self, window: int = 20, num_std: float = 2, column: str = "close"):
+        super().__init__()
+        if window < 2:
+            raise ValueError("window는 2 이상이어야 합니다.")
+        self.columns = (column,)
+        self.__window = window
+        self.__num_std = num_std
+        self.__values: Deque[float] = deque()
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__pushed = 0
+
+    def _push(self, close: float) -> Optional[Tuple[float, float, float]]:
+        self.__values.append(close)
+        if len(self.__values) <= self.__window:
+            delta = close - self.__mean
+            self.__mean += delta / len(self.__values)
+            self.__m2 += delta * (close - self.__mean)
+        else:
+            old = self.__values.popleft()
+            mean = self.__mean + (close - old) / self.__window
+            self.__m2 += (close - old) * (close - mean + old - self.__mean)
+            self.__mean = mean
+            self.__pushed += 1
+            if self.__pushed % self.__window == 0:
+                # 오차가 쌓이지 않도록 한 바퀴마다 두 번 순회 방식으로 다시 계산(분할 상환 O(1))
+                self.__mean = math.fsum(self.__values) / self.__window
+                self.__m2 = math.fsum((v - self.__mean) ** 2 for v in self.__values)
+        if len(self.__values) < self.__window:
+            return None
+        std = math.sqrt(max(self.__m2, 0.0) / (self.__window - 1))
+        return (
+            self.__mean,
+            self.__mean + self.__num_std * std,
+            self.__mean - self.__num_std * std,
+        )
+
+
+class ATR(StreamingIndicator):
+    """평균 실제 범위(실제 범위의 단순 이동평균)
+
+    실제 범위는 직전 종가가 필요하므로 두 번째 bar 부터 계산됩니다.
+    """
+
+    columns = ("high", "low", "close")
+
+    def __init__(self, window: int = 14):
+        super().__init__()
+        self.__tr = RollingWindow(window)
+        self.__prev_close: Optional[float] = None
+
+    def _push(self, high: float, low: float, close: float) -> Optional[float]:
+        prev_close, self.__prev_close = self.__prev_close, close
+        if prev_close is None:
+            return None
+        return self.__tr.push(
+            max(high - low, abs(high - prev_close), abs(low - prev_close))
+        )
+
+
+class ADX(StreamingIndicator):
+    """평균 방향 지수
+
+    +DM/-DM 과 실제 범위의 단순 이동평균으로 +DI/-DI 를 구하고, DX 의 단순 이동평균을
+    반환합니다.
+    """
+
+    columns = ("high", "low", "close")
+
+    def __init__(self, window: int = 14):
+        super().__init__()
+        self.__tr = RollingWindow(window)
+        self.__plus_dm = RollingWindow(window)
+        self.__minus_dm = RollingWindow(window)
+        self.__dx = RollingWindow(window)
+        self.__prev: Optional[Tuple[float, float, float]] = None
+
+    def _push(self, high: float, low: float, close: float) -> Optional[float]:
+        prev, self.__prev = self.__prev, (high, low, close)
+        if prev is None:
+            return None
+        prev_high, prev_low, prev_close = prev
+        up, down = high - prev_high, prev_low - low
+        tr = self.__tr.push(
+            max(high - low, abs(high - prev_close), abs(low - prev_close))
+        )
+        plus_dm = self.__plus_dm.push(max(up, 0.0) if up > down else 0.0)
+        minus_dm = self.__minus_dm.push(max(down, 0.0) if down > up else 0.0)
+        if tr is None:
+            return None
+        plus_di = 100 * _div(plus_dm, tr)
+        minus_di = 100 * _div(minus_dm, tr)
+        dx = 100 * _div(abs(plus_di - minus_di), plus_di + minus_di)
+        return self.__dx.push(dx)
+
+
+class Stochastic(StreamingIndicator):
+    """스토캐스틱 %K, %D
+
+    창 안의 최저가/최고가는 단조 deque 로 관리해서 bar 당 O(1)(분할 상환)입니다.
+    `update`는 (%K, %D) 튜플을 반환하며 %D 는 창이 차기 전까지 None 입니다.
+    """
+
+    columns = ("high", "low", "close")
+
+    def __init__(self, k_window: int = 14, d_window: int = 3):
+        super().__init__()
+        self.__k_window = k_window
+        self.__d = RollingWindow(d_window)
+        self.__highs: Deque[Tuple[int, float]] = deque()
+        self.__lows: Deque[Tuple[int, float]] = deque()
+        self.__i = 0
+
+    def _push(
+        self, high: float, low: float, close: float
+    ) -> Optional[Tuple[float, Optional[float]]]:
+        i = self.__i
+        self.__i += 1
+        while self.__highs and self.__highs[-1][1] <= high:
+            self.__highs.pop()
+        self.__highs.append((i, high))
+        while self.__lows and self.__lows[-1][1] >= low:
+            self.__lows.pop()
+        self.__lows.append((i, low))
+        if self.__highs[0][0] <= i - self.__k_window:
+            self.__highs.popleft()
+        if self.__lows[0][0] <= i - self.__k_window:
+            self.__lows.popleft()
+        if self.__i < self.__k_window:
+            return None
+        highest, lowest = self.__highs[0][1], self.__lows[0][1]
+        k = 100 * _div(close - lowest, highest - lowest)
+        return k, self.__d.push(k)
+
+
+class VWAP(StreamingIndicator):
+    """누적 거래량 가중 평균 가격"""
+
+    columns = ("close", "volume")
+
+    def __init__(self):
+        super().__init__()
+        self.__price_volume = 0.0
+        self.__volume = 0.0
+
+    def _push(self, close: float, volume: float) -> float:
+        self.__price_volume += close * volume
+        self.__volume += volume
+        return _div(self.__price_volume, self.__volume)
@@ -1,6 +1,8 @@
 from .logger import Logger
 from .market_info import MarketInfo
-from .order import Order
+from .order import ORDER_TYPES, Order
+from .order_book import OrderBook
 from .position import Position
+from .row_view import RowView
 from .target import add_target, get_active_targets, get_all_targets
 from .transaction import Transaction
@@ -1,17 +1,95 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import polars as pl
 
 
 class Logger:
-    def __init__(self):
-        self.__evaluation = pl.DataFrame()
+    """백테스팅 평가 정보 기록기
+
+    매 tick마다 DataFrame을 만들어 이어붙이지 않고, 컬럼별 NumPy 버퍼에 값을 기록한 뒤
+    `evaluation`을 읽을 때 한 번만 polars DataFrame으로 변환합니다.
+    버퍼가 가득 차면 용량을 2배씩 늘립니다.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """로거 초기화
+
+        Args:
+            capacity (int, optional): 미리 할당할 행 수(보통 차트 길이). Defaults to 1024.
+        """
+        self.__capacity = max(int(capacity), 1)
+        self.__size = 0
+        self.__dates: List[Any] = []
+        self.__date_chunks: List[pl.Series] = []
+        self.__columns: Dict[str, np.ndarray] = {}
+        self.__evaluation: Optional[pl.DataFrame] = None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __grow(self, required: int):
+        capacity = self.__capacity
+        while capacity < required:
+            capacity *= 2
+        for key, buffer in self.__columns.items():
+            grown = np.full(capacity, np.nan, dtype=np.float64)
+            grown[: self.__size] = buffer[: self.__size]
+            self.__columns[key] = grown
+        self.__capacity = capacity
+
+    def __buffer(self, key: str) -> np.ndarray:
+        buffer = self.__columns.get(key)
+        if buffer is None:
+            buffer = np.full(self.__capacity, np.nan, dtype=np.float64)
+            self.__columns[key] = buffer
+        return buffer
 
     def add_info(self, info: Dict[str, Any], date: str):
-        df = pl.DataFrame({"Date": date, **info})
-        df = df.with_columns(pl.col("*").exclude("Date").cast(pl.Float64))
-        self.__evaluation = pl.concat([self.__evaluation, df])
+        if self.__size >= self.__capacity:
+            self.__grow(self.__size + 1)
+        i = self.__size
+        for key, value in info.items():
+            self.__buffer(key)[i] = value
+        self.__dates.append(date)
+        self.__size = i + 1
+        self.__evaluation = None
+
+    def extend(self, dates: pl.Series, info: Dict[str, np.ndarray]):
+        """여러 bar의 평가 정보를 한 번에 기록
+
+        Args:
+            dates (pl.Series): 날짜 컬럼
+            info (Dict[str, np.ndarray]): 컬럼별 값(길이는 dates와 동일)
+        """
+        n = len(dates)
+        if self.__size + n > self.__capacity:
+            self.__grow(self.__size + n)
+        start, end = self.__size, self.__size + n
+        for key, values in info.items():
+            self.__buffer(key)[start:end] = values
+        if self.__dates:
+            self.__date_chunks.append(pl.Series("Date", self.__dates))
+            self.__dates = []
+        self.__date_chunks.append(dates.alias("Date"))
+        self.__size = end
+        self.__evaluation = None
 
     @property
     def evaluation(self) -> pl.DataFrame:
+        if self.__evaluation is None:
+            if self.__size == 0:
+                self.__evaluation = pl.DataFrame()
+            else:
+                n = self.__size
+                dates = self.__date_chunks + (
+                    [pl.Series("Date", self.__dates)] if self.__dates else []
+                )
+                self.__evaluation = pl.DataFrame(
+                    [pl.concat(dates) if len(dates) > 1 else dates[0]]
+                    + [
+                        pl.Series(key, buffer[:n], dtype=pl.Float64)
+                        for key, buffer in self.__columns.items()
+                    ]
+                )
         return self.__evaluation
@@ -1,12 +1,13 @@
 class MarketInfo:
-    def __init__(self, slippage: float, fee: float):
-        self.__slippage = slippage
-        self.__fee = fee
+    """시장 정보
+
+    Attributes:
+        slippage (float): 슬리피지
+        fee (float): 거래수수료
+    """
 
-    @property
-    def slippage(self):
-        return self.__slippage
+    __slots__ = ("slippage", "fee")
 
-    @property
-    def fee(self):
-        return self.__fee
+    def __init__(self, slippage: float, fee: float):
+        self.slippage = slippage
+        self.fee = fee
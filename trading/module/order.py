@@ -1,58 +1,57 @@
 from typing import Literal
 
+ORDER_TYPES = ("market", "limit", "stop", "take_profit")
+
 
 class Order:
+    """주문
+
+    bar 마다 여러 번 만들고 읽으므로 `__slots__` 속성으로 보관합니다.
+
+    주문 종류별 체결 조건(`price`는 지정가 또는 감시 가격):
+
+    - market: 다음 bar 의 체결 기준 가격(기본 종가)에 체결
+    - limit: 매수는 가격이 `price` 이하, 매도는 `price` 이상이 되면 `price`에 체결
+    - stop: 매수는 가격이 `price` 이상, 매도는 `price` 이하가 되면 시장가로 체결(손절/돌파)
+    - take_profit: 매도는 가격이 `price` 이상, 매수는 `price` 이하가 되면 `price`에 체결(익절)
+
+    Attributes:
+        ticker_name (str): 종목명
+        action (Literal["buy", "sell"]): 주문 종류
+        quantity (int): 주문 수량
+        order_price (float): 주문 가격
+        realized_price (float): 체결 가격
+        fee (float): 수수료
+        order_type (Literal["market", "limit", "stop", "take_profit"]): 주문 유형
+    """
+
+    __slots__ = (
+        "ticker_name",
+        "action",
+        "quantity",
+        "order_price",
+        "realized_price",
+        "fee",
+        "order_type",
+    )
+
     def __init__(
         self,
         action: Literal["buy", "sell"],
         quantity: int,
         price: float,
         ticker_name: str,
+        order_type: Literal["market", "limit", "stop", "take_profit"] = "market",
     ):
-        self.__action = action
-        self.__ticker_name = ticker_name
-        self.__quantity = quantity
-        self.__realized_price = price
-        self.__order_price = price
-        self.__fee = 0.05
-
-    @property
-    def ticker_name(self) -> str:
-        """종목명"""
-        return self.__ticker_name
-
-    @property
-    def action(self) -> Literal["buy", "sell"]:
-        """주문 종류"""
-        return self.__action
-
-    @property
-    def quantity(self) -> int:
-        """주문 수량"""
-        return self.__quantity
-
-    @property
-    def order_price(self) -> float:
-        """주문 가격"""
-        return self.__order_price
-
-    @property
-    def realized_price(self) -> float:
-        """체결 가격"""
-        return self.__realized_price
-
-    @realized_price.setter
-    def realized_price(self, price: float):
-        self.__realized_price = price
-
-    @property
-    def fee(self) -> float:
-        """수수료"""
-        return self.__fee
-
-    @fee.setter
-    def fee(self, fee: float):
-        self.__fee = fee
+        if order_type not in ORDER_TYPES:
+            raise ValueError(f"지원하지 않는 주문 유형입니다: {order_type}")
+        self.action = action
+        self.ticker_name = ticker_name
+        self.quantity = quantity
+        self.realized_price = price
+        self.order_price = price
+        self.fee = 0.05
+        self.order_type = order_type
 
     def __str__(self) -> str:
-        return f"action : {self.action}, quantity : {self.quantity}, ticker_name : {self.ticker_name}, order_price : {self.order_price}, realized_price : {self.realized_price}, fee : {self.fee}"
+        return f"action : {self.action}, order_type : {self.order_type}, quantity : {self.quantity}, ticker_name : {self.ticker_name}, order_price : {self.order_price}, realized_price : {self.realized_price}, fee : {self.fee}"
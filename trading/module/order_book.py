@@ -0,0 +1,93 @@
+import heapq
+from collections import deque
+from typing import Deque, List, Tuple
+
+from .order import Order
+
+
+class OrderBook:
+    """종목별 미체결 주문장
+
+    시장가 주문은 들어온 순서대로 deque 에 두고, 지정가/스탑/익절 주문은 감시 가격 기준 힙 두 개에
+    나눠 둡니다.
+
+    - rising: 가격이 올라 감시 가격에 닿으면 체결되는 주문(매도 지정가/익절, 매수 스탑). 낮은 가격이 먼저.
+    - falling: 가격이 내려 감시 가격에 닿으면 체결되는 주문(매수 지정가/익절, 매도 스탑). 높은 가격이 먼저.
+
+    bar 마다 힙의 맨 앞만 확인하므로 체결되지 않는 주문이 많아도 bar 당 비용은 체결된 주문 수에
+    비례합니다(주문 하나당 O(log n)).
+    """
+
+    __slots__ = ("market", "__rising", "__falling", "__sequence")
+
+    def __init__(self):
+        self.market: Deque[Order] = deque()
+        self.__rising: List[Tuple[float, int, Order]] = []
+        self.__falling: List[Tuple[float, int, Order]] = []
+        self.__sequence = 0  # 같은 가격이면 먼저 들어온 주문부터
+
+    def __len__(self) -> int:
+        return len(self.market) + len(self.__rising) + len(self.__falling)
+
+    def __bool__(self) -> bool:
+        # bar 마다 호출되므로 길이를 더하지 않고 바로 확인
+        return bool(self.market or self.__rising or self.__falling)
+
+    @property
+    def has_resting(self) -> bool:
+        """지정가/스탑/익절 주문 존재 여부"""
+        return bool(self.__rising) or bool(self.__falling)
+
+    def push(self, order: Order):
+        """주문 추가"""
+        if order.order_type == "market":
+            self.market.append(order)
+            return
+        self.__sequence += 1
+        price = order.order_price
+        if (order.action == "buy") == (order.order_type == "stop"):
+            heapq.heappush(self.__rising, (price, self.__sequence, order))
+        else:
+            heapq.heappush(self.__falling, (-price, self.__sequence, order))
+
+    def pop_market(self) -> List[Order]:
+        """시장가 주문 전체(들어온 순서)"""
+        orders = list(self.market)
+        self.market.clear()
+        return orders
+
+    def pop_touched(self, price: float) -> List[Tuple[float, Order]]:
+        """`price`에서 이미 조건을 만족하는 주문(시가 갭 등)을 들어온 순서대로 꺼냄"""
+        touched = []
+        rising, falling = self.__rising, self.__falling
+        while rising and rising[0][0] <= price:
+            touched.append(heapq.heappop(rising))
+        while falling and -falling[0][0] >= price:
+            touched.append(heapq.heappop(falling))
+        touched.sort(key=lambda item: item[1])
+        return [(price, order) for _, _, order in touched]
+
+    def pop_crossed(self, start: float, end: float) -> List[Tuple[float, Order]]:
+        """가격이 `start`에서 `end`로 움직이는 동안 조건을 만족하는 주문을 닿는 순서대로 꺼냄
+
+        Returns:
+            List[Tuple[float, Order]]: (감시 가격, 주문) 목록
+        """
+        crossed = []
+        if end > start:
+            rising = self.__rising
+            while rising and rising[0][0] <= end:
+                price, _, order = heapq.heappop(rising)
+                crossed.append((max(price, start), order))
+        elif end < start:
+            falling = self.__falling
+            while falling and -falling[0][0] >= end:
+                price, _, order = heapq.heappop(falling)
+                crossed.append((min(-price, start), order))
+        return crossed
+
+    def clear(self):
+        """미체결 주문 전체 취소"""
+        self.market.clear()
+        self.__rising.clear()
+        self.__falling.clear()
@@ -1,10 +1,22 @@
-from typing import Any, Dict, Literal
+from operator import mul
+from typing import Any, Dict, List, Literal
 
 
 class Position:
+    """보유 종목 현황
+
+    종목마다 dict 를 두지 않고 종목명을 정수 id 로 바꿔 현재 가격/보유 수량/누적 매수 금액을
+    각각 하나의 리스트(struct-of-arrays)에 보관합니다.
+    """
+
+    __slots__ = ("__balance", "__index", "__prices", "__counts", "__amounts")
+
     def __init__(self):
         self.__balance = 0.0
-        self.__target_coin = {}
+        self.__index: Dict[str, int] = {}  # 종목명 -> id
+        self.__prices: List[float] = []
+        self.__counts: List[float] = []
+        self.__amounts: List[float] = []
 
     def add(
         self,
@@ -21,11 +33,16 @@ class Position:
             count (float): 보유 수량
             amount (float): 누적 매수 금액
         """
-        self.__target_coin[ticker_name] = {
-            "current_price": current_price,
-            "count": count,
-            "amount": amount,
-        }
+        i = self.__index.get(ticker_name)
+        if i is None:
+            self.__index[ticker_name] = len(self.__prices)
+            self.__prices.append(current_price)
+            self.__counts.append(count)
+            self.__amounts.append(amount)
+        else:
+            self.__prices[i] = current_price
+            self.__counts[i] = count
+            self.__amounts[i] = amount
 
     def update(
         self,
@@ -36,21 +53,25 @@ class Position:
     ):
         """투자종목 최신화
 
+        매수는 체결 금액/수량을 더하고, 매도는 평균 단가 기준으로 매수 금액을 줄입니다.
+        보유 수량 이상을 팔면 포지션을 비웁니다.
+
         Args:
-            amount (float): 누적 매수 금액
-            count (float): 보유 수량
+            amount (float): 체결 금액
+            count (float): 체결 수량
             ticker_name (str): 종목명
             action (Literal["buy", "sell"]): 거래 종류
         """
+        i = self.__index[ticker_name]
         if action == "buy":
-            self.__target_coin[ticker_name]["amount"] = amount
-            self.__target_coin[ticker_name]["count"] = count
+            self.__amounts[i] += amount
+            self.__counts[i] += count
+        elif count >= self.__counts[i]:
+            self.__amounts[i] = 0.0
+            self.__counts[i] = 0.0
         else:
-            self.__target_coin[ticker_name]["amount"] -= (
-                self.__target_coin[ticker_name]["amount"]
-                / self.__target_coin[ticker_name]["count"]
-            ) * count
-            self.__target_coin[ticker_name]["count"] -= count
+            self.__amounts[i] -= (self.__amounts[i] / self.__counts[i]) * count
+            self.__counts[i] -= count
 
     def update_price(self, price: float, ticker_name: str):
         """투자종목 최신화
@@ -59,7 +80,7 @@ class Position:
             price (float): 현재 가격
             ticker_name (str): 종목명
         """
-        self.__target_coin[ticker_name]["current_price"] = price
+        self.__prices[self.__index[ticker_name]] = price
 
     @property
     def balance(self):
@@ -73,11 +94,14 @@ class Position:
     def balance(self, value: float):
         self.__balance = value
 
+    def __contains__(self, ticker_name: str) -> bool:
+        return ticker_name in self.__index
+
     def has_position(self, ticker_name: str) -> bool:
-        return self.__target_coin[ticker_name]["count"] > 0
+        return self.__counts[self.__index[ticker_name]] > 0
 
     def get_count(self, ticker_name: str) -> float:
-        return self.__target_coin[ticker_name]["count"]
+        return self.__counts[self.__index[ticker_name]]
 
     def summary(self) -> Dict[str, Any]:
         """포트폴리오 요약
@@ -85,19 +109,16 @@ class Position:
         Returns:
             Dict[str, Any]: 포트폴리오 요약
         """
-        total_purchase = sum(info["amount"] for info in self.__target_coin.values())
-        total_evaluation = sum(
-            info["current_price"] * info["count"]
-            for info in self.__target_coin.values()
-        )
+        total_purchase = sum(self.__amounts)
+        total_evaluation = sum(map(mul, self.__prices, self.__counts))
         return {
             "총 매수": total_purchase,
             "평가손익": total_evaluation,
-            "총 평가": total_purchase + total_evaluation + self.balance,
+            "총 평가": total_purchase + total_evaluation + self.__balance,
             "수익률": (
                 (total_evaluation - total_purchase) / total_purchase * 100
                 if total_purchase != 0
                 else 0
             ),
-            "현금 잔액": self.balance,
+            "현금 잔액": self.__balance,
         }
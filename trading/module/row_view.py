@@ -0,0 +1,79 @@
+from typing import Any, Dict, Iterator, List, Mapping
+
+import polars as pl
+
+
+class RowView(Mapping):
+    """차트의 한 bar 를 가리키는 재사용 가능한 읽기 전용 Mapping
+
+    bar 마다 dict 를 만들지 않고 `index`만 옮겨서 `view["close"]`처럼 현재 bar 의 값을 읽습니다.
+    차트 컬럼은 처음 읽을 때 한 번만 파이썬 리스트로 변환하며, 차트에 없는 값(잔고, 보유 수량 등)은
+    `view[key] = value`로 넣어 같은 객체로 함께 넘길 수 있습니다. 같은 이름이면 차트 컬럼이 우선합니다.
+
+    `index`를 옮기면 값이 바뀌므로, bar 를 넘어 보관하려면 `dict(view)`로 복사해야 합니다.
+
+    Example:
+        >>> view = RowView(df)
+        >>> view["balance"] = 1000000.0
+        >>> for i in range(len(df)):
+        ...     view.index = i
+        ...     strategy.execute(view)
+    """
+
+    __slots__ = ("index", "__df", "__names", "__columns", "__values")
+
+    def __init__(self, df: pl.DataFrame, index: int = 0):
+        """뷰 초기화
+
+        Args:
+            df (pl.DataFrame): 차트 데이터
+            index (int, optional): 가리킬 bar 번호. Defaults to 0.
+        """
+        self.index = index
+        self.__df = df
+        self.__names = frozenset(df.columns)
+        self.__columns: Dict[str, List[Any]] = {}
+        self.__values: Dict[str, Any] = {}
+
+    def column(self, name: str) -> List[Any]:
+        """차트 컬럼 전체(파이썬 리스트, 처음 호출할 때 변환)"""
+        column = self.__columns.get(name)
+        if column is None:
+            column = self.__columns[name] = self.__df.get_column(name).to_list()
+        return column
+
+    def __getitem__(self, key: str) -> Any:
+        column = self.__columns.get(key)
+        if column is not None:
+            return column[self.index]
+        try:
+            return self.__values[key]
+        except KeyError:
+            if key not in self.__names:
+                raise
+        return self.column(key)[self.index]
+
+    def __setitem__(self, key: str, value: Any):
+        # 차트 컬럼과 이름이 같은 값은 차트 컬럼이 우선하므로 보관하지 않음
+        if key not in self.__names:
+            self.__values[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        column = self.__columns.get(key)
+        if column is not None:
+            return column[self.index]
+        if key in self.__values:
+            return self.__values[key]
+        if key in self.__names:
+            return self.column(key)[self.index]
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__names or key in self.__values
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.__df.columns
+        yield from self.__values
+
+    def __len__(self) -> int:
+        return len(self.__names) + len(self.__values)
@@ -1,9 +1,14 @@
 # -*- coding:utf-8 -*-
-from datetime import datetime
+import asyncio
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
-import pyupbit
-from tenacity import retry, stop_after_attempt
+import fire
+import httpx
+import polars as pl
+from tenacity import retry, stop_after_attempt, wait_exponential
 from tqdm import tqdm
 
 now = datetime.now()
@@ -21,22 +26,229 @@ COIN_MAP = {
     "KRW-SUI": ("2024-11-29", now.strftime("%Y-%m-%d")),
 }
 
+UPBIT_API_URL = "https://api.upbit.com"
+KST = timezone(timedelta(hours=9))
+CANDLE_LIMIT = 200  # 캔들 API 1회 최대 조회 개수
+COLUMNS = ["Date", "open", "high", "low", "close", "volume", "value"]
 
-@retry(stop=stop_after_attempt(3))
-def get_data(coin, date):
-    res = pyupbit.get_ohlcv(coin, interval="minute1", to=date, count=60 * 24)
-    if res is None:
-        raise Exception("Empty")
-    return res
-
-
-for coin, (start, end) in COIN_MAP.items():
-    df = []
-    for date in tqdm(pd.date_range(start=start, end=end), desc=coin):
-        date = date.strftime("%Y%m%d")
-        res = get_data(coin, date)
-        df.append(res)
-    df = pd.concat(df)
-    df["Date"] = df.index.strftime("%Y-%m-%d %H:%M:%S")
-    df = df[["Date", "open", "high", "low", "close", "volume", "value"]]
-    df.to_parquet(f"{coin}_{start}_{end}.parquet", index=False, compression="brotli")
+
+class TokenBucket:
+    """초당 요청 수 제한기
+
+    `rate`개/초 속도로 토큰이 채워지고 최대 `capacity`개까지 쌓입니다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = float(capacity)
+        self.__updated = time.monotonic()
+        self.__lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.__lock:
+            while True:
+                now = time.monotonic()
+                self.__tokens = min(
+                    self.__capacity,
+                    self.__tokens + (now - self.__updated) * self.__rate,
+                )
+                self.__updated = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.__tokens) / self.__rate)
+
+
+class Scraper:
+    """업비트 1분봉 수집기
+
+    (종목, 일자) 단위로 동시에 수집하고, 하루치가 끝날 때마다
+    `{out_dir}/{종목}/{YYYY-MM-DD}.parquet`로 저장합니다. 다시 실행하면 이미 저장된
+    일자는 건너뛰므로 중단된 지점부터 이어서 수집합니다(아직 끝나지 않은 당일은 매번 다시 수집).
+
+    Example:
+        $ python -m trading.module.scrap run
+        $ python -m trading.module.scrap run --coins="[KRW-BTC]" --start=2024-01-01 --end=2024-06-30
+    """
+
+    def __init__(
+        self,
+        out_dir: str = os.path.join("data", "ohlcv"),
+        concurrency: int = 4,
+        rate: float = 10.0,
+        burst: int = 10,
+        base_url: str = UPBIT_API_URL,
+    ):
+        """수집기 초기화
+
+        Args:
+            out_dir (str, optional): 일자별 Parquet 저장 경로. Defaults to "data/ohlcv".
+            concurrency (int, optional): 동시에 수집하는 일자 수. Defaults to 4.
+            rate (float, optional): 초당 요청 수(업비트 캔들 API 기준 10회/초). Defaults to 10.0.
+            burst (int, optional): 순간 최대 요청 수. Defaults to 10.
+            base_url (str, optional): API 주소. Defaults to "https://api.upbit.com".
+        """
+        self.__out_dir = out_dir
+        self.__concurrency = concurrency
+        self.__rate = rate
+        self.__burst = burst
+        self.__base_url = base_url
+
+    def partition_path(self, coin: str, day: date) -> str:
+        return os.path.join(self.__out_dir, coin, f"{day.isoformat()}.parquet")
+
+    def is_completed(self, coin: str, day: date) -> bool:
+        """저장이 끝난 일자인지 여부(당일은 항상 미완료)"""
+        return day < datetime.now(KST).date() and os.path.exists(
+            self.partition_path(coin, day)
+        )
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=0.5, max=10),
+        reraise=True,
+    )
+    async def __get_candles(
+        self, client: httpx.AsyncClient, limiter: TokenBucket, coin: str, to: str
+    ) -> List[Dict]:
+        await limiter.acquire()
+        res = await client.get(
+            "/v1/candles/minutes/1",
+            params={"market": coin, "to": to, "count": CANDLE_LIMIT},
+        )
+        res.raise_for_status()
+        return res.json()
+
+    async def fetch_day(
+        self,
+        client: httpx.AsyncClient,
+        limiter: TokenBucket,
+        coin: str,
+        day: date,
+    ) -> pl.DataFrame:
+        """하루치(KST 00:00 ~ 24:00) 1분봉 조회"""
+        day_start = f"{day.isoformat()}T00:00:00"
+        to = f"{(day + timedelta(days=1)).isoformat()}T00:00:00+09:00"
+        rows = []
+        while True:
+            candles = await self.__get_candles(client, limiter, coin, to)
+            rows.extend(c for c in candles if c["candle_date_time_kst"] >= day_start)
+            if len(candles) < CANDLE_LIMIT:
+                break
+            oldest = candles[-1]["candle_date_time_kst"]
+            if oldest <= day_start:
+                break
+            to = f"{oldest}+09:00"
+        df = pl.DataFrame(
+            {
+                "Date": [c["candle_date_time_kst"].replace("T", " ") for c in rows],
+                "open": [c["opening_price"] for c in rows],
+                "high": [c["high_price"] for c in rows],
+                "low": [c["low_price"] for c in rows],
+                "close": [c["trade_price"] for c in rows],
+                "volume": [c["candle_acc_trade_volume"] for c in rows],
+                "value": [c["candle_acc_trade_price"] for c in rows],
+            },
+            schema={
+                "Date": pl.Utf8,
+                **{column: pl.Float64 for column in COLUMNS[1:]},
+            },
+        )
+        return df.unique(subset=["Date"]).sort("Date")
+
+    def __save(self, df: pl.DataFrame, coin: str, day: date):
+        path = self.partition_path(coin, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        try:
+            df.write_parquet(tmp_path, compression="brotli")
+            os.replace(tmp_path, path)
+        finally:
+            # 쓰다 만 임시 파일은 남기지 않음(완료된 partition 은 교체 전까지 그대로)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    async def scrape(self, jobs: List[Tuple[str, date]]):
+        """(종목, 일자) 목록을 동시에 수집해서 일자별로 저장"""
+        limiter = TokenBucket(self.__rate, self.__burst)
+        semaphore = asyncio.Semaphore(self.__concurrency)
+
+        async with httpx.AsyncClient(base_url=self.__base_url, timeout=10.0) as client:
+
+            async def job(coin: str, day: date):
+                async with semaphore:
+                    df = await self.fetch_day(client, limiter, coin, day)
+                    self.__save(df, coin, day)
+
+            tasks = [asyncio.create_task(job(coin, day)) for coin, day in jobs]
+            try:
+                for task in tqdm(
+                    asyncio.as_completed(tasks), total=len(tasks), desc="수집 진행률"
+                ):
+                    await task
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    def merge(self, coin: str, start: date, end: date) -> Optional[str]:
+        """일자별 Parquet 를 `{종목}_{시작일}_{종료일}.parquet` 하나로 병합"""
+        paths = [
+            self.partition_path(coin, start + timedelta(days=i))
+            for i in range((end - start).days + 1)
+        ]
+        paths = [path for path in paths if os.path.exists(path)]
+        if not paths:
+            return None
+        file_path = os.path.join(
+            self.__out_dir, f"{coin}_{start.isoformat()}_{end.isoformat()}.parquet"
+        )
+        pl.concat([pl.read_parquet(path) for path in paths]).select(
+            COLUMNS
+        ).write_parquet(file_path, compression="brotli")
+        return file_path
+
+    def run(
+        self,
+        coins: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        merge: bool = True,
+    ):
+        """수집 실행
+
+        Args:
+            coins (Optional[List[str]], optional): 종목 목록. Defaults to COIN_MAP 전체.
+            start (Optional[str], optional): 시작일자(YYYY-MM-DD). Defaults to COIN_MAP 기준.
+            end (Optional[str], optional): 종료일자(YYYY-MM-DD). Defaults to COIN_MAP 기준.
+            merge (bool, optional): 종목별 단일 Parquet 병합 여부. Defaults to True.
+        """
+        ranges: Dict[str, Tuple[date, date]] = {}
+        for coin in coins or list(COIN_MAP.keys()):
+            default_start, default_end = COIN_MAP.get(coin, (None, None))
+            coin_start, coin_end = start or default_start, end or default_end
+            if coin_start is None or coin_end is None:
+                raise ValueError(f"{coin}의 수집 기간을 지정해주세요.")
+            ranges[coin] = (
+                date.fromisoformat(str(coin_start)),
+                date.fromisoformat(str(coin_end)),
+            )
+
+        jobs = [
+            (coin, coin_start + timedelta(days=i))
+            for coin, (coin_start, coin_end) in ranges.items()
+            for i in range((coin_end - coin_start).days + 1)
+        ]
+        pending = [(coin, day) for coin, day in jobs if not self.is_completed(coin, day)]
+        print(f"{len(jobs) - len(pending)}/{len(jobs)} 일자는 이미 수집되어 건너뜁니다.")
+        asyncio.run(self.scrape(pending))
+
+        if merge:
+            for coin, (coin_start, coin_end) in ranges.items():
+                file_path = self.merge(coin, coin_start, coin_end)
+                if file_path is not None:
+                    print(f"{coin}: {file_path}")
+
+
+if __name__ == "__main__":
+    fire.Fire(Scraper)
@@ -1,3 +1,57 @@
+from typing import Any, Dict, Literal
+
+
 class Transaction:
-    def __init__(self):
-        pass
+    """체결(또는 거부) 내역
+
+    Attributes:
+        date (Any): 체결 bar 의 시각
+        ticker_name (str): 종목명
+        action (Literal["buy", "sell"]): 주문 종류
+        order_type (str): 주문 유형
+        quantity (float): 체결 수량
+        price (float): 체결 가격(슬리피지 반영)
+        amount (float): 체결 금액(가격 * 수량)
+        fee (float): 수수료 금액
+        status (Literal["filled", "rejected"]): 체결 여부(잔고나 보유 수량이 부족하면 거부)
+    """
+
+    __slots__ = (
+        "date",
+        "ticker_name",
+        "action",
+        "order_type",
+        "quantity",
+        "price",
+        "amount",
+        "fee",
+        "status",
+    )
+
+    def __init__(
+        self,
+        date: Any,
+        ticker_name: str,
+        action: Literal["buy", "sell"],
+        order_type: str,
+        quantity: float,
+        price: float,
+        amount: float,
+        fee: float,
+        status: Literal["filled", "rejected"] = "filled",
+    ):
+        self.date = date
+        self.ticker_name = ticker_name
+        self.action = action
+        self.order_type = order_type
+        self.quantity = quantity
+        self.price = price
+        self.amount = amount
+        self.fee = fee
+        self.status = status
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __str__(self) -> str:
+        return f"date : {self.date}, ticker_name : {self.ticker_name}, action : {self.action}, order_type : {self.order_type}, quantity : {self.quantity}, price : {self.price}, amount : {self.amount}, fee : {self.fee}, status : {self.status}"
@@ -1,67 +1,66 @@
-import importlib
-import inspect
-import os
-from typing import List, Type
-
-from .base import Strategy
-from .test import TestStrategy
-
-
-def search_strategies(strategy_name: str) -> Type[Strategy]:
-    # 현재 디렉토리의 경로
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # .py 파일들을 찾습니다 (base.py 제외)
-    for file in os.listdir(current_dir):
-        if file.endswith(".py") and file != "base.py" and file != "__init__.py":
-            # 파일 이름에서 .py 확장자 제거
-            module_name = file[:-3]
-            # 모듈을 동적으로 임포트
-            module = importlib.import_module(
-                f".{module_name}", package="trading.strategy"
-            )
-
-            # 모듈에서 Strategy를 상속받은 클래스들을 찾습니다
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, Strategy)
-                    and obj != Strategy
-                ):
-                    if obj.__name__ == strategy_name:
-                        return obj
-    raise ValueError(f"전략 {strategy_name}은 존재하지 않습니다.")
-
-
-def get_all_strategies(load_strategy: bool = True) -> List[Type[Strategy]]:
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+from .registry import StrategyRegistry, registry
+
+if TYPE_CHECKING:
+    from .base import Strategy
+
+
+def search_strategies(strategy_name: str) -> Type["Strategy"]:
+    """이름으로 전략 클래스를 찾습니다.
+
+    캐시된 인덱스에서 전략이 정의된 모듈을 찾아 그 모듈만 import 합니다.
+
+    Args:
+        strategy_name (str): 전략 클래스 이름
+
+    Raises:
+        ValueError: 전략이 존재하지 않는 경우
+
+    Returns:
+        Type[Strategy]: 전략 클래스
+    """
+    return registry.load(strategy_name)
+
+
+def get_strategy_infos() -> List[Dict[str, Any]]:
+    """전략 모듈을 import 하지 않고 전략 메타데이터(name, module, path, doc, ready)를 반환합니다.
+
+    Returns:
+        List[Dict[str, Any]]: 전략별 메타데이터
+    """
+    return list(registry.index().values())
+
+
+def get_all_strategies(load_strategy: bool = True) -> List[Type["Strategy"]]:
     """trading/strategy 디렉토리에 있는 모든 전략 클래스를 반환합니다.
 
+    모든 전략 모듈을 import 하므로 이름이나 설명만 필요하면 `get_strategy_infos`를 사용합니다.
+
     Returns:
         List[Type[Strategy]]: Strategy 클래스들의 리스트
     """
-    strategies: List[Type[Strategy]] = []
-    # 현재 디렉토리의 경로
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # .py 파일들을 찾습니다 (base.py 제외)
-    for file in os.listdir(current_dir):
-        if file.endswith(".py") and file != "base.py" and file != "__init__.py":
-            # 파일 이름에서 .py 확장자 제거
-            module_name = file[:-3]
-            # 모듈을 동적으로 임포트
-            module = importlib.import_module(
-                f".{module_name}", package="trading.strategy"
-            )
-
-            # 모듈에서 Strategy를 상속받은 클래스들을 찾습니다
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, Strategy)
-                    and obj != Strategy
-                ):
-                    if load_strategy:
-                        strategies.append(obj())
-                    else:
-                        strategies.append(obj)
+    strategies: List[Type["Strategy"]] = []
+    for strategy_name in registry.names():
+        obj = registry.load(strategy_name)
+        if load_strategy:
+            strategies.append(obj())
+        else:
+            strategies.append(obj)
     return strategies
+
+
+def __getattr__(name: str):
+    # `from trading.strategy import TestStrategy`처럼 접근할 때 해당 모듈만 import
+    # (Strategy 도 polars 를 로드하므로 처음 접근할 때 import)
+    if name == "Strategy":
+        from .base import Strategy
+
+        return Strategy
+    if not name.startswith("__") and name in registry.index():
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), "Strategy", *registry.names()])
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import polars as pl
 
@@ -31,3 +31,18 @@ class Strategy(ABC):
     @abstractmethod
     def update(self, chart_data: pl.DataFrame) -> pl.DataFrame:
         pass
+
+    def signals(self, df: pl.DataFrame) -> Optional[pl.DataFrame]:
+        """벡터화 백테스트용 진입/청산 신호
+
+        신호를 컬럼 연산으로 표현할 수 있는 전략은 `update`가 반환한 차트와 같은 길이의
+        `entry`, `exit` 불리언 컬럼을 반환합니다. `entry`가 False인 bar에서는 미보유 상태의
+        `execute`가, `exit`가 False인 bar에서는 보유 상태의 `execute`가 주문을 내지 않아야 합니다.
+
+        Args:
+            df (pl.DataFrame): `update`가 반환한 차트 데이터
+
+        Returns:
+            Optional[pl.DataFrame]: 신호 컬럼. None이면 벡터화 실행을 지원하지 않습니다.
+        """
+        return None
@@ -0,0 +1,218 @@
+import ast
+import importlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+STRATEGY_DIR = os.path.dirname(os.path.abspath(__file__))
+STRATEGY_PACKAGE = "trading.strategy"
+# 작업 디렉토리와 관계없이 같은 인덱스를 쓰도록 패키지 디렉토리 기준으로 저장
+DEFAULT_INDEX_PATH = os.path.join(STRATEGY_DIR, "__pycache__", "strategies.json")
+# 전략이 아닌 패키지 내부 모듈
+EXCLUDED_FILES = {"__init__.py", "base.py", "registry.py"}
+BASE_CLASS_NAME = "Strategy"
+
+
+class StrategyRegistry:
+    """전략 이름 → 모듈 인덱스
+
+    전략 파일을 import 하지 않고 AST 로 읽어서 `Strategy`를 상속한 클래스의 이름, 모듈,
+    설명(docstring), `ready` 기본값을 인덱스로 만듭니다. 인덱스는 파일별 수정 시각(mtime), 크기와
+    함께 `index_path`에 저장하고, 수정된 파일만 다시 읽습니다.
+
+    Example:
+        >>> registry = StrategyRegistry()
+        >>> registry.index()["TestStrategy"]["module"]
+        'test'
+        >>> strategy = registry.load("TestStrategy")  # trading.strategy.test 만 import
+    """
+
+    def __init__(
+        self,
+        strategy_dir: str = STRATEGY_DIR,
+        index_path: Optional[str] = DEFAULT_INDEX_PATH,
+    ):
+        """인덱스 초기화
+
+        Args:
+            strategy_dir (str, optional): 전략 디렉토리. Defaults to trading/strategy.
+            index_path (Optional[str], optional): 인덱스 저장 경로. Defaults to trading/strategy/__pycache__/strategies.json(None 이면 메모리만 사용).
+        """
+        self.__strategy_dir = strategy_dir
+        self.__index_path = index_path
+        self.__files: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__index: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__lock = threading.Lock()
+
+    def __read_files(self) -> Dict[str, Dict[str, Any]]:
+        if self.__index_path is None or not os.path.exists(self.__index_path):
+            return {}
+        try:
+            with open(self.__index_path, "r", encoding="utf-8") as f:
+                files = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if files.get("strategy_dir") != self.__strategy_dir:
+            return {}
+        return files.get("files", {})
+
+    def __write_files(self):
+        if self.__index_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.__index_path) or ".", exist_ok=True)
+            tmp_path = f"{self.__index_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"strategy_dir": self.__strategy_dir, "files": self.__files},
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            os.replace(tmp_path, self.__index_path)
+        except OSError:
+            # 읽기 전용 환경에서는 메모리 인덱스만 사용
+            pass
+
+    @staticmethod
+    def __parse(path: str) -> List[Dict[str, Any]]:
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                tree = ast.parse(f.read(), filename=path)
+            except SyntaxError:
+                return []
+        classes = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [
+                base.id if isinstance(base, ast.Name) else base.attr
+                for base in node.bases
+                if isinstance(base, (ast.Name, ast.Attribute))
+            ]
+            doc = ast.get_docstring(node) or ""
+            classes.append(
+                {
+                    "name": node.name,
+                    "bases": bases,
+                    "doc": doc.split("\n")[0].strip(),
+                    "ready": StrategyRegistry.__ready_default(node),
+                }
+            )
+        return classes
+
+    @staticmethod
+    def __ready_default(node: ast.ClassDef) -> Optional[bool]:
+        # __init__(self, ..., ready=<상수>) 의 기본값(없으면 상위 클래스 값을 따름)
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+                args = item.args.args
+                defaults = item.args.defaults
+                for arg, default in zip(args[len(args) - len(defaults) :], defaults):
+                    if arg.arg == "ready" and isinstance(default, ast.Constant):
+                        return bool(default.value)
+                for arg, default in zip(item.args.kwonlyargs, item.args.kw_defaults):
+                    if arg.arg == "ready" and isinstance(default, ast.Constant):
+                        return bool(default.value)
+        return None
+
+    def __refresh(self) -> bool:
+        if self.__files is None:
+            self.__files = self.__read_files()
+        changed = False
+        seen = set()
+        for entry in os.scandir(self.__strategy_dir):
+            if not entry.name.endswith(".py") or entry.name in EXCLUDED_FILES:
+                continue
+            seen.add(entry.name)
+            stat = entry.stat()
+            cached = self.__files.get(entry.name)
+            if (
+                cached is not None
+                and cached["mtime"] == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size
+            ):
+                continue
+            self.__files[entry.name] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "classes": self.__parse(entry.path),
+            }
+            changed = True
+        for name in set(self.__files) - seen:
+            del self.__files[name]
+            changed = True
+        return changed
+
+    def __build(self) -> Dict[str, Dict[str, Any]]:
+        classes = {
+            cls["name"]: {**cls, "module": file_name[:-3]}
+            for file_name, entry in sorted(self.__files.items())
+            for cls in entry["classes"]
+        }
+        # Strategy 를 직접 또는 다른 전략을 거쳐 상속한 클래스만 전략으로 취급
+        index: Dict[str, Dict[str, Any]] = {}
+        while True:
+            found = {
+                name: cls
+                for name, cls in classes.items()
+                if name not in index
+                and any(b == BASE_CLASS_NAME or b in index for b in cls["bases"])
+            }
+            if not found:
+                break
+            for name, cls in found.items():
+                ready = cls["ready"]
+                if ready is None:
+                    parents = [index[b] for b in cls["bases"] if b in index]
+                    ready = parents[0]["ready"] if parents else False
+                index[name] = {
+                    "name": name,
+                    "module": cls["module"],
+                    "path": os.path.join(self.__strategy_dir, f"{cls['module']}.py"),
+                    "doc": cls["doc"],
+                    "ready": ready,
+                }
+        return dict(sorted(index.items(), key=lambda item: item[1]["module"]))
+
+    def index(self) -> Dict[str, Dict[str, Any]]:
+        """전략 이름별 메타데이터(module, path, doc, ready)
+
+        전략 모듈은 import 하지 않으며, 파일이 바뀐 경우에만 해당 파일을 다시 읽습니다.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {전략 이름: 메타데이터}
+        """
+        with self.__lock:
+            changed = self.__refresh()
+            if changed:
+                self.__write_files()
+            if changed or self.__index is None:
+                self.__index = self.__build()
+            return self.__index
+
+    def names(self) -> List[str]:
+        """전략 이름 목록"""
+        return list(self.index().keys())
+
+    def load(self, strategy_name: str):
+        """전략 클래스를 반환합니다(해당 전략 모듈만 import).
+
+        Args:
+            strategy_name (str): 전략 클래스 이름
+
+        Raises:
+            ValueError: 전략이 존재하지 않는 경우
+
+        Returns:
+            Type[Strategy]: 전략 클래스
+        """
+        info = self.index().get(strategy_name)
+        if info is None:
+            raise ValueError(f"전략 {strategy_name}은 존재하지 않습니다.")
+        module = importlib.import_module(f".{info['module']}", package=STRATEGY_PACKAGE)
+        return getattr(module, strategy_name)
+
+
+registry = StrategyRegistry()
@@ -1,7 +1,8 @@
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Optional
 
 import polars as pl
 
+from trading.indicators import IndicatorCache
 from trading.module import Order
 from trading.strategy.base import Strategy
 
@@ -17,19 +18,24 @@ class TestStrategy(Strategy):
         ready (bool): 전략 실행 준비 상태
         _config (Dict[Literal["short_ma", "long_ma"], int]): 전략 설정 파라미터
         _df (pl.DataFrame): 차트 데이터
+        _cache (Optional[IndicatorCache]): 이동평균 캐시(None 이면 매번 계산)
 
     Example:
         >>> config = {"short_ma": 5, "long_ma": 20}
         >>> strategy = TestStrategy(config)
         >>> orders = strategy.execute(state_dict)
+        >>> # 같은 차트로 파라미터만 바꿔 여러 번 실행할 때는 캐시 사용
+        >>> strategy = TestStrategy(config, cache=indicator_cache)
     """
 
     def __init__(
         self,
         config: Dict[Literal["short_ma", "long_ma"], int] = {},
         ready=True,
+        cache: Optional[IndicatorCache] = None,
     ):
         super().__init__(config, ready=ready)
+        self._cache = cache
 
     def description(self) -> Dict[str, str]:
         short_ma = self._config["short_ma"]
@@ -68,6 +74,9 @@ class TestStrategy(Strategy):
         if ma_n > ma_m and not position:
             price = price * (1 + slippage)
             fee = price * fee
+            if balance <= fee:
+                # 수수료도 낼 수 없으면 수량을 줄여도 살 수 없음
+                quantity = 0
             while balance < (price * quantity + fee) and quantity > 0:
                 if quantity >= 1:
                     quantity = quantity - 1
@@ -95,18 +104,27 @@ class TestStrategy(Strategy):
 
         return orders
 
+    def signals(self, df: pl.DataFrame) -> pl.DataFrame:
+        ma_n = pl.col(f"ma{self._config['short_ma']}")
+        ma_m = pl.col(f"ma{self._config['long_ma']}")
+        return df.select(
+            (ma_n > ma_m).fill_null(False).alias("entry"),
+            (ma_n < ma_m).fill_null(False).alias("exit"),
+        )
+
     def update(self, df: pl.DataFrame) -> pl.DataFrame:
         short_ma = self._config["short_ma"]
         long_ma = self._config["long_ma"]
 
-        df = df.with_columns(
-            [
-                pl.col("close")
-                .rolling_mean(window_size=short_ma)
-                .alias(f"ma{short_ma}"),
-                pl.col("close").rolling_mean(window_size=long_ma).alias(f"ma{long_ma}"),
-            ]
-        )
+        exprs = [
+            pl.col("close").rolling_mean(window_size=short_ma).alias(f"ma{short_ma}"),
+            pl.col("close").rolling_mean(window_size=long_ma).alias(f"ma{long_ma}"),
+        ]
+        if self._cache is not None:
+            # 같은 차트로 파라미터만 바꿔 실행할 때 이동평균을 다시 계산하지 않도록 캐시 사용
+            df = self._cache.with_columns(df, exprs)
+        else:
+            df = df.with_columns(exprs)
         df = df.with_columns(
             ((pl.col("high") - pl.col("low")) / pl.col("open") * 100).alias("변동성")
         )
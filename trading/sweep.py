@@ -0,0 +1,121 @@
+import itertools
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Type
+
+import polars as pl
+from tqdm import tqdm
+
+from trading.engine import Engine
+from trading.strategy import Strategy
+
+# 워커 프로세스마다 한 번만 memory map 으로 열어두는 차트 데이터
+_chart_data: Optional[pl.DataFrame] = None
+
+
+def expand_grid(param_grid: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """파라미터 그리드를 조합 목록으로 펼칩니다.
+
+    Args:
+        param_grid (Dict[str, Iterable[Any]]): 파라미터별 후보 값
+
+    Returns:
+        List[Dict[str, Any]]: 파라미터 조합 목록
+
+    Example:
+        >>> expand_grid({"short_ma": [5, 10], "long_ma": [20]})
+        [{'short_ma': 5, 'long_ma': 20}, {'short_ma': 10, 'long_ma': 20}]
+    """
+    keys = list(param_grid.keys())
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(list(v) for v in param_grid.values()))
+    ]
+
+
+def _init_worker(path: str):
+    global _chart_data
+    _chart_data = pl.read_ipc(path, memory_map=True)
+
+
+def _run_config(
+    task: Tuple[
+        Type[Strategy],
+        Dict[str, Any],
+        Dict[Literal["slippage", "fee"], float],
+        float,
+        str,
+    ],
+) -> Dict[str, Any]:
+    strategy, config, market_info, initial_margin, ticker_name = task
+    engine = Engine(
+        strategy=strategy,
+        chart_data=_chart_data,
+        strategy_config=config,
+        market_info=market_info,
+        initial_margin=initial_margin,
+    )
+    engine.run_vectorized(ticker_name=ticker_name)
+    return {**config, **engine.summary()}
+
+
+def sweep(
+    strategy: Type[Strategy],
+    chart_data: pl.DataFrame,
+    param_grid: Dict[str, Iterable[Any]],
+    market_info: Dict[Literal["slippage", "fee"], float],
+    initial_margin: float,
+    ticker_name: str = "KRW-AVAX",
+    max_workers: Optional[int] = None,
+    where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    is_progress: bool = False,
+) -> pl.DataFrame:
+    """파라미터 그리드 전체를 프로세스 풀에서 백테스트
+
+    차트 데이터는 Arrow IPC 파일로 한 번만 기록하고, 각 워커는 시작할 때 이를
+    memory map 으로 열어 재사용하므로 작업마다 차트를 pickle 하지 않습니다.
+
+    Args:
+        strategy (Type[Strategy]): 전략 클래스
+        chart_data (pl.DataFrame): 차트 데이터
+        param_grid (Dict[str, Iterable[Any]]): 파라미터별 후보 값
+        market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
+        initial_margin (float): 초기 투자금
+        ticker_name (str, optional): 종목명. Defaults to "KRW-AVAX".
+        max_workers (Optional[int], optional): 프로세스 수. Defaults to CPU 코어 수.
+        where (Optional[Callable[[Dict[str, Any]], bool]], optional): 실행할 조합 필터. Defaults to None.
+        is_progress (bool, optional): 진행률 표시 여부. Defaults to False.
+
+    Returns:
+        pl.DataFrame: 조합별 파라미터와 last_value, mdd, return (수익률 내림차순)
+    """
+    configs = expand_grid(param_grid)
+    if where is not None:
+        configs = [config for config in configs if where(config)]
+    if not configs:
+        return pl.DataFrame()
+    tasks = [
+        (strategy, config, market_info, initial_margin, ticker_name)
+        for config in configs
+    ]
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+
+    with tempfile.TemporaryDirectory(prefix="sweep-") as tmp_dir:
+        path = os.path.join(tmp_dir, "chart.arrow")
+        chart_data.write_ipc(path, compression="uncompressed")
+        # polars 는 fork 된 프로세스에서 교착될 수 있으므로 spawn 사용
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(path,),
+        ) as executor:
+            results = executor.map(_run_config, tasks, chunksize=chunksize)
+            if is_progress:
+                results = tqdm(results, total=len(tasks), desc="파라미터 탐색 진행률")
+            rows = list(results)
+
+    return pl.DataFrame(rows).sort("return", descending=True)
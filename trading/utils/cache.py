@@ -0,0 +1,301 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+import polars as pl
+
+OHLCV_SCHEMA: Dict[str, pl.DataType] = {
+    "Date": pl.Datetime("us"),
+    "open": pl.Float64,
+    "high": pl.Float64,
+    "low": pl.Float64,
+    "close": pl.Float64,
+    "volume": pl.Float64,
+}
+DEFAULT_CACHE_DIR = os.path.join(".cache", "ohlcv")
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2GB
+
+
+class OHLCVCache:
+    """OHLCV 로컬 캐시
+
+    (종목, 주기, 날짜 범위)로 주소가 정해지는 Arrow IPC 파일에 차트 데이터를 저장하고
+    memory map 으로 읽습니다. 요청 범위가 캐시와 일부만 겹치면 부족한 날짜만 조회해
+    기존 구간을 확장하며, 전체 크기가 `max_bytes`를 넘으면 가장 오래 사용하지 않은
+    구간부터 삭제합니다.
+
+    아직 끝나지 않은 당일 이후 날짜는 캐시하지 않고, 지난 날짜는 캐시에서 읽은 뒤 당일 이후만 조회합니다.
+    캐시에 있는 구간은 기본적으로 원본을 다시 확인하지 않습니다. `revalidate_after`를 주면 구간을
+    저장할 때 원본의 요약값(`stat`: 행 수, 마지막 시각 등)을 함께 기록하고, 마지막 확인 후
+    `revalidate_after`가 지난 구간을 읽을 때 요약값이 달라졌으면(지난 날짜가 새로 적재된 경우)
+    구간을 버리고 다시 조회합니다.
+    인덱스는 잠금으로 보호하고 조회(`fetch`)는 잠금 밖에서 실행하므로 여러 스레드에서 함께 쓸 수 있습니다.
+
+    Example:
+        >>> cache = OHLCVCache()
+        >>> df = cache.load("KRW-BTC", "1min", "2024-01-01", "2024-01-31", fetch)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        revalidate_after: Optional[timedelta] = None,
+    ):
+        """캐시 초기화
+
+        Args:
+            cache_dir (str, optional): 캐시 디렉토리. Defaults to ".cache/ohlcv".
+            max_bytes (int, optional): 캐시 최대 크기(byte). Defaults to 2GB.
+            revalidate_after (Optional[timedelta], optional): 캐시 구간을 원본 요약값으로 다시 확인하는 주기. None 이면 확인하지 않음. Defaults to None.
+        """
+        self.__cache_dir = cache_dir
+        self.__max_bytes = max_bytes
+        self.__revalidate_after = revalidate_after
+        self.__index_path = os.path.join(cache_dir, "index.json")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.__index: Dict[str, Dict[str, Any]] = self.__read_index()
+        self.__lock = threading.RLock()
+
+    def __read_index(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.__index_path):
+            return {}
+        try:
+            with open(self.__index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # 파일이 지워진 항목은 무시
+        return {
+            name: entry
+            for name, entry in index.items()
+            if os.path.exists(os.path.join(self.__cache_dir, name))
+        }
+
+    def __write_index(self):
+        tmp_path = f"{self.__index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.__index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.__index_path)
+
+    @staticmethod
+    def key(ticker_name: str, interval: str, start: date, end: date) -> str:
+        """캐시 파일 이름(종목, 주기, 날짜 범위의 해시)"""
+        raw = f"{ticker_name}|{interval}|{start.isoformat()}|{end.isoformat()}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + ".arrow"
+
+    @property
+    def size(self) -> int:
+        """캐시 전체 크기(byte)"""
+        return sum(entry["size"] for entry in self.__index.values())
+
+    def __read(self, name: str) -> pl.DataFrame:
+        self.__index[name]["last_access"] = time.time()
+        return pl.read_ipc(os.path.join(self.__cache_dir, name), memory_map=True)
+
+    def __write(
+        self,
+        df: pl.DataFrame,
+        ticker_name: str,
+        interval: str,
+        start: date,
+        end: date,
+        stat: Any = None,
+    ):
+        name = self.key(ticker_name, interval, start, end)
+        path = os.path.join(self.__cache_dir, name)
+        tmp_path = f"{path}.tmp"
+        # memory map 으로 읽을 수 있도록 압축하지 않음
+        df.write_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+        self.__index[name] = {
+            "ticker_name": ticker_name,
+            "interval": interval,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "size": os.path.getsize(path),
+            "stat": stat,
+            "checked_at": time.time(),
+            "last_access": time.time(),
+        }
+
+    def __remove(self, name: str):
+        self.__index.pop(name, None)
+        path = os.path.join(self.__cache_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def __evict(self, keep: Optional[str] = None):
+        # 가장 오래 사용하지 않은 구간부터 삭제
+        for name, _ in sorted(
+            self.__index.items(), key=lambda item: item[1]["last_access"]
+        ):
+            if self.size <= self.__max_bytes:
+                break
+            if name != keep:
+                self.__remove(name)
+
+    def __find(
+        self, ticker_name: str, interval: str, start: date, end: date
+    ) -> Optional[str]:
+        # 요청 범위와 겹치거나 맞닿은 구간 중 가장 많이 겹치는 구간
+        best, best_overlap = None, None
+        for name, entry in self.__index.items():
+            if entry["ticker_name"] != ticker_name or entry["interval"] != interval:
+                continue
+            entry_start = date.fromisoformat(entry["start"])
+            entry_end = date.fromisoformat(entry["end"])
+            if entry_start > end + timedelta(days=1) or entry_end < start - timedelta(
+                days=1
+            ):
+                continue
+            overlap = (min(end, entry_end) - max(start, entry_start)).days
+            if best_overlap is None or overlap > best_overlap:
+                best, best_overlap = name, overlap
+        return best
+
+    def load(
+        self,
+        ticker_name: str,
+        interval: str,
+        start_date: str,
+        end_date: str,
+        fetch: Callable[[str, str], pl.DataFrame],
+        stat: Optional[Callable[[str, str], Any]] = None,
+    ) -> pl.DataFrame:
+        """캐시에서 차트 데이터를 로드하고, 없는 날짜만 `fetch`로 조회합니다.
+
+        Args:
+            ticker_name (str): 종목명
+            interval (str): 데이터 주기
+            start_date (str): 시작일자 (YYYY-MM-DD)
+            end_date (str): 종료일자 (YYYY-MM-DD)
+            fetch (Callable[[str, str], pl.DataFrame]): (시작일자, 종료일자)를 받아 DB 에서 조회하는 함수
+            stat (Optional[Callable[[str, str], Any]], optional): (시작일자, 종료일자)의 원본 요약값(JSON 으로 저장 가능한 값)을 조회하는 함수. `revalidate_after`를 준 캐시에서만 호출합니다. Defaults to None.
+
+        Returns:
+            pl.DataFrame: 시작일자 ~ 종료일자(포함) 데이터
+        """
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+        today = date.today()
+        if end >= today:
+            # 지난 날짜는 캐시에서 읽고, 아직 끝나지 않은 당일 이후만 조회
+            if start >= today:
+                return fetch(start_date, end_date)
+            closed = self.load(
+                ticker_name,
+                interval,
+                start_date,
+                (today - timedelta(days=1)).isoformat(),
+                fetch,
+                stat,
+            )
+            return self.__concat([closed, fetch(today.isoformat(), end_date)])
+
+        with self.__lock:
+            name = self.__find(ticker_name, interval, start, end)
+            entry = None if name is None else dict(self.__index[name])
+
+        # 확인 주기가 지난 구간은 원본 요약값과 비교해서, 바뀌었으면(지난 날짜 재적재 등) 버리고 새로 조회
+        if entry is not None and self.__needs_check(entry, stat):
+            if self.__stat(stat, entry["start"], entry["end"]) != entry.get("stat"):
+                entry = None
+            else:
+                with self.__lock:
+                    if name in self.__index:
+                        self.__index[name]["checked_at"] = time.time()
+
+        with self.__lock:
+            if name is not None and (entry is None or name not in self.__index):
+                self.__remove(name)
+                name = None
+            if name is not None:
+                cached_start = date.fromisoformat(entry["start"])
+                cached_end = date.fromisoformat(entry["end"])
+                cached = self.__read(name)
+                if cached_start <= start and end <= cached_end:
+                    self.__write_index()
+                    return self.__slice(cached, start, end)
+
+        if name is not None:
+            # 겹치지 않는 앞/뒤 날짜만 조회해서 구간 확장
+            parts = [cached]
+            merged_start, merged_end = min(start, cached_start), max(end, cached_end)
+        else:
+            merged_start, merged_end = start, end
+        # 조회 전에 요약값을 먼저 읽어, 그 사이에 적재된 데이터는 다음 조회에서 다시 가져오게 함
+        merged_stat = (
+            self.__stat(stat, merged_start.isoformat(), merged_end.isoformat())
+            if stat is not None and self.__revalidate_after is not None
+            else None
+        )
+        if name is not None:
+            if start < cached_start:
+                parts.insert(
+                    0, fetch(start_date, (cached_start - timedelta(days=1)).isoformat())
+                )
+            if end > cached_end:
+                parts.append(
+                    fetch((cached_end + timedelta(days=1)).isoformat(), end_date)
+                )
+            df = self.__concat(parts)
+        else:
+            df = fetch(start_date, end_date)
+
+        with self.__lock:
+            if name is not None:
+                self.__remove(name)
+            self.__write(
+                df, ticker_name, interval, merged_start, merged_end, merged_stat
+            )
+            self.__evict(keep=self.key(ticker_name, interval, merged_start, merged_end))
+            self.__write_index()
+        return self.__slice(df, start, end)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self.__lock:
+            for name in list(self.__index.keys()):
+                self.__remove(name)
+            self.__write_index()
+
+    def __needs_check(
+        self, entry: Dict[str, Any], stat: Optional[Callable[[str, str], Any]]
+    ) -> bool:
+        if stat is None or self.__revalidate_after is None:
+            return False
+        checked_at = entry.get("checked_at", 0.0)
+        return time.time() - checked_at >= self.__revalidate_after.total_seconds()
+
+    @staticmethod
+    def __stat(stat: Callable[[str, str], Any], start_date: str, end_date: str) -> Any:
+        # index.json 에서 읽은 값과 비교할 수 있도록 JSON 으로 왕복
+        return json.loads(json.dumps(stat(start_date, end_date), default=str))
+
+    @staticmethod
+    def __concat(parts) -> pl.DataFrame:
+        parts = [part for part in parts if len(part) > 0]
+        if not parts:
+            return pl.DataFrame(schema=OHLCV_SCHEMA)
+        return (
+            pl.concat(parts, how="vertical_relaxed")
+            .unique(subset=["Date"], keep="last", maintain_order=True)
+            .sort("Date")
+        )
+
+    @staticmethod
+    def __slice(df: pl.DataFrame, start: date, end: date) -> pl.DataFrame:
+        if len(df) == 0:
+            return df
+        return df.filter(
+            (pl.col("Date") >= datetime.combine(start, datetime.min.time()))
+            & (
+                pl.col("Date")
+                < datetime.combine(end + timedelta(days=1), datetime.min.time())
+            )
+        )
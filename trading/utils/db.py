@@ -0,0 +1,197 @@
+import atexit
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import psycopg2
+from dotenv import load_dotenv
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.pool import ThreadedConnectionPool
+
+DEFAULT_POOL_MIN = 1
+DEFAULT_POOL_MAX = 4
+HEALTH_CHECK_INTERVAL = 30.0  # 이 시간(초) 이상 쉬었던 연결은 빌려줄 때 상태 확인
+
+
+class ConnectionPool:
+    """Postgres 연결 풀
+
+    `ThreadedConnectionPool`에 다음을 더합니다.
+
+    - 연결이 모두 사용 중이면 예외 대신 반납될 때까지 기다립니다.
+    - 오래 쉬었던 연결은 빌려줄 때 `SELECT 1`로 확인하고, 끊어졌으면 확인을 통과하는 연결이 나올 때까지 바꿉니다.
+    - 정상 종료 시 커밋, 예외 시 롤백한 뒤 반납하므로 다음 사용자는 항상 깨끗한 연결을 받습니다.
+
+    Example:
+        >>> pool = ConnectionPool(maxconn=8)
+        >>> with pool.connection() as conn:
+        ...     df = search_db_data(conn, "2024-01-01", "2024-01-31")
+    """
+
+    def __init__(
+        self,
+        minconn: Optional[int] = None,
+        maxconn: Optional[int] = None,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+        **dsn,
+    ):
+        """연결 풀 초기화
+
+        Args:
+            minconn (Optional[int], optional): 미리 열어 둘 연결 수. Defaults to 환경변수 DB_POOL_MIN 또는 1.
+            maxconn (Optional[int], optional): 최대 연결 수. Defaults to 환경변수 DB_POOL_MAX 또는 4.
+            health_check_interval (float, optional): 상태 확인 기준 유휴 시간(초). Defaults to 30.
+            **dsn: psycopg2.connect 인자. Defaults to 환경변수 DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD.
+        """
+        load_dotenv()
+        if minconn is None:
+            minconn = int(os.environ.get("DB_POOL_MIN", DEFAULT_POOL_MIN))
+        if maxconn is None:
+            maxconn = int(os.environ.get("DB_POOL_MAX", DEFAULT_POOL_MAX))
+        maxconn = max(maxconn, minconn, 1)
+        self.__dsn = dsn or {
+            "host": os.environ.get("DB_HOST"),
+            "port": os.environ.get("DB_PORT"),
+            "dbname": os.environ.get("DB_NAME"),
+            "user": os.environ.get("DB_USER"),
+            "password": os.environ.get("DB_PASSWORD"),
+        }
+        self.__pool = ThreadedConnectionPool(minconn, maxconn, **self.__dsn)
+        self.__slots = threading.BoundedSemaphore(maxconn)
+        self.__health_check_interval = health_check_interval
+        # 닫혀서 버려진 연결의 기록은 자동으로 사라지도록 연결 객체를 약한 참조 키로 사용
+        self.__last_used: "weakref.WeakKeyDictionary[object, float]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.__maxconn = maxconn
+
+    @property
+    def maxconn(self) -> int:
+        """최대 연결 수"""
+        return self.__maxconn
+
+    @property
+    def closed(self) -> bool:
+        return self.__pool.closed
+
+    def __is_healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        last_used = self.__last_used.get(conn)
+        if last_used is not None and (
+            time.monotonic() - last_used < self.__health_check_interval
+        ):
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self):
+        """연결 대여(사용 가능한 연결이 없으면 반납될 때까지 대기)"""
+        self.__slots.acquire()
+        try:
+            conn = self.__pool.getconn()
+            # 풀에 남은 연결이 모두 끊어졌을 수 있으므로, 다음 연결(마지막에는 새 연결)도 확인
+            for _ in range(self.__maxconn):
+                if self.__is_healthy(conn):
+                    return conn
+                self.__discard(conn)
+                conn = self.__pool.getconn()
+            if self.__is_healthy(conn):
+                return conn
+            self.__discard(conn)
+            raise psycopg2.OperationalError("DB 에 연결할 수 없습니다.")
+        except BaseException:
+            self.__slots.release()
+            raise
+
+    def __discard(self, conn):
+        self.__last_used.pop(conn, None)
+        self.__pool.putconn(conn, close=True)
+
+    def putconn(self, conn, close: bool = False):
+        """연결 반납(진행 중인 트랜잭션은 롤백)"""
+        try:
+            if not conn.closed and (
+                conn.get_transaction_status() != TRANSACTION_STATUS_IDLE
+            ):
+                conn.rollback()
+            self.__last_used[conn] = time.monotonic()
+        except psycopg2.Error:
+            close = True
+        if close or conn.closed:
+            self.__last_used.pop(conn, None)
+        try:
+            self.__pool.putconn(conn, close=close or bool(conn.closed))
+        finally:
+            self.__slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """연결을 빌려 쓰고, 정상 종료 시 커밋/예외 시 롤백한 뒤 반납하는 컨텍스트"""
+        conn = self.getconn()
+        try:
+            yield conn
+            if not conn.closed:
+                conn.commit()
+        except BaseException:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    def close(self):
+        """모든 연결 종료"""
+        if not self.__pool.closed:
+            self.__pool.closeall()
+        self.__last_used.clear()
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """프로세스 공용 연결 풀(처음 호출할 때 환경변수 설정으로 생성)
+
+    psycopg2 연결은 프로세스 사이에 공유할 수 없으므로 fork 된 자식 프로세스에서는 새로 만듭니다.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool.closed or _pool_pid != os.getpid():
+            _pool = ConnectionPool()
+            _pool_pid = os.getpid()
+        return _pool
+
+
+@contextmanager
+def connection() -> Iterator:
+    """공용 연결 풀에서 연결을 빌려 쓰는 컨텍스트
+
+    Example:
+        >>> with connection() as conn:
+        ...     df = search_db_data(conn, "2024-01-01", "2024-01-31", "1hour", "KRW-BTC")
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def close_pool():
+    """공용 연결 풀 종료"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.close()
+        _pool = None
+
+
+atexit.register(close_pool)
@@ -1,7 +1,29 @@
+import asyncio
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 import polars as pl
+from psycopg2 import sql
 
+from trading.utils.cache import OHLCV_SCHEMA, OHLCVCache
+from trading.utils.db import ConnectionPool, get_pool
+from trading.utils.resample import load_resampled, resample, to_timedelta
 from trading.utils.validation import validate_interval
 
+COPY_CHUNK_DAYS = 365  # 1분봉 COPY 1회당 조회 기간(약 52만 행)
+# migration 이 연속 집계(continuous aggregate)를 만드는 표준 주기
+AGGREGATE_INTERVALS = ["5min", "15min", "1hour", "4hour", "1day"]
+# load_many 요청 단위: (테이블명(종목명), 주기, 시작일자, 종료일자)
+LoadRequest = Tuple[str, str, str, str]
+
+
+def aggregate_name(table_name: str, interval: str) -> str:
+    """주기별 연속 집계 뷰 이름(예: `KRW-BTC_1hour`)"""
+    return f"{table_name}_{interval}"
+
 
 def search_db_data(
     conn,
@@ -9,79 +31,293 @@ def search_db_data(
     end_date: str,
     interval: str = "1min",
     table_name: str = "KRW-BTC",
+    cache: Optional[OHLCVCache] = None,
 ) -> pl.DataFrame:
     """특정 기간의 데이터를 DB에서 로드하는 함수
 
+    연결은 닫지 않으므로 같은 연결로 여러 번 조회할 수 있습니다. 보통 `trading.utils.db.connection()`으로
+    연결 풀에서 빌려 쓰고 반납합니다.
+
+    Example:
+        >>> with connection() as conn:
+        ...     df = search_db_data(conn, "2024-01-01", "2024-11-30", "1day", "KRW-AVAX")
+
     Args:
+        conn: DB 연결(호출한 쪽에서 관리)
         start_date (str): 시작일자 (YYYY-MM-DD)
         end_date (str): 종료일자 (YYYY-MM-DD)
         interval (str, optional): 데이터 주기. Defaults to "1min".
+        cache (Optional[OHLCVCache], optional): 로컬 캐시. 지정하면 캐시에 없는 날짜와 당일 이후만 DB에서 조회합니다. 연속 집계 뷰가 있는 주기는 뷰에서, 없는 주기는 1분봉을 받아 로컬에서 집계합니다. Defaults to None.
 
     Returns:
         pl.DataFrame: 필터링된 데이터프레임
     """
     validate_interval(interval)
-    try:
-        if interval == "1min":
-            query = f"""
-                SELECT 
-                    date as Date,
-                    open,
-                    high,
-                    low,
-                    close,
-                    volume
-                FROM \"{table_name}\" 
-                WHERE DATE(date) BETWEEN %s AND %s
-                ORDER BY date
+    if cache is not None:
+        fetch_minutes = lambda sd, ed: _fetch(conn, sd, ed, "1min", table_name)
+        stat_minutes = lambda sd, ed: _stat(conn, sd, ed, table_name)
+        if interval not in AGGREGATE_INTERVALS:
+            # 캐시된 1분봉에서 로컬로 집계(주기별 결과도 따로 캐시)
+            return load_resampled(
+                cache,
+                table_name,
+                interval,
+                start_date,
+                end_date,
+                fetch_minutes,
+                stat_minutes,
+            )
+
+        # 뷰 존재 여부는 캐시에 없는 날짜를 조회할 때만 확인(캐시 적중 시에는 DB 를 조회하지 않음)
+        def fetch(sd: str, ed: str) -> pl.DataFrame:
+            if _has_aggregate(conn, table_name, interval):
+                # 미리 집계된 뷰가 있으면 1분봉을 받아 집계하지 않고 뷰 결과를 그대로 캐시
+                return _fetch(conn, sd, ed, interval, table_name)
+            minutes = cache.load(table_name, "1min", sd, ed, fetch_minutes, stat_minutes)
+            return resample(minutes, interval)
+
+        def stat(sd: str, ed: str) -> Tuple[int, Optional[str]]:
+            if _has_aggregate(conn, table_name, interval):
+                return _stat(conn, sd, ed, table_name, interval)
+            return stat_minutes(sd, ed)
+
+        return cache.load(table_name, interval, start_date, end_date, fetch, stat)
+    return _fetch(conn, start_date, end_date, interval, table_name)
+
+
+async def load_many(
+    requests: Iterable[LoadRequest],
+    max_concurrency: Optional[int] = None,
+    cache: Optional[OHLCVCache] = None,
+    pool: Optional[ConnectionPool] = None,
+) -> List[pl.DataFrame]:
+    """여러 (종목, 주기, 기간) 차트를 동시에 로드하는 함수
+
+    요청마다 연결 풀에서 연결을 빌려 별도 스레드에서 `search_db_data`를 실행합니다.
+    DB 왕복과 COPY 수신, polars CSV 파싱은 GIL 을 놓으므로 요청들이 겹쳐서 진행되고,
+    전체 시간은 대략 가장 느린 요청의 시간에 가까워집니다.
+
+    Example:
+        >>> tickers = ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+        >>> frames = asyncio.run(
+        ...     load_many([(t, "1hour", "2024-01-01", "2024-11-30") for t in tickers])
+        ... )
+        >>> engine = Engine(strategy=..., chart_data=dict(zip(tickers, frames)), ...)
+
+    Args:
+        requests (Iterable[LoadRequest]): (테이블명(종목명), 주기, 시작일자, 종료일자) 목록
+        max_concurrency (Optional[int], optional): 동시에 실행할 요청 수. Defaults to 연결 풀 최대 연결 수.
+        cache (Optional[OHLCVCache], optional): 로컬 캐시. Defaults to None.
+        pool (Optional[ConnectionPool], optional): 연결 풀. Defaults to 공용 연결 풀.
+
+    Returns:
+        List[pl.DataFrame]: 요청 순서대로의 차트 데이터
+    """
+    requests = list(requests)
+    if not requests:
+        return []
+    pool = pool if pool is not None else get_pool()
+    concurrency = min(max_concurrency or pool.maxconn, len(requests))
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="load_many"
+    ) as executor:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, _load_pooled, pool, cache, *request
+                )
+                for request in requests
+            )
+        )
+
+
+def _load_pooled(
+    pool: ConnectionPool,
+    cache: Optional[OHLCVCache],
+    table_name: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+) -> pl.DataFrame:
+    with pool.connection() as conn:
+        return search_db_data(conn, start_date, end_date, interval, table_name, cache)
+
+
+def build_query(
+    table_name: str, interval: str, aggregated: bool = False
+) -> sql.Composed:
+    """차트 조회 쿼리 생성
+
+    테이블명은 식별자로, 기간과 버킷 길이는 `%(start)s`, `%(end)s`, `%(bucket)s` 파라미터로 넘깁니다.
+    기간은 `start <= date < end` 반열린 구간으로 비교하므로 date 인덱스와 하이퍼테이블
+    chunk 제외(chunk exclusion)가 적용됩니다.
+
+    Args:
+        table_name (str): 테이블명(종목명)
+        interval (str): 데이터 주기
+        aggregated (bool, optional): 주기별 연속 집계 뷰에서 조회할지 여부. Defaults to False.
+
+    Returns:
+        sql.Composed: 쿼리(파라미터는 `query_params`로 생성)
+    """
+    if interval == "1min" or aggregated:
+        source = aggregate_name(table_name, interval) if aggregated else table_name
+        return sql.SQL(
             """
-        else:
-            # 시간 간격 문자열 파싱 및 변환
-            if interval.endswith("min"):
-                minutes = int(interval[:-3])  # "min" 제거하고 숫자만 추출
-                time_bucket = f"{minutes} minutes" if 2 <= minutes <= 59 else "1 day"
-            elif interval.endswith("hour"):
-                hours = int(interval[:-4])  # "hour" 제거하고 숫자만 추출
-                time_bucket = f"{hours} hours"
-            elif interval.endswith("day"):
-                days = int(interval[:-3])  # "day" 제거하고 숫자만 추출
-                time_bucket = f"{days} days" if 1 <= days <= 6 else "1 day"
-            else:
-                time_bucket = "1 day"
-
-            query = f"""
-                SELECT 
-                    time_bucket('{time_bucket}', date) as Date,
-                    FIRST(open, date) as open,
-                    MAX(high) as high,
-                    MIN(low) as low, 
-                    LAST(close, date) as close,
-                    SUM(volume) as volume
-                FROM \"{table_name}\"
-                WHERE DATE(date) BETWEEN %s AND %s
-                GROUP BY 1
-                ORDER BY 1
+            SELECT date as Date, open, high, low, close, volume
+            FROM {table}
+            WHERE date >= %(start)s AND date < %(end)s
+            ORDER BY date
             """
+        ).format(table=sql.Identifier(source))
+    return sql.SQL(
+        """
+        SELECT
+            time_bucket(%(bucket)s, date) as Date,
+            FIRST(open, date) as open,
+            MAX(high) as high,
+            MIN(low) as low,
+            LAST(close, date) as close,
+            SUM(volume) as volume
+        FROM {table}
+        WHERE date >= %(start)s AND date < %(end)s
+        GROUP BY 1
+        ORDER BY 1
+        """
+    ).format(table=sql.Identifier(table_name))
 
-        with conn.cursor() as cur:
-            cur.execute(query, (start_date, end_date))
-            data = cur.fetchall()
-            df = pl.DataFrame(
-                [
-                    (
-                        row[0],
-                        float(row[1]) if row[1] else None,
-                        float(row[2]) if row[2] else None,
-                        float(row[3]) if row[3] else None,
-                        float(row[4]) if row[4] else None,
-                        row[5],
-                    )
-                    for row in data
-                ],
-                schema=["Date", "open", "high", "low", "close", "volume"],
-                orient="row",
-            )
 
-        return df
-    finally:
-        conn.close()
+def query_params(start_date: str, end_date: str, interval: str) -> Dict[str, Any]:
+    """조회 기간(종료일 포함)을 `[시작일 00:00, 종료일 다음날 00:00)` 파라미터로 변환"""
+    return {
+        "start": datetime.combine(date.fromisoformat(start_date), time.min),
+        "end": datetime.combine(
+            date.fromisoformat(end_date) + timedelta(days=1), time.min
+        ),
+        "bucket": to_timedelta(interval),
+    }
+
+
+def explain(
+    conn,
+    start_date: str,
+    end_date: str,
+    interval: str = "1min",
+    table_name: str = "KRW-BTC",
+    analyze: bool = False,
+) -> Dict[str, Any]:
+    """`search_db_data`가 실행할 쿼리의 실행 계획(EXPLAIN FORMAT JSON)
+
+    Args:
+        start_date (str): 시작일자 (YYYY-MM-DD)
+        end_date (str): 종료일자 (YYYY-MM-DD)
+        interval (str, optional): 데이터 주기. Defaults to "1min".
+        table_name (str, optional): 테이블명(종목명). Defaults to "KRW-BTC".
+        analyze (bool, optional): 실제로 실행해서 시간/행 수까지 측정할지 여부. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: 최상위 계획 노드(`Plan`)
+    """
+    query = build_query(
+        table_name, interval, _has_aggregate(conn, table_name, interval)
+    )
+    options = sql.SQL("ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON")
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL("EXPLAIN ({}) {}").format(options, query),
+            query_params(start_date, end_date, interval),
+        )
+        plan = cur.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def scanned_relations(plan: Dict[str, Any]) -> List[str]:
+    """실행 계획에서 읽는 테이블(하이퍼테이블이면 chunk) 이름 목록"""
+    relations = []
+    if "Relation Name" in plan:
+        relations.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations.extend(scanned_relations(child))
+    return relations
+
+
+def _fetch(
+    conn, start_date: str, end_date: str, interval: str, table_name: str
+) -> pl.DataFrame:
+    query = build_query(
+        table_name, interval, _has_aggregate(conn, table_name, interval)
+    )
+    # 1분봉 원본은 기간을 나눠 조회해서 한 번에 메모리에 올라오는 CSV 크기를 제한
+    # (집계 쿼리는 날짜 경계에서 버킷이 나뉠 수 있으므로 한 번에 조회)
+    windows = (
+        _date_windows(start_date, end_date, COPY_CHUNK_DAYS)
+        if interval == "1min"
+        else [(start_date, end_date)]
+    )
+    with conn.cursor() as cur:
+        frames = [
+            _copy_frame(cur, query, query_params(sd, ed, interval))
+            for sd, ed in windows
+        ]
+    return frames[0] if len(frames) == 1 else pl.concat(frames, rechunk=True)
+
+
+def _stat(
+    conn, start_date: str, end_date: str, table_name: str, interval: str = "1min"
+) -> Tuple[int, Optional[str]]:
+    # 캐시 구간 검증용 (행 수, 마지막 시각): 지난 날짜가 다시 적재되면 값이 바뀜
+    source = table_name if interval == "1min" else aggregate_name(table_name, interval)
+    with conn.cursor() as cur:
+        cur.execute(
+            sql.SQL(
+                "SELECT count(*), max(date) FROM {table} "
+                "WHERE date >= %(start)s AND date < %(end)s"
+            ).format(table=sql.Identifier(source)),
+            query_params(start_date, end_date, interval),
+        )
+        count, last = cur.fetchone()
+    return count, None if last is None else last.isoformat()
+
+
+def _has_aggregate(conn, table_name: str, interval: str) -> bool:
+    # 미리 집계된 연속 집계 뷰가 있으면 원본 대신 사용(버킷이 하루를 넘지 않으므로 결과가 같음)
+    if interval not in AGGREGATE_INTERVALS:
+        return False
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT to_regclass(%s)",
+            (sql.Identifier(aggregate_name(table_name, interval)).as_string(conn),),
+        )
+        return cur.fetchone()[0] is not None
+
+
+def _date_windows(start_date: str, end_date: str, days: int) -> List[Tuple[str, str]]:
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=days - 1), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+    return windows or [(start_date, end_date)]
+
+
+def _copy_frame(
+    cur, query: sql.Composable, params: Dict[str, Any]
+) -> pl.DataFrame:
+    """COPY TO STDOUT 결과(CSV)를 바로 polars 컬럼으로 디코딩
+
+    fetchall 후 행마다 Python 튜플과 float 를 만드는 대신, 서버가 보낸 CSV를
+    메모리 버퍼에 받아 polars 파서로 한 번에 컬럼 변환합니다.
+    """
+    # COPY 는 파라미터 바인딩을 지원하지 않으므로 쿼리를 먼저 완성
+    query = cur.mogrify(query, params).decode("utf-8")
+    buffer = io.BytesIO()
+    cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", buffer)
+    if buffer.tell() == 0:
+        return pl.DataFrame(schema=OHLCV_SCHEMA)
+    buffer.seek(0)
+    return pl.read_csv(buffer, has_header=False, schema=OHLCV_SCHEMA)
@@ -0,0 +1,148 @@
+import math
+from datetime import timedelta
+from typing import Dict, Optional
+
+import polars as pl
+
+EQUITY = "총 평가"
+PURCHASE = "총 매수"
+YEAR = timedelta(days=365)  # 가상자산은 휴장일이 없으므로 365일 기준으로 연율화
+
+
+def periods_per_year(dates: pl.Series) -> float:
+    """bar 간격(중앙값) 기준 연간 bar 수"""
+    if len(dates) < 2:
+        return 0.0
+    step = dates.diff().drop_nulls().median()
+    if step is None or step <= timedelta(0):
+        return 0.0
+    return YEAR / step
+
+
+def liquidation_value(evaluation: pl.DataFrame) -> pl.Expr:
+    """청산 가치(현금 + 보유 종목 평가액)
+
+    `총 평가`는 보유 중 매수 금액(`총 매수`)을 한 번 더 더하므로, 진입/청산 때마다 평가금이
+    튀지 않도록 성과 지표는 `총 평가` - `총 매수`로 계산합니다.
+    """
+    if PURCHASE in evaluation.columns:
+        return pl.col(EQUITY) - pl.col(PURCHASE)
+    return pl.col(EQUITY)
+
+
+def _holding(evaluation: pl.DataFrame) -> pl.Expr:
+    if PURCHASE in evaluation.columns:
+        return pl.col(PURCHASE) > 0
+    return pl.lit(False, dtype=pl.Boolean)
+
+
+def trade_returns(
+    evaluation: pl.DataFrame, initial_margin: Optional[float] = None
+) -> pl.Series:
+    """청산된 거래별 수익률
+
+    보유 구간(`총 매수` > 0 이 이어지는 bar 들) 하나를 거래 하나로 보고, 진입 직전 청산 가치 대비
+    청산 직후 청산 가치의 변화율을 계산합니다. 아직 청산하지 않은 구간은 제외합니다.
+
+    Args:
+        evaluation (pl.DataFrame): Date, 총 평가, 총 매수 컬럼을 가진 평가금 기록
+        initial_margin (Optional[float], optional): 초기 투자금. Defaults to 첫 청산 가치.
+
+    Returns:
+        pl.Series: 거래 순서대로의 수익률(0.01 = 1%)
+    """
+    if len(evaluation) == 0:
+        return pl.Series("return", [], dtype=pl.Float64)
+    equity = liquidation_value(evaluation)
+    if initial_margin is None:
+        initial_margin = evaluation.select(equity.first()).item()
+    holding = _holding(evaluation)
+    return (
+        evaluation.select(
+            holding=holding,
+            episode=holding.rle_id(),
+            entry=equity.shift(1).fill_null(initial_margin),
+            exit=equity.shift(-1),
+        )
+        .filter(pl.col("holding"))
+        .group_by("episode", maintain_order=True)
+        .agg(pl.col("entry").first(), pl.col("exit").last())
+        .drop_nulls("exit")
+        .select(((pl.col("exit") / pl.col("entry")) - 1).alias("return"))
+        .to_series()
+    )
+
+
+def compute_metrics(
+    evaluation: pl.DataFrame, initial_margin: Optional[float] = None
+) -> Dict[str, float]:
+    """평가금 기록(`Logger.evaluation`)으로 성과 지표를 계산합니다.
+
+    모든 지표는 polars 컬럼 연산으로 한 번에 계산하며, 그림을 그리지 않습니다.
+    평가금은 청산 가치(`liquidation_value`)를 사용합니다. 거래는 보유 구간(`총 매수` > 0 이
+    이어지는 bar 들) 하나로 보고, 진입 직전 대비 청산 직후 평가금이 늘었으면 이긴 거래로 셉니다
+    (아직 청산하지 않은 구간은 제외).
+
+    Args:
+        evaluation (pl.DataFrame): Date, 총 평가, 총 매수 컬럼을 가진 평가금 기록
+        initial_margin (Optional[float], optional): 초기 투자금. Defaults to 첫 청산 가치.
+
+    Returns:
+        Dict[str, float]: last_value(최종 청산 가치), return(수익률 %), mdd(최대 낙폭 %),
+            cagr(연평균 수익률 %), sharpe, sortino(연율화), win_rate(승률 %), trades(청산된 거래 수),
+            exposure(보유 bar 비율 %)
+    """
+    if len(evaluation) == 0:
+        return {
+            "last_value": float(initial_margin or 0.0),
+            "return": 0.0,
+            "mdd": 0.0,
+            "cagr": 0.0,
+            "sharpe": 0.0,
+            "sortino": 0.0,
+            "win_rate": 0.0,
+            "trades": 0,
+            "exposure": 0.0,
+        }
+    equity = liquidation_value(evaluation)
+    if initial_margin is None:
+        initial_margin = evaluation.select(equity.first()).item()
+
+    # 첫 bar 수익률은 초기 투자금 대비
+    previous = equity.shift(1).fill_null(initial_margin)
+    returns = equity / previous - 1
+    holding = _holding(evaluation)
+    stats = evaluation.select(
+        last_value=equity.last(),
+        mdd=((equity - equity.cum_max()) / equity.cum_max()).min().abs() * 100,
+        mean=returns.mean(),
+        std=returns.std(),
+        downside=(returns.clip(upper_bound=0) ** 2).mean().sqrt(),
+        exposure=holding.mean() * 100,
+        start=pl.col("Date").first(),
+        end=pl.col("Date").last(),
+    ).row(0, named=True)
+
+    trades = trade_returns(evaluation, initial_margin)
+
+    last_value = stats["last_value"]
+    ppy = periods_per_year(evaluation["Date"])
+    years = (stats["end"] - stats["start"]) / YEAR if ppy else 0.0
+    growth = last_value / initial_margin if initial_margin else 0.0
+    return {
+        "last_value": last_value,
+        "return": (growth - 1) * 100,
+        "mdd": stats["mdd"] or 0.0,
+        "cagr": (growth ** (1 / years) - 1) * 100 if years > 0 and growth > 0 else 0.0,
+        "sharpe": _ratio(stats["mean"], stats["std"], ppy),
+        "sortino": _ratio(stats["mean"], stats["downside"], ppy),
+        "win_rate": (trades > 0).mean() * 100 if len(trades) else 0.0,
+        "trades": len(trades),
+        "exposure": stats["exposure"] or 0.0,
+    }
+
+
+def _ratio(mean: Optional[float], risk: Optional[float], ppy: float) -> float:
+    if not mean or not risk or not ppy or math.isnan(risk):
+        return 0.0
+    return mean / risk * math.sqrt(ppy)
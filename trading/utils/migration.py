@@ -1,104 +1,381 @@
 # -*- coding:utf-8 -*-
-import os
+import io
+import time
+from datetime import timedelta
+from typing import Iterator, List, Literal
 
 import fire
 import polars as pl
-import psycopg2
-from dotenv import load_dotenv
-from psycopg2.extras import execute_values
+import pyarrow.parquet as pq
+from psycopg2 import sql
 
-load_dotenv()
+from trading.utils.db import connection
+from trading.utils.loader import AGGREGATE_INTERVALS, aggregate_name
+from trading.utils.resample import to_timedelta
 
-# 데이터베이스 연결 정보
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
+COLUMNS = ["Date", "open", "high", "low", "close", "volume"]
+COMPRESS_AFTER = timedelta(days=7)  # 압축 정책: 이 기간보다 오래된 chunk 는 압축
 
 
-def connect_to_db():
-    try:
-        conn = psycopg2.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-        )
-        print("Connected to TimescaleDB")
-        return conn
-    except Exception as e:
-        print(f"Error connecting to TimescaleDB: {e}")
-        exit()
+def _regclass(conn, name: str) -> str:
+    # regclass 인자로 넘길 따옴표 처리된 이름(예: "KRW-BTC")
+    return sql.Identifier(name).as_string(conn)
 
 
 # 2. 테이블 생성 (없으면 생성)
 def create_table_if_not_exists(conn, table_name: str):
-    create_table_query = f"""
-    CREATE TABLE IF NOT EXISTS \"{table_name}\" (
-        date TIMESTAMP NOT NULL,
-        open NUMERIC,
-        high NUMERIC,
-        low NUMERIC,
-        close NUMERIC,
-        volume REAL,
-        PRIMARY KEY (date)
-    );
-    """
-    create_hypertable_query = f"""
-    SELECT create_hypertable('\"{table_name}\"', 'date', if_not_exists => TRUE, create_default_indexes => FALSE);
-    """
+    create_table_query = sql.SQL(
+        """
+        CREATE TABLE IF NOT EXISTS {table} (
+            date TIMESTAMP NOT NULL,
+            open NUMERIC,
+            high NUMERIC,
+            low NUMERIC,
+            close NUMERIC,
+            volume REAL,
+            PRIMARY KEY (date)
+        )
+        """
+    ).format(table=sql.Identifier(table_name))
     with conn.cursor() as cursor:
         cursor.execute(create_table_query)
-        cursor.execute(create_hypertable_query)
+        cursor.execute(
+            """
+            SELECT create_hypertable(
+                %s::regclass, 'date', if_not_exists => TRUE, create_default_indexes => FALSE
+            )
+            """,
+            (_regclass(conn, table_name),),
+        )
         conn.commit()
         print(f"Table '{table_name}' is ready.")
 
 
-# 3. Parquet 데이터 읽기
-def read_parquet(file_path):
+def is_compression_enabled(conn, table_name: str) -> bool:
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT compression_enabled FROM timescaledb_information.hypertables
+            WHERE hypertable_name = %s
+            """,
+            (table_name,),
+        )
+        row = cursor.fetchone()
+    return row is not None and bool(row[0])
+
+
+def enable_compression(
+    conn, table_name: str, compress_after: timedelta = COMPRESS_AFTER
+):
+    """하이퍼테이블 네이티브 압축 설정(선택 사항)
+
+    테이블이 종목별로 나뉘어 있으므로 segmentby 없이 시각 순으로만 정렬해서 압축합니다.
+    조회는 항상 시각 범위로 하므로 chunk 안에서도 date 순서가 유지되어 범위 스캔이 빠릅니다.
+    압축된 chunk 에 다시 적재할 때는 `Migration.run`이 해당 구간을 먼저 압축 해제합니다.
+    """
+    # 이미 압축된 chunk 가 있으면 설정을 다시 바꿀 수 없으므로 한 번만 적용
+    if is_compression_enabled(conn, table_name):
+        return
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                """
+                ALTER TABLE {table} SET (
+                    timescaledb.compress,
+                    timescaledb.compress_segmentby = '',
+                    timescaledb.compress_orderby = 'date ASC'
+                )
+                """
+            ).format(table=sql.Identifier(table_name))
+        )
+        cursor.execute(
+            """
+            SELECT add_compression_policy(
+                %s::regclass, compress_after => %s, if_not_exists => TRUE
+            )
+            """,
+            (_regclass(conn, table_name), compress_after),
+        )
+        conn.commit()
+
+
+def decompress_range(conn, table_name: str, staging_name: str) -> int:
+    """스테이징 테이블의 시각 범위와 겹치는 압축 chunk 를 압축 해제
+
+    압축된 chunk 에는 `INSERT ... ON CONFLICT`로 병합할 수 없으므로 병합 전에 호출합니다.
+    압축 정책이 나중에 다시 압축합니다.
+
+    Returns:
+        int: 압축 해제한 chunk 수
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                """
+                WITH batch AS (SELECT min(date) AS first, max(date) AS last FROM {staging})
+                SELECT decompress_chunk(
+                    format('%I.%I', chunk_schema, chunk_name)::regclass, if_compressed => TRUE
+                )
+                FROM timescaledb_information.chunks, batch
+                WHERE hypertable_name = {table_name} AND is_compressed
+                    AND range_start <= batch.last AND range_end > batch.first
+                """
+            ).format(
+                staging=sql.Identifier(staging_name),
+                table_name=sql.Literal(table_name),
+            )
+        )
+        return cursor.rowcount
+
+
+# 3. Parquet 데이터를 row group 단위로 읽기
+def iter_parquet_batches(file_path: str, batch_size: int) -> Iterator[pl.DataFrame]:
     try:
-        df = pl.read_parquet(file_path).unique(subset=["Date"])
-        print(f"Loaded {len(df)} rows from {file_path}")
-        return df
+        parquet_file = pq.ParquetFile(file_path)
     except Exception as e:
         print(f"Error reading Parquet file: {e}")
-        exit()
+        raise
+    print(
+        f"Streaming {parquet_file.metadata.num_rows} rows "
+        f"({parquet_file.num_row_groups} row groups) from {file_path}"
+    )
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=COLUMNS):
+        yield pl.from_arrow(batch)
 
 
-# 4. 데이터 삽입
-def insert_data(conn, dataframe, table_name: str):
-    insert_query = f"""
-    INSERT INTO \"{table_name}\" (date, open, high, low, close, volume)
-    VALUES %s
+# 4. 스테이징 테이블에 COPY 후 본 테이블로 병합
+def create_staging_table(conn, table_name: str) -> str:
+    staging_name = f"{table_name}_staging"
+    with conn.cursor() as cursor:
+        cursor.execute(
+            sql.SQL(
+                "CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {table} INCLUDING DEFAULTS)"
+            ).format(
+                staging=sql.Identifier(staging_name), table=sql.Identifier(table_name)
+            )
+        )
+        conn.commit()
+    return staging_name
+
+
+def copy_batch(conn, dataframe: pl.DataFrame, staging_name: str):
+    buffer = io.BytesIO()
+    dataframe.select(COLUMNS).write_csv(buffer, include_header=False)
+    buffer.seek(0)
+    with conn.cursor() as cursor:
+        cursor.copy_expert(
+            sql.SQL(
+                "COPY {staging} (date, open, high, low, close, volume) "
+                "FROM STDIN WITH (FORMAT csv)"
+            ).format(staging=sql.Identifier(staging_name)),
+            buffer,
+        )
+
+
+def merge_staging(
+    conn,
+    staging_name: str,
+    table_name: str,
+    on_conflict: Literal["nothing", "update"] = "nothing",
+) -> int:
+    if on_conflict == "update":
+        conflict_action = sql.SQL(
+            """DO UPDATE SET
+            open = EXCLUDED.open,
+            high = EXCLUDED.high,
+            low = EXCLUDED.low,
+            close = EXCLUDED.close,
+            volume = EXCLUDED.volume"""
+        )
+    else:
+        conflict_action = sql.SQL("DO NOTHING")
+    merge_query = sql.SQL(
+        """
+        INSERT INTO {table} (date, open, high, low, close, volume)
+        SELECT DISTINCT ON (date) date, open, high, low, close, volume
+        FROM {staging}
+        ORDER BY date
+        ON CONFLICT (date) {action}
+        """
+    ).format(
+        table=sql.Identifier(table_name),
+        staging=sql.Identifier(staging_name),
+        action=conflict_action,
+    )
+    with conn.cursor() as cursor:
+        cursor.execute(merge_query)
+        merged = cursor.rowcount
+        cursor.execute(
+            sql.SQL("TRUNCATE {staging}").format(staging=sql.Identifier(staging_name))
+        )
+    return merged
+
+
+# 5. 표준 주기별 연속 집계(continuous aggregate) 생성 및 갱신
+def create_continuous_aggregates(
+    conn, table_name: str, intervals: List[str] = AGGREGATE_INTERVALS
+):
+    """주기별 연속 집계 뷰와 자동 갱신 정책 생성
+
+    뷰 이름은 `{종목}_{주기}`(예: `KRW-BTC_1hour`)이며 컬럼은 원본 테이블과 같습니다.
+    `materialized_only = false`라 아직 갱신되지 않은 최근 구간은 원본에서 바로 집계해서 합칩니다.
     """
-    values = [
-        (row["Date"], row["open"], row["high"], row["low"], row["close"], row["volume"])
-        for row in dataframe.iter_rows(named=True)
-    ]
-    try:
+    for interval in intervals:
+        view_name = aggregate_name(table_name, interval)
+        bucket = to_timedelta(interval)
         with conn.cursor() as cursor:
-            execute_values(cursor, insert_query, values)
+            cursor.execute(
+                sql.SQL(
+                    """
+                    CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+                    WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+                    SELECT
+                        time_bucket({bucket}, date) AS date,
+                        FIRST(open, date) AS open,
+                        MAX(high) AS high,
+                        MIN(low) AS low,
+                        LAST(close, date) AS close,
+                        SUM(volume) AS volume
+                    FROM {table}
+                    GROUP BY 1
+                    WITH NO DATA
+                    """
+                ).format(
+                    view=sql.Identifier(view_name),
+                    bucket=sql.Literal(bucket),
+                    table=sql.Identifier(table_name),
+                )
+            )
+            # 끝나지 않은 마지막 버킷은 갱신하지 않고 실시간 집계로 처리
+            cursor.execute(
+                """
+                SELECT add_continuous_aggregate_policy(
+                    %s::regclass,
+                    start_offset => NULL,
+                    end_offset => %s,
+                    schedule_interval => %s,
+                    if_not_exists => TRUE
+                )
+                """,
+                (
+                    _regclass(conn, view_name),
+                    bucket,
+                    min(bucket, timedelta(hours=1)),
+                ),
+            )
             conn.commit()
-            print(f"Inserted {len(values)} rows into {table_name}.")
-    except Exception as e:
-        print(f"Error inserting data: {e}")
-        conn.rollback()
+        print(f"Continuous aggregate '{view_name}' is ready.")
+
+
+def refresh_continuous_aggregates(
+    conn, table_name: str, intervals: List[str] = AGGREGATE_INTERVALS
+):
+    """적재한 구간 전체를 연속 집계에 반영(트랜잭션 밖에서 실행해야 함)"""
+    autocommit = conn.autocommit
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            for interval in intervals:
+                view_name = aggregate_name(table_name, interval)
+                started = time.perf_counter()
+                cursor.execute(
+                    "CALL refresh_continuous_aggregate(%s::regclass, NULL, NULL)",
+                    (_regclass(conn, view_name),),
+                )
+                print(
+                    f"Refreshed '{view_name}' in {time.perf_counter() - started:.1f}s."
+                )
+    finally:
+        conn.autocommit = autocommit
 
 
 class Migration:
-    def __init__(self):
-        self.conn = connect_to_db()
-
-    def run(self, file_path: str, table_name: str):
-        try:
-            create_table_if_not_exists(self.conn, table_name)
-            df = read_parquet(file_path)
-            insert_data(self.conn, df, table_name)
-        finally:
-            self.conn.close()
-            print("Connection closed.")
+    def run(
+        self,
+        file_path: str,
+        table_name: str,
+        batch_size: int = 100_000,
+        on_conflict: Literal["nothing", "update"] = "nothing",
+        aggregate: bool = True,
+        compress: bool = False,
+    ):
+        """Parquet 파일을 배치 단위로 스트리밍 적재합니다.
+
+        배치마다 스테이징 테이블에 COPY 한 뒤 본 테이블로 병합하고 커밋하므로
+        파일 크기와 관계없이 메모리 사용량은 배치 크기로 제한되며, 이미 적재된
+        구간을 다시 실행해도 기본 키 충돌 없이 이어서 적재됩니다. 압축이 켜진 테이블은 배치와
+        겹치는 압축 chunk 를 먼저 압축 해제한 뒤 병합합니다.
+
+        Example:
+            $ python -m trading.utils.migration run --file_path=<path> --table_name=KRW-BTC
+            $ python -m trading.utils.migration run --file_path=<path> --table_name=KRW-BTC --on_conflict=update
+
+        Args:
+            file_path (str): Parquet 파일 경로
+            table_name (str): 테이블명(종목명)
+            batch_size (int, optional): 배치당 행 수. Defaults to 100,000.
+            on_conflict (Literal["nothing", "update"], optional): 중복 시각 처리 방식. Defaults to "nothing".
+            aggregate (bool, optional): 적재 후 표준 주기 연속 집계 생성 및 갱신 여부. Defaults to True.
+            compress (bool, optional): 오래된 chunk 압축 정책 설정 여부. Defaults to False.
+        """
+        with connection() as conn:
+            create_table_if_not_exists(conn, table_name)
+            if compress:
+                enable_compression(conn, table_name)
+            compressed = is_compression_enabled(conn, table_name)
+            staging_name = create_staging_table(conn, table_name)
+            read_rows, merged_rows = 0, 0
+            started = time.perf_counter()
+            for df in iter_parquet_batches(file_path, batch_size):
+                try:
+                    copy_batch(conn, df, staging_name)
+                    if compressed:
+                        decompress_range(conn, table_name, staging_name)
+                    merged_rows += merge_staging(
+                        conn, staging_name, table_name, on_conflict
+                    )
+                    conn.commit()
+                except Exception as e:
+                    print(f"Error inserting data: {e}")
+                    conn.rollback()
+                    raise
+                read_rows += len(df)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{read_rows} rows read, {merged_rows} rows merged "
+                    f"({read_rows / elapsed:,.0f} rows/sec)"
+                )
+            elapsed = time.perf_counter() - started
+            print(
+                f"Inserted {merged_rows} rows into {table_name} "
+                f"in {elapsed:.1f}s ({read_rows / max(elapsed, 1e-9):,.0f} rows/sec)."
+            )
+            if aggregate:
+                create_continuous_aggregates(conn, table_name)
+                refresh_continuous_aggregates(conn, table_name)
+
+    def aggregate(
+        self,
+        table_name: str,
+        intervals: List[str] = AGGREGATE_INTERVALS,
+        compress: bool = False,
+    ):
+        """이미 적재된 테이블에 주기별 연속 집계(선택적으로 압축 설정)를 만들고 갱신합니다.
+
+        Example:
+            $ python -m trading.utils.migration aggregate --table_name=KRW-BTC
+            $ python -m trading.utils.migration aggregate --table_name=KRW-BTC --intervals="[5min,1hour]" --compress
+
+        Args:
+            table_name (str): 테이블명(종목명)
+            intervals (List[str], optional): 집계 주기. Defaults to 5min, 15min, 1hour, 4hour, 1day.
+            compress (bool, optional): 오래된 chunk 압축 정책 설정 여부. Defaults to False.
+        """
+        with connection() as conn:
+            if compress:
+                enable_compression(conn, table_name)
+            create_continuous_aggregates(conn, table_name, intervals)
+            refresh_continuous_aggregates(conn, table_name, intervals)
 
 
 if __name__ == "__main__":
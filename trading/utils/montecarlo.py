@@ -0,0 +1,200 @@
+from typing import Iterator, Literal, Optional, Sequence
+
+import numpy as np
+import polars as pl
+
+from trading.utils.metrics import liquidation_value, trade_returns
+
+MAX_BYTES = 64 * 2**20  # chunk 하나가 쓰는 float64 배열 크기 상한
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def bar_returns(evaluation: pl.DataFrame) -> np.ndarray:
+    """bar 별 수익률
+
+    `compute_metrics`와 같이 청산 가치(`liquidation_value`)의 변화율을 사용합니다.
+
+    Args:
+        evaluation (pl.DataFrame): 총 평가, 총 매수 컬럼을 가진 평가금 기록
+
+    Returns:
+        np.ndarray: bar 별 수익률(첫 bar 제외)
+    """
+    value = liquidation_value(evaluation)
+    return (
+        evaluation.select((value / value.shift(1) - 1).alias("return"))
+        .to_series()
+        .drop_nulls()
+        .fill_nan(0.0)
+        .to_numpy()
+    )
+
+
+def _chunks(n_sims: int, length: int, max_bytes: int) -> Iterator[int]:
+    # 경로 배열과 중간 배열 몇 개를 함께 쓰므로 4배로 잡음
+    size = max(1, max_bytes // (max(length, 1) * 8 * 4))
+    for start in range(0, n_sims, size):
+        yield min(size, n_sims - start)
+
+
+def _path_stats(returns: np.ndarray, initial_value: float) -> np.ndarray:
+    """(시뮬레이션 수, 기간) 수익률 행렬 → [최종 평가금, MDD(%), 최장 수면 아래 기간]
+
+    `returns`는 평가금 경로로 덮어씁니다.
+    """
+    equity = returns
+    equity += 1
+    np.cumprod(equity, axis=1, out=equity)
+    equity *= initial_value
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, initial_value, out=peak)
+    # 고점을 새로 쓴 마지막 시점부터의 거리 중 가장 긴 값
+    index = np.arange(1, equity.shape[1] + 1)
+    recovered = np.where(equity >= peak, index, 0)
+    np.maximum.accumulate(recovered, axis=1, out=recovered)
+    underwater = (index - recovered).max(axis=1)
+    mdd = (1 - np.divide(equity, peak, out=peak).min(axis=1)) * 100
+    return np.column_stack((equity[:, -1], mdd, underwater))
+
+
+def simulate(
+    returns: Sequence[float],
+    n_sims: int = 10_000,
+    horizon: Optional[int] = None,
+    block_size: int = 1,
+    initial_value: float = 1.0,
+    seed: Optional[int] = None,
+    max_bytes: int = MAX_BYTES,
+) -> pl.DataFrame:
+    """수익률을 복원 추출해 평가금 경로를 만들고 경로별 지표를 계산합니다.
+
+    `block_size`개씩 연속한 수익률을 한 덩어리로 뽑아(moving block bootstrap, 끝은 처음으로
+    이어짐) 변동성 군집 같은 시계열 의존성을 유지하며, `block_size=1`이면 일반 bootstrap 입니다.
+    모든 경로를 (시뮬레이션 수, 기간) 2차원 배열로 한 번에 만들고, 배열 크기가 `max_bytes`를
+    넘지 않도록 시뮬레이션을 chunk 로 나눠 계산합니다.
+
+    Args:
+        returns (Sequence[float]): 표본 수익률(거래별 또는 bar 별, 0.01 = 1%)
+        n_sims (int, optional): 시뮬레이션 수. Defaults to 10,000.
+        horizon (Optional[int], optional): 경로 길이. Defaults to 표본 수.
+        block_size (int, optional): 한 번에 뽑을 연속 수익률 수. Defaults to 1.
+        initial_value (float, optional): 시작 평가금. Defaults to 1.0.
+        seed (Optional[int], optional): 난수 시드. Defaults to None.
+        max_bytes (int, optional): chunk 하나의 메모리 상한. Defaults to 64MB.
+
+    Returns:
+        pl.DataFrame: 시뮬레이션별 final_value(최종 평가금), return(수익률 %), mdd(최대 낙폭 %),
+            underwater(고점을 회복하지 못한 최장 기간, 표본 단위)
+    """
+    sample = np.asarray(returns, dtype=np.float64)
+    n = len(sample)
+    if n == 0 or n_sims <= 0:
+        return pl.DataFrame(
+            schema={
+                "final_value": pl.Float64,
+                "return": pl.Float64,
+                "mdd": pl.Float64,
+                "underwater": pl.Int64,
+            }
+        )
+    horizon = horizon or n
+    block_size = max(1, min(block_size, n))
+    n_blocks = -(-horizon // block_size)
+    offsets = np.arange(block_size)
+    rng = np.random.default_rng(seed)
+
+    stats = []
+    for size in _chunks(n_sims, horizon, max_bytes):
+        starts = rng.integers(0, n, size=(size, n_blocks, 1))
+        index = (starts + offsets).reshape(size, -1)[:, :horizon]
+        if block_size > 1:
+            index %= n
+        stats.append(_path_stats(sample[index], initial_value))
+    stats = np.concatenate(stats)
+    return pl.DataFrame(
+        {
+            "final_value": stats[:, 0],
+            "return": (stats[:, 0] / initial_value - 1) * 100,
+            "mdd": stats[:, 1],
+            "underwater": stats[:, 2].astype(np.int64),
+        }
+    )
+
+
+def monte_carlo(
+    evaluation: pl.DataFrame,
+    initial_margin: float,
+    method: Literal["trades", "bars"] = "trades",
+    n_sims: int = 10_000,
+    block_size: Optional[int] = None,
+    horizon: Optional[int] = None,
+    seed: Optional[int] = None,
+    max_bytes: int = MAX_BYTES,
+) -> pl.DataFrame:
+    """백테스트 평가금 기록으로 Monte Carlo / bootstrap 시뮬레이션
+
+    `Engine.run`을 다시 돌리지 않고, 한 번의 백테스트에서 얻은 수익률만 다시 뽑아 경로를 만듭니다.
+
+    - trades: 청산된 거래별 수익률(`trade_returns`)의 순서를 섞어 복원 추출
+    - bars: bar 별 수익률(`bar_returns`)을 `block_size`개씩 block bootstrap
+
+    Args:
+        evaluation (pl.DataFrame): 평가금 기록(`Logger.evaluation`)
+        initial_margin (float): 초기 투자금
+        method (Literal["trades", "bars"], optional): 표본 수익률 종류. Defaults to "trades".
+        n_sims (int, optional): 시뮬레이션 수. Defaults to 10,000.
+        block_size (Optional[int], optional): bars 의 block 길이. Defaults to 표본 수의 세제곱근.
+        horizon (Optional[int], optional): 경로 길이. Defaults to 표본 수.
+        seed (Optional[int], optional): 난수 시드. Defaults to None.
+        max_bytes (int, optional): chunk 하나의 메모리 상한. Defaults to 64MB.
+
+    Returns:
+        pl.DataFrame: 시뮬레이션별 final_value, return, mdd, underwater
+
+    Example:
+        >>> results = monte_carlo(engine.evaluation, 1000000.0, method="bars", seed=0)
+        >>> summarize(results)
+    """
+    if method == "trades":
+        returns = trade_returns(evaluation, initial_margin).to_numpy()
+        block_size = 1
+    elif method == "bars":
+        returns = bar_returns(evaluation)
+        if block_size is None:
+            block_size = max(1, round(len(returns) ** (1 / 3)))
+    else:
+        raise ValueError(f"지원하지 않는 방식입니다: {method}")
+    return simulate(
+        returns,
+        n_sims=n_sims,
+        horizon=horizon,
+        block_size=block_size,
+        initial_value=initial_margin,
+        seed=seed,
+        max_bytes=max_bytes,
+    )
+
+
+def summarize(
+    results: pl.DataFrame, quantiles: Sequence[float] = QUANTILES
+) -> pl.DataFrame:
+    """시뮬레이션 결과 분포 요약
+
+    Args:
+        results (pl.DataFrame): `simulate`/`monte_carlo` 결과
+        quantiles (Sequence[float], optional): 분위수. Defaults to (0.05, 0.25, 0.5, 0.75, 0.95).
+
+    Returns:
+        pl.DataFrame: 지표별 평균과 분위수(행: mean, q5, q25, ...)
+    """
+    rows = [results.mean().with_columns(pl.col(pl.Int64).cast(pl.Float64))]
+    rows += [
+        results.quantile(q, interpolation="linear").with_columns(
+            pl.col(pl.Int64).cast(pl.Float64)
+        )
+        for q in quantiles
+    ]
+    labels = ["mean"] + [f"q{round(q * 100)}" for q in quantiles]
+    return pl.concat(rows, how="vertical_relaxed").insert_column(
+        0, pl.Series("stat", labels)
+    )
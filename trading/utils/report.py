@@ -0,0 +1,263 @@
+import base64
+import html
+import io
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import polars as pl
+
+from trading.constant import PALETTE
+from trading.utils.metrics import liquidation_value
+
+MAX_POINTS = 2000  # 곡선 하나당 그릴 최대 점 수
+FIGSIZE = (20, 12)
+FORMATS = ("png", "html")
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 다운샘플링
+
+    첫/마지막 점을 남기고 나머지를 `threshold - 2`개 구간으로 나눈 뒤, 구간마다 직전에 고른 점과
+    다음 구간 평균점이 이루는 삼각형 넓이가 가장 큰 점을 고릅니다. 급등락 같은 모양을 유지하면서
+    점 수를 줄입니다.
+
+    Args:
+        x (np.ndarray): x 값(오름차순)
+        y (np.ndarray): y 값
+        threshold (int): 남길 점 수
+
+    Returns:
+        np.ndarray: 남길 점의 인덱스(오름차순)
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64) - float(x[0])
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    bounds = (np.arange(threshold - 1) * every).astype(np.int64) + 1
+    bounds[-1] = n - 1
+    # 구간 평균은 누적합으로 계산
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        if i + 2 < len(bounds):
+            next_lo, next_hi = bounds[i + 1], bounds[i + 2]
+            count = next_hi - next_lo
+            avg_x = (cum_x[next_hi] - cum_x[next_lo]) / count
+            avg_y = (cum_y[next_hi] - cum_y[next_lo]) / count
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample(
+    dates: pl.Series, values: pl.Series, max_points: int = MAX_POINTS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """결측값을 뺀 뒤 LTTB 로 줄인 (날짜, 값) 배열"""
+    frame = pl.DataFrame({"x": dates, "y": values}).drop_nulls().drop_nans()
+    x = frame["x"].to_numpy()
+    y = frame["y"].to_numpy()
+    if len(x) <= max_points:
+        return x, y
+    indices = lttb(x.astype("datetime64[ns]").astype(np.int64), y, max_points)
+    return x[indices], y[indices]
+
+
+def draw(
+    fig,
+    chart: pl.DataFrame,
+    evaluation: pl.DataFrame,
+    lines: Dict[str, str],
+    title: str,
+    tickers: Optional[Sequence[str]] = None,
+    max_points: int = MAX_POINTS,
+):
+    """가격(상단)과 평가금(하단) 차트를 그립니다.
+
+    Args:
+        fig (matplotlib.figure.Figure): 그릴 Figure
+        chart (pl.DataFrame): 지표가 계산된 차트 데이터
+        evaluation (pl.DataFrame): 평가금 기록(`Logger.evaluation`)
+        lines (Dict[str, str]): 상단에 그릴 {컬럼: 범례} (단일 종목)
+        title (str): 제목
+        tickers (Optional[Sequence[str]], optional): 여러 종목이면 종목 목록. Defaults to None.
+        max_points (int, optional): 곡선 하나당 최대 점 수. Defaults to 2000.
+    """
+    from matplotlib.ticker import FuncFormatter
+
+    thousands = FuncFormatter(lambda x, p: format(int(x), ","))
+    ax1, ax3 = fig.subplots(2, 1, height_ratios=[2, 1])
+    fig.subplots_adjust(hspace=0.3)
+    fig.suptitle(title, fontsize=12)
+
+    # 첫 번째 서브플롯 - 가격과 변동성
+    i = 0
+    if tickers is not None:
+        # 여러 종목은 시작 가격을 100 으로 맞춘 상대 가격으로 표시
+        for ticker_name in tickers:
+            df = chart.filter(pl.col("ticker") == ticker_name)
+            ax1.plot(
+                *downsample(
+                    df["Date"],
+                    df["close"] / df["close"].head(1).item() * 100,
+                    max_points,
+                ),
+                label=ticker_name,
+                color=PALETTE[i % len(PALETTE)],
+            )
+            i += 1
+        ax1.set_xlabel("날짜")
+        ax1.set_ylabel("상대 가격 (시작 = 100)")
+        ax1.legend(loc="upper left")
+    else:
+        for key, value in lines.items():
+            ax1.plot(
+                *downsample(chart["Date"], chart[key], max_points),
+                label=value,
+                color=PALETTE[i % len(PALETTE)],
+            )
+            i += 1
+
+        ax1.set_xlabel("날짜")
+        ax1.set_ylabel("가격 (KRW)")
+        ax1.tick_params(axis="y")
+        ax1.yaxis.set_major_formatter(thousands)
+
+        if "변동성" in chart.columns:
+            ax2 = ax1.twinx()
+            ax2.fill_between(
+                *downsample(chart["Date"], chart["변동성"], max_points),
+                alpha=0.1,
+                color="blue",
+                label="변동성",
+            )
+            ax2.set_ylabel("변동성 (%)")
+            ax2.tick_params(axis="y")
+            lines1, labels1 = ax1.get_legend_handles_labels()
+            lines2, labels2 = ax2.get_legend_handles_labels()
+            ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper left")
+        else:
+            ax1.legend(loc="upper left")
+
+    # 두 번째 서브플롯 - 평가금(지표와 같은 청산 가치)
+    ax3.plot(
+        *downsample(
+            evaluation["Date"],
+            evaluation.select(liquidation_value(evaluation)).to_series(),
+            max_points,
+        ),
+        label="평가금",
+        color=PALETTE[i % len(PALETTE)],
+    )
+    ax3.set_xlabel("날짜")
+    ax3.set_ylabel("평가금 (KRW)")
+    ax3.tick_params(axis="y")
+    ax3.yaxis.set_major_formatter(thousands)
+    ax3.legend(loc="upper left")
+    return fig
+
+
+def write_report(
+    path: str,
+    chart: pl.DataFrame,
+    evaluation: pl.DataFrame,
+    lines: Dict[str, str],
+    title: str,
+    metrics: Dict[str, float],
+    tickers: Optional[Sequence[str]] = None,
+    formats: Sequence[str] = FORMATS,
+    max_points: int = MAX_POINTS,
+    dpi: int = 100,
+) -> List[str]:
+    """결과 차트를 PNG, 지표 표와 차트를 담은 HTML 로 저장합니다.
+
+    pyplot 전역 상태를 쓰지 않고 Agg 캔버스에 직접 그리므로 화면이 없는 서버나 여러 스레드에서도
+    안전하며, 곡선은 LTTB 로 `max_points`개까지 줄여서 그립니다.
+
+    Args:
+        path (str): 저장 경로(확장자가 png/html 이면 해당 형식만 저장)
+        chart (pl.DataFrame): 지표가 계산된 차트 데이터
+        evaluation (pl.DataFrame): 평가금 기록
+        lines (Dict[str, str]): 상단에 그릴 {컬럼: 범례}
+        title (str): 제목
+        metrics (Dict[str, float]): 성과 지표(`compute_metrics`)
+        tickers (Optional[Sequence[str]], optional): 여러 종목이면 종목 목록. Defaults to None.
+        formats (Sequence[str], optional): 저장 형식. Defaults to ("png", "html").
+        max_points (int, optional): 곡선 하나당 최대 점 수. Defaults to 2000.
+        dpi (int, optional): PNG 해상도. Defaults to 100.
+
+    Returns:
+        List[str]: 저장한 파일 경로
+    """
+    import koreanize_matplotlib  # noqa: F401
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    stem, ext = os.path.splitext(path)
+    if ext.lstrip(".") in FORMATS:
+        formats = [ext.lstrip(".")]
+    else:
+        stem = path
+    os.makedirs(os.path.dirname(stem) or ".", exist_ok=True)
+
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    draw(fig, chart, evaluation, lines, title, tickers, max_points)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi)
+    png = buffer.getvalue()
+
+    paths = []
+    if "png" in formats:
+        with open(f"{stem}.png", "wb") as f:
+            f.write(png)
+        paths.append(f"{stem}.png")
+    if "html" in formats:
+        with open(f"{stem}.html", "w", encoding="utf-8") as f:
+            f.write(_html(title, metrics, png))
+        paths.append(f"{stem}.html")
+    return paths
+
+
+def _html(title: str, metrics: Dict[str, float], png: bytes) -> str:
+    rows = "\n".join(
+        f"<tr><th>{html.escape(str(key))}</th><td>{value:,.4f}</td></tr>"
+        if isinstance(value, float)
+        else f"<tr><th>{html.escape(str(key))}</th><td>{value}</td></tr>"
+        for key, value in metrics.items()
+    )
+    image = base64.b64encode(png).decode("ascii")
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>
+body {{ font-family: sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 12px; text-align: right; }}
+th {{ background: #f5f5f5; text-align: left; }}
+img {{ max-width: 100%; }}
+</style>
+</head>
+<body>
+<h2>{html.escape(title)}</h2>
+<table>
+{rows}
+</table>
+<img src="data:image/png;base64,{image}" alt="backtest result">
+</body>
+</html>
+"""
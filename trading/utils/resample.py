@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional
+
+import polars as pl
+
+from trading.utils.cache import OHLCVCache
+from trading.utils.validation import validate_interval
+
+# TimescaleDB time_bucket 의 기본 기준 시각(월/년 단위가 아닌 버킷, 2000-01-03 월요일)
+BUCKET_ORIGIN = datetime(2000, 1, 3)
+DAY = timedelta(days=1)
+
+
+def to_timedelta(interval: str) -> timedelta:
+    """데이터 주기를 버킷 길이로 변환
+
+    `search_db_data`의 `time_bucket` 규칙과 같게, 2~59분이 아닌 분 단위와 1~6일이 아닌
+    일 단위는 1일로 처리합니다. 길이가 0 이하인 주기는 ValueError 를 발생시킵니다.
+
+    Example:
+        >>> to_timedelta("5min")
+        datetime.timedelta(seconds=300)
+        >>> to_timedelta("4hour")
+        datetime.timedelta(seconds=14400)
+    """
+    validate_interval(interval)
+    if interval == "1min":
+        return timedelta(minutes=1)
+    unit = next(unit for unit in ("min", "hour", "day") if interval.endswith(unit))
+    count = int(interval[: -len(unit)])
+    if count <= 0:
+        raise ValueError(f"주기는 0보다 커야 합니다: {interval}")
+    if unit == "min":
+        return timedelta(minutes=count) if 2 <= count <= 59 else DAY
+    if unit == "hour":
+        return timedelta(hours=count)
+    return timedelta(days=count) if 1 <= count <= 6 else DAY
+
+
+def is_day_aligned(interval: str) -> bool:
+    """버킷이 하루 경계를 넘지 않는지(하루 길이의 약수인지) 여부
+
+    날짜 구간별로 나눠 집계해도 전체를 한 번에 집계한 결과와 같으므로, 이 주기는
+    날짜 구간 단위로 캐시하고 이어 붙일 수 있습니다.
+    """
+    return DAY % to_timedelta(interval) == timedelta(0)
+
+
+def _ohlcv_aggs(schema: pl.Schema) -> List[pl.Expr]:
+    aggs = [
+        pl.col("open").first(),
+        pl.col("high").max(),
+        pl.col("low").min(),
+        pl.col("close").last(),
+        pl.col("volume").sum(),
+    ]
+    if "value" in schema:
+        aggs.append(pl.col("value").sum())
+    return aggs
+
+
+def resample(df: pl.DataFrame, interval: str) -> pl.DataFrame:
+    """분봉을 더 긴 주기의 OHLCV 로 집계
+
+    `group_by_dynamic`으로 시각 순서대로 한 번에 집계하며, 버킷 경계와 라벨(버킷 시작 시각)은
+    TimescaleDB `time_bucket`과 같습니다. 거래가 없는 버킷은 만들지 않습니다.
+
+    Args:
+        df (pl.DataFrame): `Date`, `open`, `high`, `low`, `close`, `volume`(, `value`) 컬럼의 차트
+        interval (str): 집계 주기(`5min`, `1hour`, `1day` 등)
+
+    Returns:
+        pl.DataFrame: 집계된 차트
+
+    Example:
+        >>> hourly = resample(minutes, "1hour")
+    """
+    every = to_timedelta(interval)
+    if interval == "1min" or len(df) == 0:
+        return df
+    # polars 는 1970-01-01 기준으로 창을 나누므로 time_bucket 기준 시각과의 차이만큼 이동
+    offset = (BUCKET_ORIGIN - datetime(1970, 1, 1)) % every
+    return (
+        df.lazy()
+        .sort("Date")
+        .group_by_dynamic(
+            "Date",
+            every=every,
+            offset=offset,
+            closed="left",
+            label="left",
+            start_by="window",
+        )
+        .agg(_ohlcv_aggs(df.schema))
+        .collect()
+    )
+
+
+def load_resampled(
+    cache: OHLCVCache,
+    ticker_name: str,
+    interval: str,
+    start_date: str,
+    end_date: str,
+    fetch: Callable[[str, str], pl.DataFrame],
+    stat: Optional[Callable[[str, str], Any]] = None,
+) -> pl.DataFrame:
+    """캐시된 분봉에서 상위 주기 차트를 만들고, 주기별로 따로 캐시합니다.
+
+    분봉은 `(종목, "1min")`, 집계 결과는 `(종목, interval)` 항목으로 `OHLCVCache`에 저장되며,
+    요청 범위가 늘어나면 두 항목 모두 부족한 날짜만 조회/집계해서 이어 붙입니다.
+    버킷이 하루 경계를 넘는 주기는 날짜 구간별로 나눠 집계할 수 없으므로 캐시된 분봉 전체를
+    한 번에 집계하고, 집계 결과는 캐시하지 않습니다.
+
+    Args:
+        cache (OHLCVCache): 로컬 캐시
+        ticker_name (str): 종목명
+        interval (str): 집계 주기
+        start_date (str): 시작일자 (YYYY-MM-DD)
+        end_date (str): 종료일자 (YYYY-MM-DD)
+        fetch (Callable[[str, str], pl.DataFrame]): (시작일자, 종료일자)의 분봉을 DB 에서 조회하는 함수
+        stat (Optional[Callable[[str, str], Any]], optional): (시작일자, 종료일자)의 분봉 요약값을 조회하는 함수(`OHLCVCache.load`). 집계 결과도 분봉 요약값으로 검증합니다. Defaults to None.
+
+    Returns:
+        pl.DataFrame: 시작일자 ~ 종료일자(포함) 집계 차트
+    """
+
+    def minutes(sd: str, ed: str) -> pl.DataFrame:
+        return cache.load(ticker_name, "1min", sd, ed, fetch, stat)
+
+    if interval == "1min":
+        return minutes(start_date, end_date)
+    if not is_day_aligned(interval):
+        return resample(minutes(start_date, end_date), interval)
+    return cache.load(
+        ticker_name,
+        interval,
+        start_date,
+        end_date,
+        lambda sd, ed: resample(minutes(sd, ed), interval),
+        stat,
+    )
@@ -0,0 +1,270 @@
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import polars as pl
+
+from trading.strategy.registry import EXCLUDED_FILES, STRATEGY_DIR
+
+DEFAULT_PATH = "runs.db"
+# 코드가 바뀌면 같은 설정이라도 결과가 달라질 수 있는 trading 패키지(체결, 계좌, 주문장, 지표 계산 등)
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    strategy TEXT NOT NULL,
+    config TEXT NOT NULL,
+    ticker_name TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    market_info TEXT NOT NULL,
+    initial_margin REAL NOT NULL,
+    metrics TEXT NOT NULL,
+    files TEXT NOT NULL DEFAULT '[]',
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs (strategy, ticker_name, interval);
+CREATE INDEX IF NOT EXISTS idx_runs_range ON runs (ticker_name, start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_runs_fingerprint ON runs (fingerprint);
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+"""
+
+# JSON 으로 저장하는 컬럼
+JSON_COLUMNS = ("config", "market_info", "metrics", "files")
+
+
+def _dumps(value: Any, sort_keys: bool = False) -> str:
+    return json.dumps(value, sort_keys=sort_keys, default=str, ensure_ascii=False)
+
+
+def _source_hash(strategy: Type[Any]) -> str:
+    # 전략 코드가 바뀌면 같은 설정이라도 다른 실행으로 봄
+    try:
+        source = inspect.getsource(inspect.getmodule(strategy))
+    except (OSError, TypeError):
+        source = strategy.__qualname__
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _package_hash(package_dir: str, strategy_dir: str) -> str:
+    # import 하지 않고 패키지의 .py 파일 경로와 내용만 읽음
+    # (전략 파일은 전략마다 `_source_hash`로 따로 해시하므로 제외)
+    digest = hashlib.blake2b(digest_size=8)
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        is_strategy_dir = os.path.samefile(root, strategy_dir)
+        for file_name in sorted(files):
+            if not file_name.endswith(".py"):
+                continue
+            if is_strategy_dir and file_name not in EXCLUDED_FILES:
+                continue
+            path = os.path.join(root, file_name)
+            digest.update(os.path.relpath(path, package_dir).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _engine_hash() -> str:
+    return _package_hash(PACKAGE_DIR, STRATEGY_DIR)
+
+
+def run_key(
+    strategy: Type[Any],
+    config: Dict[str, Any],
+    ticker_name: str,
+    interval: str,
+    start: str,
+    end: str,
+    chart_data: pl.DataFrame,
+    market_info: Dict[str, float],
+    initial_margin: float,
+) -> Tuple[str, Dict[str, Any]]:
+    """실행 키와 메타데이터
+
+    전략(이름과 코드), 설정, 종목, 주기, 기간, 데이터 지문, 시장 정보, 초기 투자금이 모두 같으면
+    같은 키가 나오므로 이미 저장된 결과를 재사용할 수 있습니다. 데이터 지문은 지표 캐시와 같은
+    방식(`IndicatorCache.fingerprint`)으로 계산하므로 DB 데이터가 바뀌면 키도 바뀝니다.
+    전략을 제외한 trading 패키지(엔진, 브로커, 계좌, 포지션, 주문장, 지표 등) 코드가 바뀌어도 키가 바뀝니다.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: (키, `RunStore.put`에 넘길 메타데이터)
+    """
+    from trading.indicators.cache import indicator_cache
+
+    metadata = {
+        "strategy": strategy.__name__,
+        "config": config,
+        "ticker_name": ticker_name,
+        "interval": interval,
+        "start_date": str(start),
+        "end_date": str(end),
+        "fingerprint": indicator_cache.fingerprint(chart_data),
+        "market_info": market_info,
+        "initial_margin": float(initial_margin),
+    }
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_dumps(metadata, sort_keys=True).encode("utf-8"))
+    digest.update(_source_hash(strategy).encode("utf-8"))
+    digest.update(_engine_hash().encode("utf-8"))
+    return digest.hexdigest(), metadata
+
+
+class RunStore:
+    """백테스트 결과 저장소(SQLite)
+
+    실행 메타데이터(전략, 설정, 종목, 주기, 기간, 데이터 지문)와 지표는 인덱스가 있는 `runs` 테이블에,
+    평가금 곡선과 체결 내역은 Parquet blob 으로 `artifacts` 테이블에 저장합니다. 목록 조회는
+    blob 을 읽지 않습니다. `target.db`처럼 작업마다 연결을 열고 닫으므로 여러 프로세스에서 함께 써도 됩니다.
+
+    Example:
+        >>> store = RunStore()
+        >>> key, metadata = run_key(TestStrategy, config, "KRW-BTC", "1day", sd, ed, df, market_info, 1000000.0)
+        >>> run = store.get(key)
+        >>> if run is None:
+        ...     engine.run(ticker_name="KRW-BTC")
+        ...     store.put(key, metadata, engine.summary(), {"equity": engine.evaluation})
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """저장소 초기화
+
+        Args:
+            path (str, optional): SQLite 파일 경로. Defaults to "runs.db".
+        """
+        self.__path = path
+        with self.__connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.__path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def __row(row: sqlite3.Row) -> Dict[str, Any]:
+        run = dict(row)
+        for column in JSON_COLUMNS:
+            run[column] = json.loads(run[column])
+        return run
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """키로 저장된 실행 조회(없으면 None)"""
+        with self.__connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE key = ?", (key,)).fetchone()
+        return None if row is None else self.__row(row)
+
+    def put(
+        self,
+        key: str,
+        metadata: Dict[str, Any],
+        metrics: Dict[str, Any],
+        frames: Optional[Dict[str, pl.DataFrame]] = None,
+        files: Optional[List[str]] = None,
+    ) -> int:
+        """실행 결과 저장(같은 키가 있으면 덮어씀)
+
+        Args:
+            key (str): 실행 키(`run_key`)
+            metadata (Dict[str, Any]): 실행 메타데이터(`run_key`)
+            metrics (Dict[str, Any]): 지표(`Engine.summary`)
+            frames (Optional[Dict[str, pl.DataFrame]], optional): Parquet 으로 저장할 {이름: 프레임}. Defaults to None.
+            files (Optional[List[str]], optional): 리포트 파일 경로. Defaults to None.
+
+        Returns:
+            int: 실행 id
+        """
+        row = {
+            **metadata,
+            "key": key,
+            "metrics": metrics,
+            "files": files or [],
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        for column in JSON_COLUMNS:
+            row[column] = _dumps(row[column])
+        blobs = []
+        for name, frame in (frames or {}).items():
+            buffer = io.BytesIO()
+            frame.write_parquet(buffer)
+            blobs.append((name, buffer.getvalue()))
+
+        columns = ", ".join(row)
+        placeholders = ", ".join(f":{column}" for column in row)
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM runs WHERE key = ?", (key,))
+            run_id = conn.execute(
+                f"INSERT INTO runs ({columns}) VALUES ({placeholders})", row
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO artifacts (run_id, name, data) VALUES (?, ?, ?)",
+                [(run_id, name, data) for name, data in blobs],
+            )
+        return run_id
+
+    def frame(self, run_id: int, name: str) -> Optional[pl.DataFrame]:
+        """저장된 프레임(평가금 곡선 등) 읽기"""
+        with self.__connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM artifacts WHERE run_id = ? AND name = ?",
+                (run_id, name),
+            ).fetchone()
+        return None if row is None else pl.read_parquet(io.BytesIO(row["data"]))
+
+    def find(
+        self,
+        strategy: Optional[str] = None,
+        ticker_name: Optional[str] = None,
+        interval: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """조건에 맞는 실행 목록(최근 순, blob 제외)"""
+        conditions, params = [], []
+        for column, value in (
+            ("strategy", strategy),
+            ("ticker_name", ticker_name),
+            ("interval", interval),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        query = "SELECT * FROM runs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self.__connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self.__row(row) for row in rows]
+
+    def delete(self, key: str) -> bool:
+        """실행 삭제(저장된 프레임 포함)"""
+        with self.__connect() as conn:
+            deleted = conn.execute("DELETE FROM runs WHERE key = ?", (key,)).rowcount
+        return deleted > 0
@@ -1,8 +1,11 @@
 import re
+from typing import List, Sequence, Union
 
 min_pattern = r"^\d{1,2}min$"  # 1-99min 형식
 hour_pattern = r"^\d{1,2}hour$"  # 1-99hour 형식
 day_pattern = r"^\d{1,2}day$"  # 1-99day 형식
+range_pattern = r"^\d+:\d+(:[1-9]\d*)?$"  # start:stop[:step] 형식
+list_pattern = r"^\d+(,\d+)*$"  # a,b,c 형식
 
 
 def validate_interval(interval: str):
@@ -15,3 +18,26 @@ def validate_interval(interval: str):
         ]
     ):
         raise ValueError(f"잘못된 시간 간격 형식입니다: {interval}")
+
+
+def parse_range(value: Union[int, str, Sequence[int]]) -> List[int]:
+    """파라미터 범위를 정수 목록으로 변환
+
+    Example:
+        >>> parse_range("3:6")
+        [3, 4, 5, 6]
+        >>> parse_range("10:30:10")
+        [10, 20, 30]
+        >>> parse_range(5)
+        [5]
+    """
+    if isinstance(value, int):
+        return [value]
+    if isinstance(value, str):
+        if re.match(range_pattern, value):
+            start, stop, *step = map(int, value.split(":"))
+            return list(range(start, stop + 1, step[0] if step else 1))
+        if re.match(list_pattern, value):
+            return [int(v) for v in value.split(",")]
+        raise ValueError(f"잘못된 범위 형식입니다: {value}")
+    return [int(v) for v in value]
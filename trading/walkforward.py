@@ -0,0 +1,254 @@
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Type
+
+import polars as pl
+from tqdm import tqdm
+
+from trading.engine import Engine
+from trading.strategy import Strategy
+from trading.sweep import expand_grid
+
+# 워커 프로세스마다 한 번만 memory map 으로 열어두는 차트 데이터
+_chart_data: Optional[pl.DataFrame] = None
+
+# 낮을수록 좋은 지표
+MINIMIZE = frozenset({"mdd"})
+
+
+def _offset(value: datetime, by: str) -> datetime:
+    return pl.Series([value]).dt.offset_by(by).item()
+
+
+def make_folds(
+    dates: pl.Series,
+    train: str,
+    test: str,
+    step: Optional[str] = None,
+    anchored: bool = False,
+) -> List[Dict[str, Any]]:
+    """날짜 구간을 in-sample/out-of-sample 창으로 나눕니다.
+
+    창 길이는 polars 기간 문자열("180d", "6mo", "1y" 등)이며, 각 fold 의 in-sample 은
+    [train_start, test_start), out-of-sample 은 [test_start, test_end) 입니다.
+    마지막 fold 의 out-of-sample 은 데이터 끝에서 잘릴 수 있습니다. out-of-sample 창이 겹치면
+    이어 붙인 평가금에 같은 bar 가 두 번 들어가므로 `step`은 `test`보다 짧을 수 없습니다.
+
+    Args:
+        dates (pl.Series): 오름차순 Date 컬럼
+        train (str): in-sample 길이
+        test (str): out-of-sample 길이
+        step (Optional[str], optional): 다음 fold 까지 이동 간격(test 이상). Defaults to test.
+        anchored (bool, optional): True 면 in-sample 시작을 처음에 고정(확장 창). Defaults to False.
+
+    Raises:
+        ValueError: `step`이 `test`보다 짧은 경우
+
+    Returns:
+        List[Dict[str, Any]]: fold 별 날짜와 행 번호(start, split, end)
+
+    Example:
+        >>> make_folds(df["Date"], train="180d", test="30d")
+    """
+    if len(dates) == 0:
+        return []
+    step = step or test
+    first, last = dates[0], dates[-1]
+    if _offset(first, step) < _offset(first, test):
+        raise ValueError(
+            f"이동 간격({step})이 out-of-sample 길이({test})보다 짧으면 out-of-sample 구간이 겹칩니다."
+        )
+    folds = []
+    cursor = first
+    while True:
+        test_start = _offset(cursor, train)
+        if test_start > last:
+            break
+        start = 0 if anchored else dates.search_sorted(cursor, side="left")
+        split = dates.search_sorted(test_start, side="left")
+        end = dates.search_sorted(_offset(test_start, test), side="left")
+        if split > start and end > split:
+            folds.append(
+                {
+                    "fold": len(folds),
+                    "train_start": dates[start],
+                    "test_start": dates[split],
+                    "test_end": dates[end - 1],
+                    "start": start,
+                    "split": split,
+                    "end": end,
+                }
+            )
+        cursor = _offset(cursor, step)
+    return folds
+
+
+def _init_worker(path: str):
+    global _chart_data
+    _chart_data = pl.read_ipc(path, memory_map=True)
+
+
+def _backtest(
+    strategy: Type[Strategy],
+    config: Dict[str, Any],
+    market_info: Dict[Literal["slippage", "fee"], float],
+    initial_margin: float,
+    ticker_name: str,
+    start: int,
+    end: int,
+    warmup: int = 0,
+) -> Engine:
+    engine = Engine(
+        strategy=strategy,
+        chart_data=_chart_data.slice(start, end - start),
+        strategy_config=config,
+        market_info=market_info,
+        initial_margin=initial_margin,
+        warmup=warmup,
+    )
+    engine.run_vectorized(ticker_name=ticker_name)
+    return engine
+
+
+def _run_fold(
+    task: Tuple[
+        Type[Strategy],
+        List[Dict[str, Any]],
+        Dict[Literal["slippage", "fee"], float],
+        float,
+        str,
+        str,
+        Dict[str, Any],
+    ],
+) -> Tuple[Dict[str, Any], pl.DataFrame]:
+    strategy, configs, market_info, initial_margin, ticker_name, metric, fold = task
+    start, split, end = fold["start"], fold["split"], fold["end"]
+
+    # in-sample 최적화(`summary`는 청산 가치 기준 지표)
+    best_config, best_score = None, None
+    for config in configs:
+        score = _backtest(
+            strategy, config, market_info, initial_margin, ticker_name, start, split
+        ).summary()[metric]
+        if best_score is None or (
+            score < best_score if metric in MINIMIZE else score > best_score
+        ):
+            best_config, best_score = config, score
+
+    # out-of-sample 평가(in-sample 구간은 지표 계산에만 사용)
+    engine = _backtest(
+        strategy,
+        best_config,
+        market_info,
+        initial_margin,
+        ticker_name,
+        start,
+        end,
+        warmup=split - start,
+    )
+    row = {
+        "fold": fold["fold"],
+        "train_start": fold["train_start"],
+        "test_start": fold["test_start"],
+        "test_end": fold["test_end"],
+        **best_config,
+        f"is_{metric}": best_score,
+        **{f"oos_{key}": value for key, value in engine.summary().items()},
+    }
+    evaluation = engine.evaluation.select(
+        "Date", pl.lit(fold["fold"]).alias("fold"), "총 매수", "총 평가"
+    )
+    return row, evaluation
+
+
+def walk_forward(
+    strategy: Type[Strategy],
+    chart_data: pl.DataFrame,
+    param_grid: Dict[str, Iterable[Any]],
+    market_info: Dict[Literal["slippage", "fee"], float],
+    initial_margin: float,
+    train: str,
+    test: str,
+    step: Optional[str] = None,
+    anchored: bool = False,
+    metric: str = "return",
+    ticker_name: str = "KRW-AVAX",
+    max_workers: Optional[int] = None,
+    where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    is_progress: bool = False,
+) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    """walk-forward 검증
+
+    `make_folds`로 나눈 fold 마다 in-sample 구간에서 `param_grid` 중 `metric`이 가장 좋은 설정을
+    고르고, 그 설정으로 바로 뒤 out-of-sample 구간을 백테스트합니다. fold 는 서로 독립이므로
+    프로세스 풀에서 나눠 실행하며, 차트 데이터는 `sweep`과 같이 Arrow IPC 파일 하나를 워커마다
+    memory map 으로 열어 읽기 전용으로 공유합니다.
+
+    out-of-sample 평가금은 fold 마다 초기 투자금으로 시작하므로, 앞 fold 마지막 bar 의 청산 가치
+    (현금 + 보유 종목 평가액 = 총 평가 - 총 매수) 비율만큼 키워서 하나의 곡선으로 이어 붙입니다.
+
+    Args:
+        strategy (Type[Strategy]): 전략 클래스
+        chart_data (pl.DataFrame): 차트 데이터(Date 오름차순)
+        param_grid (Dict[str, Iterable[Any]]): 파라미터별 후보 값
+        market_info (Dict[Literal["slippage", "fee"], float]): 슬리피지와 거래수수료 파라미터
+        initial_margin (float): 초기 투자금
+        train (str): in-sample 길이(polars 기간 문자열, 예: "180d")
+        test (str): out-of-sample 길이(예: "30d")
+        step (Optional[str], optional): 다음 fold 까지 이동 간격(test 이상). Defaults to test.
+        anchored (bool, optional): in-sample 시작 고정 여부. Defaults to False.
+        metric (str, optional): 최적화 지표(`Engine.summary` 키, 청산 가치 기준이며 mdd 는 낮을수록 좋음). Defaults to "return".
+        ticker_name (str, optional): 종목명. Defaults to "KRW-AVAX".
+        max_workers (Optional[int], optional): 프로세스 수. Defaults to CPU 코어 수.
+        where (Optional[Callable[[Dict[str, Any]], bool]], optional): 실행할 조합 필터. Defaults to None.
+        is_progress (bool, optional): 진행률 표시 여부. Defaults to False.
+
+    Returns:
+        Tuple[pl.DataFrame, pl.DataFrame]: fold 별 기간/선택 파라미터/지표(is_*, oos_*)와
+            이어 붙인 out-of-sample 평가금(Date, fold, 총 매수, 총 평가)
+    """
+    configs = expand_grid(param_grid)
+    if where is not None:
+        configs = [config for config in configs if where(config)]
+    folds = make_folds(chart_data["Date"], train, test, step=step, anchored=anchored)
+    if not configs or not folds:
+        return pl.DataFrame(), pl.DataFrame()
+    tasks = [
+        (strategy, configs, market_info, initial_margin, ticker_name, metric, fold)
+        for fold in folds
+    ]
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+
+    with tempfile.TemporaryDirectory(prefix="walkforward-") as tmp_dir:
+        path = os.path.join(tmp_dir, "chart.arrow")
+        chart_data.write_ipc(path, compression="uncompressed")
+        # polars 는 fork 된 프로세스에서 교착될 수 있으므로 spawn 사용
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(path,),
+        ) as executor:
+            results = executor.map(_run_fold, tasks)
+            if is_progress:
+                results = tqdm(results, total=len(tasks), desc="walk-forward 진행률")
+            results = list(results)
+
+    rows = [row for row, _ in results]
+    # fold 순서대로 앞 fold 청산 가치 비율을 곱해 이어 붙임
+    curves = []
+    scale = 1.0
+    for _, evaluation in results:
+        if len(evaluation) == 0:
+            continue
+        curves.append(
+            evaluation.with_columns(
+                pl.col("총 매수") * scale, pl.col("총 평가") * scale
+            )
+        )
+        last = evaluation.row(-1, named=True)
+        scale *= (last["총 평가"] - last["총 매수"]) / initial_margin
+    return pl.DataFrame(rows), pl.concat(curves) if curves else pl.DataFrame()